@@ -0,0 +1,117 @@
+# app/network/send_queue.py
+
+"""
+웹소켓 연결별 전송 큐
+
+    - 연결마다 길이 제한(SEND_QUEUE_LIMIT)이 있는 큐와 그 큐를 비우는 writer 태스크를 둔다.
+    - outgoing_ws 리더는 push()로 넣기만 하고 소켓 전송을 기다리지 않는다. 느린 클라이언트가 다른 연결을 막지 않는다.
+    - 큐가 가득 찬 연결은 느린 소비자로 보고 끊는다. 재접속하면 현재 상태 전체를 다시 받는다.
+"""
+
+import asyncio
+import os
+
+SEND_QUEUE_LIMIT = int(os.getenv("WS_SEND_QUEUE_LIMIT", 256))
+SLOW_CLOSE_CODE = 1013  # Try Again Later
+ERROR_CLOSE_CODE = 1011  # Internal Error - 전송 실패
+REPLACED_CLOSE_CODE = 4000  # 같은 uid로 새 연결이 들어옴
+
+_background = set()  # 소켓 닫기 태스크 참조 유지
+
+
+class SendMetrics:
+    """
+    전송 지표. summary()가 현재 큐 길이 분포와 구간 누적값(전송/버림/느린 연결 끊김/최대 큐 길이)을 돌려주고 누적값을 비운다.
+    """
+    def __init__(self):
+        self.sent = 0
+        self.drops = 0  # 큐가 넘치거나 닫힌 연결로 가서 버린 메시지
+        self.slow = 0   # 큐가 넘쳐 끊은 연결
+        self.peak = 0   # 구간 최대 큐 길이
+
+    def summary(self, queues) -> str:
+        depths = sorted(len(q) for q in queues)
+        depth = "연결 0개"
+        if depths:
+            depth = f"연결 {len(depths)}개, 큐 p99 {depths[min(len(depths) - 1, int(len(depths) * 0.99))]} max {depths[-1]}"
+        text = f"{depth}, 구간 최대 {self.peak}, 전송 {self.sent}건, 버림 {self.drops}건, 느린 연결 끊음 {self.slow}개"
+        self.sent = self.drops = self.slow = self.peak = 0
+        return text
+
+
+metrics = SendMetrics()
+
+
+class SendQueue:
+    def __init__(self, ws, uid: str, limit: int = SEND_QUEUE_LIMIT):
+        self.ws = ws
+        self.uid = uid
+        self.queue = asyncio.Queue(limit)
+        self.closed = False
+        self.task = asyncio.create_task(self._write())
+
+    def __len__(self):
+        return self.queue.qsize()
+
+    def push(self, data) -> bool:
+        """
+        보낼 메시지를 큐에 넣는다 (기다리지 않음). 넣지 못했으면 False.
+        """
+        if self.closed:
+            metrics.drops += 1
+            return False
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            metrics.drops += 1
+            metrics.slow += 1
+            print(f"[ws_out] 🐢 uid(...{self.uid[-5:]}) 전송 큐 가득 참 ({self.queue.maxsize}) → 연결 끊음")
+            self.close(SLOW_CLOSE_CODE)
+            return False
+        metrics.peak = max(metrics.peak, self.queue.qsize())
+        return True
+
+    async def _write(self):
+        try:
+            while True:
+                data = await self.queue.get()
+                if isinstance(data, bytes):
+                    await self.ws.send_bytes(data)  # format=msgpack 연결
+                else:
+                    await self.ws.send_text(data)
+                self.queue.task_done()
+                metrics.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"[ws_out] uid(...{self.uid[-5:]}) 전송 실패: {e}")
+            self.close(ERROR_CLOSE_CODE)  # 소켓까지 닫아야 수신 루프가 끝나고 연결이 정리된다
+
+    async def drain(self, timeout: float = 1.0):
+        # 닫기 전에 큐에 남은 메시지(마지막 오류 등)를 보낼 시간을 준다
+        if self.closed:
+            return
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def close(self, code: int = None):
+        """
+        writer를 멈춘다. code가 있으면 소켓도 닫는다 (수신 루프가 끝나면서 연결 정리가 이어진다).
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.task is not asyncio.current_task():
+            self.task.cancel()
+        if code is not None:
+            task = asyncio.create_task(self._close_socket(code))
+            _background.add(task)
+            task.add_done_callback(_background.discard)
+
+    async def _close_socket(self, code: int):
+        try:
+            await self.ws.close(code=code)
+        except Exception:
+            pass
@@ -7,19 +7,32 @@ from jose import jwt
 import json
 import pickle
 import os
+import socket
 from time import time
 
 from redis.asyncio import Redis
 from app.services.game_manager import GameManager
 from app.network.nocache import NoCacheMiddleware
+from servers.routing import router, step_queue
+from servers.transport import send
+from servers.outbound import FALLBACK_CHANNEL, node_channel, register_connection, unregister_connection, members
+from app.services.messaging import expand_outgoing
+from app.network.send_queue import SendQueue, REPLACED_CLOSE_CODE, metrics
+from app.protocol.state_delta import StateDelta
+from app.protocol import wire
 
 # ======================= 설정 ============================
 SECRET_KEY = os.getenv("SECRET_KEY", "super-secret-key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
+NODE_ID = os.getenv("WS_NODE_ID") or f"{socket.gethostname()}-{os.getpid()}"  # 이 프로세스의 outgoing_ws:{node} 채널
+METRICS_INTERVAL = 10.0
 
 r = Redis(decode_responses=True)
+r_bin = Redis(decode_responses=False)  # outgoing_ws 구독용 (JSON과 MessagePack이 섞여 온다)
 
-ws_registry: dict[str, WebSocket] = {}
+ws_registry: dict[str, SendQueue] = {}  # uid → 연결 (소켓 + 전송 큐)
+delta_registry: dict[SendQueue, StateDelta] = {}  # delta=1로 붙은 연결 → 델타 기준
+binary_registry: set[SendQueue] = set()  # format=msgpack으로 붙은 연결
 
 # ======================= JWT ============================
 def verify_jwt(token: str) -> str:
@@ -28,43 +41,57 @@ def verify_jwt(token: str) -> str:
 
 # ======================= PubSub =========================
 async def subscribe_outgoing_ws():
-    pubsub = r.pubsub()
-    await pubsub.subscribe("outgoing_ws")
-    print(f"[ws out] listening")
+    # 이 노드에 붙은 플레이어 몫(outgoing_ws:{node}) + 워커가 노드를 모를 때 쓰는 공용 채널
+    pubsub = r_bin.pubsub()
+    await pubsub.subscribe(node_channel(NODE_ID), FALLBACK_CHANNEL)
+    print(f"[ws out] listening (node={NODE_ID})")
 
     try:
-        while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.01)
-            if message is None:
-                await asyncio.sleep(0.01)
+        # 메시지가 올 때까지 기다렸다가 바로 처리 (폴링 없음). 소켓 전송은 연결별 큐에 넣기만 한다
+        async for message in pubsub.listen():
+            if message["type"] != "message":
                 continue
 
             try:
-                payload = json.loads(message["data"])
-                game_id = payload["game_id"]
-                player_id = payload["player_id"]
-                uid = await r.get(f"game:{game_id}:player:{player_id}:uid")
-                ws = ws_registry.get(uid)
-                if ws:
-                    uid_game_id = await r.get(f"user:{uid}:game")
-                    if uid_game_id != game_id:
-                        print(f"[ws_out] 🚫 {uid}는 현재 이 게임({game_id})에 소속되지 않음 → 메시지 스킵")
-                        continue
-                    tosend = json.dumps(payload)
-                    print(f"[ws_out] msg({message['type']}) sent to uid(...{uid[-5:]})")
-                    await ws.send_text(tosend)
-                else:
-                    print(f"[ws_out] WebSocket not found for uid: {uid}")
+                payload = wire.loads(message["data"])
+                # 테이블 상태 브로드캐스트는 여기서 플레이어별 메시지로 나눈다
+                for player_id, msg in expand_outgoing(payload):
+                    send_to_player(payload["game_id"], player_id, msg)
             except Exception as e:
                 print(f"[ws_out] outgoing_ws 전송 실패: {e}")
     except asyncio.CancelledError:
         print("[ws_out] task cancelled")
     finally:
-        await pubsub.unsubscribe("outgoing_ws")
+        await pubsub.unsubscribe(node_channel(NODE_ID), FALLBACK_CHANNEL)
         await pubsub.close()
         
 
 
+def send_to_player(game_id: str, player_id: str, payload: dict):
+    # player_id → uid, uid의 현재 게임은 구성원 캐시에서 (Redis 왕복 없음)
+    uid = members.uid_for(game_id, player_id)
+    conn = ws_registry.get(uid)
+    if conn is not None:
+        if members.games.get(uid) != game_id:
+            print(f"[ws_out] 🚫 {uid}는 현재 이 게임({game_id})에 소속되지 않음 → 메시지 스킵")
+            return
+        encoder = delta_registry.get(conn)
+        if encoder is not None and payload["type"] == "state_update":
+            payload = encoder.encode(payload)  # 직전에 보낸 상태에서 바뀐 필드만
+        if conn.push(encode_for(conn, payload)):
+            print(f"[ws_out] msg({payload['type']}) queued to uid(...{uid[-5:]})")
+    else:
+        print(f"[ws_out] WebSocket not found for uid: {uid}")
+        
+
+
+def encode_for(conn: SendQueue, payload: dict):
+    # 연결할 때 고른 형식으로 (기본 JSON 텍스트, format=msgpack이면 바이너리 프레임)
+    if conn in binary_registry:
+        return wire.encode(payload)
+    return json.dumps(payload)
+
+
 # ======================= FastAPI 설정 ===================
 app = FastAPI()
 app.add_middleware(
@@ -77,33 +104,58 @@ app.add_middleware(
 app.add_middleware(NoCacheMiddleware)
 
 ws_task = None
+metrics_task = None
+
+async def report_metrics():
+    while True:
+        await asyncio.sleep(METRICS_INTERVAL)
+        print(f"[ws_out] 📈{metrics.summary(list(ws_registry.values()))}")
 
 @app.on_event("startup")
 async def startup_event():
-    global ws_task
+    global ws_task, metrics_task
+    await router.start()  # 라우팅 테이블 로컬 사본 + 갱신 구독
+    await members.start()  # 게임 시작/종료 알림 구독 (구성원 캐시)
     ws_task = asyncio.create_task(subscribe_outgoing_ws())
+    metrics_task = asyncio.create_task(report_metrics())
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    global ws_task
+    global ws_task, metrics_task
     if ws_task:
         ws_task.cancel()
+    if metrics_task:
+        metrics_task.cancel()
+    await router.stop()
+    await members.stop()
 
 # ======================= WebSocket 엔드포인트 ===============
 @app.websocket("/quick_play_ws")
-async def websocket_endpoint(websocket: WebSocket, token: str):
+async def websocket_endpoint(websocket: WebSocket, token: str, delta: bool = False,
+                             wire_format: str = Query("json", alias="format")):
     uid = verify_jwt(token)
+    conn = None
     try:
         await websocket.accept()
-        ws_registry[uid] = websocket
-        print(f"[ws]✅ UID 등록됨: {uid}, 연결 상태: {ws_registry.get(uid)}")
-
-        # ✅ 연결 시 현재 게임 상태 전송
-        game_id = await r.get(f"user:{uid}:game")
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError(f"지원하지 않는 format: {wire_format} (json|msgpack)")
+        conn = SendQueue(websocket, uid)
+        if delta:
+            delta_registry[conn] = StateDelta()  # 첫 상태는 전체, 이후 state_delta
+        if wire_format == "msgpack":
+            binary_registry.add(conn)  # 서버 → 클라이언트만 바이너리, 클라이언트 → 서버는 JSON 그대로
+        old = ws_registry.get(uid)
+        ws_registry[uid] = conn
+        if old is not None:
+            old.close(REPLACED_CLOSE_CODE)  # 이전 연결은 소켓까지 닫는다 (수신 루프가 끝나며 정리됨)
+        await register_connection(r, uid, NODE_ID)  # 워커가 이 uid 메시지를 이 노드 채널로 보내도록
+        print(f"[ws]✅ UID 등록됨: {uid}, 연결 상태: {websocket}")
+
+        # ✅ 연결 시 현재 게임 상태 전송 (게임 구성원을 캐시에 올린다)
+        game_id, player_id = await members.attach(uid)
         if not game_id:
             raise ValueError("현재 참여 중인 게임이 없습니다. 잠시 후 재접속 시 해결될 수 있습니다.")
 
-        player_id = await r.hget(f"uid_to_player_id:{game_id}", uid)
         if not player_id:
             raise ValueError("player_id를 찾을 수 없습니다. 잠시 후 재접속 시 해결될 수 있습니다.")
 
@@ -116,6 +168,11 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
                 data = json.loads(raw)
                 print(f"[ws_endpoint] {data}")
 
+                if data.get("type") == "resync" and conn in delta_registry:
+                    # 클라이언트가 델타 기준을 놓침 → 기준을 버리고 전체 상태를 다시 보낸다
+                    delta_registry[conn].reset()
+                    await request_send_state(game_id, player_id)
+                    continue
                 if data.get("type") != "action":
                     continue
                 if "amount" not in data:
@@ -124,7 +181,8 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
                 await push_action(game_id, player_id, data["amount"], data.get("action_count"))
 
             except Exception as e:
-                await websocket.send_text(json.dumps({
+                # writer 태스크와 겹치지 않게 같은 큐로 보낸다
+                conn.push(encode_for(conn, {
                     "type": "error",
                     "message": str(e)
                 }))
@@ -132,11 +190,29 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
     except WebSocketDisconnect:
         print(f"[WebSocket] disconnected: {uid}")
     except Exception as e:
-        await websocket.send_json({"type" : "error", "errormsg" : str(e)})
         print(f"[WebSocket Error] {e}")
+        error = {"type" : "error", "errormsg" : str(e)}
+        try:
+            if conn is not None:
+                # 소켓에는 writer 태스크만 쓴다 (연결 형식에 맞춰 인코딩)
+                conn.push(encode_for(conn, error))
+                await conn.drain()
+            else:
+                await websocket.send_json(error)  # 전송 큐를 만들기 전 (format 검증 실패 등)
+        except Exception:
+            pass
     finally:
-        if uid and uid in ws_registry:
+        if conn is not None:
+            conn.close()
+            delta_registry.pop(conn, None)
+            binary_registry.discard(conn)
+        if uid and conn is not None and ws_registry.get(uid) is conn:  # 그 사이 새 소켓으로 다시 붙었으면 그대로 둔다
             del ws_registry[uid]
+            members.detach(uid)
+            try:
+                await unregister_connection(r, uid, NODE_ID)
+            except Exception as e:
+                print(f"[WebSocket] 노드 등록 해제 실패: {e}")
         try:
             await websocket.close()
         except:
@@ -144,25 +220,20 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
         
 
 async def request_send_state(game_id: str, player_id: str):
-    # 워커 인덱스 결정
-    import uuid
-    num_workers = int(os.getenv("NUM_WORKERS", 1))
-    worker_index = int(uuid.UUID(game_id)) % num_workers
-    step_queue = f"game_step_handler_queue_{worker_index}"
+    # 워커 인덱스 결정 (라우팅 테이블, 메모리 조회)
+    worker_index = router.worker_for(game_id)
        
     msg = {
         "type": "send_state_to_user",
         "game_id": game_id,
         "player_id": player_id
     }
-    await r.rpush(step_queue, json.dumps(msg))
+    await send(r, step_queue(worker_index), json.dumps(msg))
     
 
-async def push_action(game_id: str, player_id: str, amount: int, action_count: int):    # 워커 인덱스 결정
-    import uuid
-    num_workers = int(os.getenv("NUM_WORKERS", 1))
-    worker_index = int(uuid.UUID(game_id)) % num_workers
-    step_queue = f"game_step_handler_queue_{worker_index}"
+async def push_action(game_id: str, player_id: str, amount: int, action_count: int):
+    # 워커 인덱스 결정 (라우팅 테이블, 메모리 조회)
+    worker_index = router.worker_for(game_id)
        
     msg = {
         "type": "action",
@@ -172,4 +243,4 @@ async def push_action(game_id: str, player_id: str, amount: int, action_count: i
         "action_count": action_count,
         "received_at": time()
     }
-    await r.rpush(step_queue, json.dumps(msg))
\ No newline at end of file
+    await send(r, step_queue(worker_index), json.dumps(msg))
\ No newline at end of file
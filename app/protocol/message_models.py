@@ -32,6 +32,16 @@ class StateMessage(BaseModel):
     payload: StatePayload
 
 
+class StateBroadcastMessage(BaseModel):
+    # 테이블 전체에 보내는 상태 한 건 (워커 → 웹소켓 서버 내부용)
+    # 웹소켓 서버가 플레이어마다 player_id와 자기 홀카드만 채운 StateMessage로 나눠 보낸다
+    type: Literal["state_broadcast"]
+    game_id: str
+    player_id: str = "*"
+    state: StateMessage                          # 공개 상태 (모든 홀카드 "??")
+    holes: Dict[str, Optional[List[str]]]        # player_id → 자기 홀카드 (탈락했으면 None)
+
+
 class RoundResultPlayerInfo(BaseModel):
     pid: str
     chips: int
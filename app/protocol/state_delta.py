@@ -0,0 +1,69 @@
+# app/protocol/state_delta.py
+
+"""
+state_update 델타 인코딩 (연결할 때 delta=1을 준 클라이언트만)
+
+    {"type": "state_delta", "game_id", "player_id", "base": 기준 action_count, "action_count": 새 action_count,
+     "payload": 기준 상태에서 바뀐 필드만}
+
+    - payload 최상위 필드는 바뀐 것만 담는다 (board 같은 리스트는 통째로).
+    - players는 pid 순서가 같으면 {"자리 인덱스": {바뀐 필드만}}, 탈락 등으로 순서가 바뀌면 리스트 통째로.
+    - 기준은 그 연결에 마지막으로 보낸 상태다. 연결/재연결 뒤 첫 상태와 action_count가 늘지 않은 상태는 전체(state_update)로 보낸다.
+    - 클라이언트는 자기 action_count가 base와 같을 때만 적용한다. 다르면(빠진 메시지) {"type": "resync", "action_count": 자기 값}을
+      보내고, 서버는 기준을 버리고 전체 상태를 다시 보낸다.
+"""
+
+_SKIP = ("players", "action_count")
+
+
+def diff(prev: dict, cur: dict) -> dict:
+    changes = {k: v for k, v in cur.items() if k not in _SKIP and prev.get(k) != v}
+    prev_players, players = prev["players"], cur["players"]
+    if [p["pid"] for p in prev_players] != [p["pid"] for p in players]:
+        changes["players"] = players
+        return changes
+    seats = {}
+    for k, (old, new) in enumerate(zip(prev_players, players)):
+        if old == new:  # 보통 한두 자리만 바뀐다 - 통째 비교로 먼저 거른다
+            continue
+        seats[str(k)] = {f: v for f, v in new.items() if old.get(f) != v}
+    if seats:
+        changes["players"] = seats
+    return changes
+
+
+def apply(prev: dict, delta: dict) -> dict:
+    """
+    클라이언트 쪽 적용 (game.js의 applyDelta와 같은 규칙). prev는 바꾸지 않는다.
+    """
+    changes = delta["payload"]
+    cur = {**prev, **changes, "action_count": delta["action_count"]}
+    players = changes.get("players")
+    if isinstance(players, dict):
+        cur["players"] = [{**p, **players[str(k)]} if str(k) in players else p for k, p in enumerate(prev["players"])]
+    return cur
+
+
+class StateDelta:
+    """
+    연결 하나의 델타 기준 (마지막으로 보낸 state_update payload).
+    """
+    def __init__(self):
+        self.base = None
+
+    def reset(self):
+        self.base = None
+
+    def encode(self, msg: dict) -> dict:
+        payload = msg["payload"]
+        base, self.base = self.base, payload
+        if base is None or payload["action_count"] <= base["action_count"]:
+            return msg
+        return {
+            "type": "state_delta",
+            "game_id": msg["game_id"],
+            "player_id": msg["player_id"],
+            "base": base["action_count"],
+            "action_count": payload["action_count"],
+            "payload": diff(base, payload),
+        }
@@ -0,0 +1,92 @@
+# app/protocol/wire.py
+
+"""
+게임 메시지 이진 인코딩 (MessagePack)
+
+    state_update, round_result, state_broadcast는 키 없이 필드 순서대로 담은 배열(위치 스키마)로 보낸다.
+        [0, game_id, player_id, [stage, turn, board, sb, bb, minraiseby, [player, ...], action_count]]
+            player: [pid, position, hole_cards, folded, chips, bet, timebank, remaining_time]
+        [1, game_id, player_id, [board, [player, ...]]]
+            player: [pid, chips, payout, bet, change, hand, hole_cards]
+        [2, game_id, 0번 배열(공개 상태), holes]   - 워커 → 웹소켓 노드 내부용
+    그 밖의 메시지(game_end, error, state_delta, ...)는 키가 있는 맵 그대로 담는다.
+
+필드 순서는 message_models의 pydantic 모델 필드 순서를 따른다. 모델에 필드를 추가할 때는 맨 끝에 붙여야
+이미 배포된 클라이언트의 위치가 어긋나지 않는다.
+"""
+
+import json
+
+import msgpack
+
+from .message_models import PlayerInfo, StatePayload, RoundResultPlayerInfo, RoundResultPayload
+
+STATE, ROUND_RESULT, STATE_BROADCAST = 0, 1, 2
+_ARRAY4 = b"\x94"  # msgpack fixarray(4) 헤더
+
+
+def _schema(model, nested: dict) -> tuple:
+    # ((필드, 하위 필드 순서 또는 None), ...)
+    return tuple((name, nested.get(name)) for name in model.model_fields)
+
+
+_STATE = _schema(StatePayload, {"players": tuple(PlayerInfo.model_fields)})
+_RESULT = _schema(RoundResultPayload, {"players": tuple(RoundResultPlayerInfo.model_fields)})
+
+
+def _pack(payload: dict, schema: tuple) -> list:
+    return [[[p.get(f) for f in sub] for p in payload[name]] if sub else payload[name] for name, sub in schema]
+
+
+def _unpack(values: list, schema: tuple) -> dict:
+    return {name: [dict(zip(sub, p)) for p in value] if sub else value for (name, sub), value in zip(schema, values)}
+
+
+def _state(msg: dict) -> list:
+    return [STATE, msg["game_id"], msg["player_id"], _pack(msg["payload"], _STATE)]
+
+
+def encode(msg: dict) -> bytes:
+    msg_type = msg.get("type")
+    if msg_type == "state_update":
+        return msgpack.packb(_state(msg))
+    if msg_type == "round_result":
+        return msgpack.packb([ROUND_RESULT, msg["game_id"], msg["player_id"], _pack(msg["payload"], _RESULT)])
+    if msg_type == "state_broadcast":
+        return msgpack.packb([STATE_BROADCAST, msg["game_id"], _state(msg["state"]), msg["holes"]])
+    return msgpack.packb(msg)
+
+
+def encode_broadcast(game_id: str, state: dict, holes_groups: list) -> list:
+    """
+    state_broadcast를 holes 묶음(웹소켓 노드)마다 한 건씩 만든다. 공개 상태는 한 번만 packb한다.
+    """
+    head = _ARRAY4 + msgpack.packb(STATE_BROADCAST) + msgpack.packb(game_id) + msgpack.packb(_state(state))
+    return [head + msgpack.packb(holes) for holes in holes_groups]
+
+
+def _decode_state(obj: list) -> dict:
+    _, game_id, player_id, payload = obj
+    return {"type": "state_update", "game_id": game_id, "player_id": player_id, "payload": _unpack(payload, _STATE)}
+
+
+def decode(data: bytes) -> dict:
+    obj = msgpack.unpackb(data)
+    if isinstance(obj, dict):
+        return obj
+    if obj[0] == STATE:
+        return _decode_state(obj)
+    if obj[0] == ROUND_RESULT:
+        _, game_id, player_id, payload = obj
+        return {"type": "round_result", "game_id": game_id, "player_id": player_id, "payload": _unpack(payload, _RESULT)}
+    if obj[0] == STATE_BROADCAST:
+        _, game_id, state, holes = obj
+        return {"type": "state_broadcast", "game_id": game_id, "player_id": "*", "state": _decode_state(state), "holes": holes}
+    raise ValueError(f"알 수 없는 메시지 태그: {obj[0]}")
+
+
+def loads(data) -> dict:
+    # outgoing_ws 채널에는 JSON(텍스트)과 MessagePack이 섞여 올 수 있다 - JSON 객체는 항상 "{"로 시작한다
+    if isinstance(data, str) or data[:1] == b"{":
+        return json.loads(data)
+    return decode(data)
@@ -2,13 +2,15 @@
 
 import asyncio
 import json
+import secrets
 from time import time
 from app.protocol.message_models import *
 from app.services.messaging import publish_message, end_game
 from app.services.user_db import get_usernames_by_uids
 from holdemlogic import RoundManager
 from holdemlogic import Hand
-from servers.history_logger import save_game_result
+from holdemlogic.card import derive_seed
+from servers.history_logger import save_game_result, append_hand_log
 
 
 class GameManager:
@@ -23,7 +25,8 @@ class GameManager:
                  base_time=15.0,
                  timebank=30.0, 
                  grace=1.0,
-                 round_delay=5.0):
+                 round_delay=5.0,
+                 seed: int = None):
         self.game_id = game_id
         self.game_type = game_type
         assert len(player_ids) == len(chips)
@@ -48,6 +51,10 @@ class GameManager:
         self._start_time = time()
         self.deadline = 0.0
 
+        # 🎲 게임 시드: 라운드별 덱 시드는 (seed, round_count)로부터 파생 → 모든 딜 재현 가능
+        self.seed = seed if seed is not None else secrets.randbits(63)
+        self.round_count = 0
+
         self.action_count = 0  # ⏱️ 타이머 식별자
         self.is_sleeping = True
         def wake():
@@ -87,7 +94,7 @@ class GameManager:
             if not is_timeout and now > deadline:
                 raise ValueError(f"⏱️ 행동 시간이 초과되었습니다. now={now:.2f}, deadline={deadline:.2f}")
 
-            res = self.round.step(round_index, amount)
+            res = self.round.step(round_index, amount, t=received_at)
             self._print(f"[ACTION] step success: result = {res}")
             self.round.use_timebank(round_index, now=received_at)
             self._update_chips()
@@ -146,13 +153,17 @@ class GameManager:
         self._print("starting new round")
         self._setup_indices()
 
+        # 시드는 로그에 남기지 않는다 (진행 중인 덱을 복원할 수 있음). 라운드가 끝나면 핸드 로그에만 기록
+        round_seed = derive_seed(self.seed, self.round_count)
+        self.round_count += 1
         self.round = RoundManager(
             chips=[self.chips[i] for i in self.round_index_to_game_index if i != -1],
             sb=self.sb,
             bb=self.bb,
             base_time=self.base_time,
             timebank=self.timebank,
-            grace=self.grace
+            grace=self.grace,
+            seed=round_seed
         )
         self._update_chips()
 
@@ -187,13 +198,14 @@ class GameManager:
     def _finish_round(self) -> list:
         messages = []
         self._print("round finished")
-        distributions = self.round.get_distributions()
+        showdown = self.round.get_showdown()  # 핸드 평가/팟 분배는 라운드당 한 번만
         
         for round_index, game_index in enumerate(self.round_index_to_game_index):
-            self.chips[game_index] += distributions[round_index]
+            self.chips[game_index] += showdown.payouts[round_index]
         self._update_rankings()
+        self._record_hand_history(showdown)
         
-        messages += self._get_round_result()
+        messages += self._get_round_result(showdown)
         self.sb_index = (self.sb_index + 1) % self.n
         if len([chips for chips in self.chips if chips > 0]) > 1:
             self.action_count += 1
@@ -249,17 +261,29 @@ class GameManager:
 
 
     def _broadcast_state(self) -> list:
-        messages = []
-        for player_id in self.player_ids:
-            messages += self._get_state(player_id)
-        
-        return messages
+        # 공개 상태는 한 번만 만들고, 플레이어마다 다른 홀카드만 따로 붙인다 (웹소켓 서버에서 나눠 보냄)
+        holes = {pid: None for pid in self.player_ids}
+        for i in range(self.n):
+            if self.survived[i]:
+                holes[self.player_ids[i]] = list(map(lambda card: card.__repr__(), self.round.get_hole(self.round_index[i])))
+
+        msg = StateBroadcastMessage(
+            type="state_broadcast",
+            game_id=self.game_id,
+            state=self._state_message("*", viewer=None),
+            holes=holes
+        )
+        return [msg]
 
 
     def _get_state(self, player_id: str) -> list:
-        messages = []
+        return [self._state_message(player_id, viewer=self.player_ids.index(player_id))]
+
+
+    def _state_message(self, player_id: str, viewer) -> StateMessage:
+        # viewer: 홀카드를 공개할 플레이어 인덱스 (None이면 모두 "??")
         now = time()
-        j = self.player_ids.index(player_id)
+        j = viewer
 
         players = []
         for i in range(self.n):
@@ -289,7 +313,7 @@ class GameManager:
                 remaining_time=round(remaining_time, 2) if remaining_time is not None else None
             ))
 
-        msg = StateMessage(
+        return StateMessage(
             type="state_update",
             game_id=self.game_id,
             player_id=player_id,
@@ -304,55 +328,68 @@ class GameManager:
                 action_count=self.action_count
             )
         )
-        messages += [msg]
-        
-        return messages
 
-    def _get_round_result(self) -> list:
+    def _get_round_result(self, showdown) -> list:
         messages = []
-        from holdemlogic import Hand
-        board = self.round.get_board()
+        board = list(map(lambda card: card.__repr__(), self.round.get_board()))
         
-        distributions = self.round.get_distributions()
+        distributions = showdown.payouts
         self._print(f"distribution: {distributions}")
         contributions = self.round.get_contributions()
-        survived = [i for i in range(len(self.survived)) if self.survived[i]]
+        folded = self.round.get_folded()
+        holes = {i: list(map(lambda card: card.__repr__(), self.round.get_hole(self.round_index[i])))
+                 for i in range(self.n) if self.survived[i]}
 
         for pid in self.player_ids:
+            j = self.player_ids.index(pid)
+            players = []
+            for i in range(self.n):
+                if not self.survived[i]:
+                    continue
+                ridx = self.round_index[i]
+                hand = "???"
+                hole_cards = ["??", "??"]
+                if showdown.uncontested:
+                    if i == j:  # 폴드로 끝난 판은 내 홀카드만 공개
+                        hole_cards = holes[i]
+                elif not folded[ridx]:
+                    hole_cards = holes[i]
+                    hand = showdown.hand_names[ridx]
+                players.append(RoundResultPlayerInfo(
+                    pid=self.player_ids[i],
+                    chips=self.chips[i],
+                    payout=distributions[ridx],
+                    bet=contributions[ridx],
+                    change=(distributions[ridx] - contributions[ridx]),
+                    hand=hand,
+                    hole_cards=hole_cards
+                ))
             msg = RoundResultMessage(
                 type="round_result",
                 game_id=self.game_id,
                 player_id=pid,
                 payload=RoundResultPayload(
-                    board=list(map(lambda card: card.__repr__(), board)),
-                    players=[RoundResultPlayerInfo(
-                        pid=self.player_ids[i],
-                        chips=self.chips[i],
-                        payout=distributions[self.round_index[i]],
-                        bet=contributions[self.round_index[i]],
-                        change=(distributions[self.round_index[i]] - contributions[self.round_index[i]]),
-                        hand="???",
-                        hole_cards=["??", "??"]
-                    ) for i in range(self.n) if self.survived[i]]
+                    board=board,
+                    players=players
                 )
             )
-            if self.round.get_folded().count(False) == 1:
-                i = self.player_ids.index(pid)
-                if self.survived[i]:
-                    msgidx = survived.index(i)
-                    msg.payload.players[msgidx].hole_cards = list(map(lambda card: card.__repr__(),self.round.get_hole(self.round_index[i])))
-            else:
-                hands = self.round.get_hands()
-                hand_names = [Hand.RANK_ORDER[hands[i].rank] for i in range(len(hands))]
-                for i in range(self.n):
-                    if self.survived[i] and not self.round.get_folded()[self.round_index[i]]:
-                        msgidx = survived.index(i)
-                        msg.payload.players[msgidx].hole_cards = list(map(lambda card: card.__repr__(),self.round.get_hole(self.round_index[i])))
-                        msg.payload.players[msgidx].hand = hand_names[self.round_index[i]]
             messages += [msg]
         
         return messages
 
+    def _record_hand_history(self, showdown):
+        # GameManager에는 남기지 않고 핸드 로그(JSONL)로만 내보낸다
+        player_ids = [self.player_ids[i] for i in self.round_index_to_game_index]
+        log = self.round.get_log()  # 덱 순서/블라인드/칩/액션 → holdemlogic.replay로 재현 가능
+        append_hand_log({
+            "game_id": self.game_id,
+            "game_seed": self.seed,
+            "round": self.round_count - 1,
+            "player_ids": player_ids,
+            **log,
+            "showdown": showdown.to_dict(),
+        })
+
     def _update_rankings(self):
         eliminated = [
             pid for pid, chip in zip(self.player_ids, self.chips)
@@ -167,11 +167,12 @@ async def request_initialize_quick_play_game(game_id: str, uids: list[str], play
     from redis.asyncio import Redis
     import json
 
-    # 워커 인덱스 결정
-    import uuid
-    num_workers = int(os.getenv("NUM_WORKERS", 1))
-    worker_index = int(uuid.UUID(game_id)) % num_workers
-    queue_name = f"game_registry_manager_queue_{worker_index}"
+    from servers.routing import router, registry_queue
+    from servers.transport import send
+
+    # 워커 배치 결정(consistent-hash 링) + 라우팅 테이블 기록
+    worker_index = await router.assign(game_id)
+    queue_name = registry_queue(worker_index)
 
     # 메시지 구성
     msg = {
@@ -195,4 +196,4 @@ async def request_initialize_quick_play_game(game_id: str, uids: list[str], play
 
     # Redis 전송
     r = Redis(decode_responses=True)
-    await r.rpush(queue_name, json.dumps(msg))
\ No newline at end of file
+    await send(r, queue_name, json.dumps(msg))
\ No newline at end of file
@@ -22,6 +22,26 @@ def publish_message(msg: BaseModel):
     assert hasattr(msg, "game_id") and hasattr(msg, "player_id")
     r.publish("outgoing_ws", msg.json())
 
+
+def expand_outgoing(payload: dict) -> list:
+    """
+    outgoing_ws 메시지 하나를 [(player_id, 보낼 메시지)]로 나눈다.
+    state_broadcast는 공개 상태에 플레이어마다 player_id와 자기 홀카드만 채운 state_update로 바꾼다.
+    (공개 부분은 얕은 복사로 공유하므로 플레이어 수만큼 다시 만들지 않는다)
+    """
+    if payload.get("type") != "state_broadcast":
+        return [(payload["player_id"], payload)]
+
+    state = payload["state"]
+    public = state["payload"]
+    expanded = []
+    for player_id, hole_cards in payload["holes"].items():
+        players = public["players"]
+        if hole_cards is not None:
+            players = [dict(p, hole_cards=hole_cards) if p["pid"] == player_id else p for p in players]
+        expanded.append((player_id, {**state, "player_id": player_id, "payload": {**public, "players": players}}))
+    return expanded
+
 # ================================================================
 # ✅ 게임 종료 시 Redis 정리
 # ================================================================
@@ -636,8 +636,19 @@ function exit(){
     });
 }
 
+// state_delta: 직전 상태(base)에서 바뀐 필드만 온다 (app/protocol/state_delta.py)
+function applyDelta(prev, msg) {
+    const changes = msg.payload;
+    const next = {...prev, ...changes, action_count: msg.action_count};
+    if (changes.players && !Array.isArray(changes.players)) {
+        next.players = prev.players.map((p, k) => changes.players[k] ? {...p, ...changes.players[k]} : p);
+    }
+    return next;
+}
+
 function createNewSocket() {
-    const ws = new WebSocket(`wss://${location.hostname}/quick_play_ws?token=${token}`);
+    const ws = new WebSocket(`wss://${location.hostname}/quick_play_ws?token=${token}&delta=1`);
+    let resyncing = false;
     ws.onopen = () => {
         console.log("✅ WebSocket 연결됨");
     };
@@ -646,8 +657,20 @@ function createNewSocket() {
         const msg = JSON.parse(event.data);
         console.log("📩", msg);
         if (msg.type === "state_update") {
+            resyncing = false;
             renderState(msg.payload);
         }
+        else if (msg.type === "state_delta") {
+            if (state === null || state.action_count !== msg.base) {
+                // 기준 상태를 놓침 → 전체 상태를 한 번만 다시 요청
+                if (!resyncing) {
+                    resyncing = true;
+                    ws.send(JSON.stringify({type: "resync", action_count: action_count}));
+                }
+                return;
+            }
+            renderState(applyDelta(state, msg));
+        }
         else if (msg.type === "round_result") {
             renderResult(msg.payload);
         }
@@ -0,0 +1,56 @@
+# benchmarks/bench_batch.py
+
+"""
+배치 평가기 벤치마크. 초당 평가 핸드 수를 출력하고 evaluate_codes()/HandRanking과 결과를 대조한다.
+
+    python -m benchmarks.bench_batch [핸드 수]
+"""
+
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from holdemlogic.evaluator import evaluate_codes
+from holdemlogic.hand import HandRanking
+from holdemlogic.batch import evaluate_batch, showdown_batch
+
+
+def _random_deals(rng: np.random.Generator, n: int, cards: int) -> np.ndarray:
+    # 행마다 중복 없는 카드 코드
+    return np.argsort(rng.random((n, 52)), axis=1)[:, :cards].astype(np.uint8)
+
+
+def main(n: int = 1_000_000):
+    rng = np.random.default_rng(0)
+    codes = _random_deals(rng, n, 7)
+
+    start = perf_counter()
+    strengths = evaluate_batch(codes)
+    elapsed = perf_counter() - start
+    print(f"[bench_batch] evaluate_batch: {n} hands  {elapsed:.3f}s  {n / elapsed:,.0f} hands/s")
+
+    sample = codes[:20000].tolist()
+    start = perf_counter()
+    expected = [evaluate_codes(row) for row in sample]
+    elapsed = perf_counter() - start
+    print(f"[bench_batch] evaluate_codes: {len(sample)} hands  {elapsed:.3f}s  {len(sample) / elapsed:,.0f} hands/s")
+    assert strengths[:len(sample)].tolist() == expected, "evaluate_codes와 결과 불일치"
+
+    games, players = n // 8, 8
+    deals = _random_deals(rng, games, players * 2 + 5)
+    hole = deals[:, :players * 2].reshape(games, players, 2)
+    board = deals[:, players * 2:]
+    start = perf_counter()
+    table, winners = showdown_batch(hole, board)
+    elapsed = perf_counter() - start
+    print(f"[bench_batch] showdown_batch: {games} x {players}-way  {elapsed:.3f}s  {games * players / elapsed:,.0f} hands/s")
+
+    for g in range(2000):
+        ranked = HandRanking.rank_players({p: int(table[g, p]) for p in range(players)})
+        assert sorted(ranked[0]) == np.flatnonzero(winners[g]).tolist(), "HandRanking과 승자 불일치"
+    print("[bench_batch] 결과 대조 OK")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
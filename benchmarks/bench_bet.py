@@ -0,0 +1,72 @@
+# benchmarks/bench_bet.py
+
+"""
+BetManager 액션 처리 벤치마크 (8인 테이블). 기존 구현(bet_manager_outdated)과 처리량/결과를 비교한다.
+
+    python -m benchmarks.bench_bet [라운드 수]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from holdemlogic.bet_manager import BetManager
+from holdemlogic import bet_manager_outdated
+
+
+def _choose(bm, rng: random.Random) -> int:
+    i = bm.i
+    chips = bm.chips[i]
+    to_call = max(bm.contributions) - bm.contributions[i]
+    x = rng.random()
+    if x < 0.25:
+        return 0
+    if x < 0.75 or chips <= to_call:
+        return min(to_call, chips)
+    if chips - to_call >= bm.min_raise_by:
+        return chips if x > 0.95 else to_call + bm.min_raise_by
+    return to_call
+
+
+def _scripts(rounds: int, players: int = 8) -> list:
+    # 라운드마다 (칩, 액션 목록)을 미리 만들어 두고 두 구현에 같은 입력을 넣는다
+    rng = random.Random(0)
+    scripts = []
+    for _ in range(rounds):
+        chips = [rng.randint(20, 400) for _ in range(players)]
+        bm = bet_manager_outdated.BetManager(chips, 1, 2)
+        actions = []
+        while not bm.finished:
+            amt = _choose(bm, rng)
+            actions.append(amt)
+            bm.step(amt)
+        scripts.append((chips, actions))
+    return scripts
+
+
+def _run(cls, scripts: list) -> tuple:
+    states = []
+    start = perf_counter()
+    for chips, actions in scripts:
+        bm = cls(chips, 1, 2)
+        for amt in actions:
+            bm.step(amt)
+        states.append((bm.i, bm.stage, bm.contributions, bm.chips, bm.folded))
+    return perf_counter() - start, states
+
+
+def main(rounds: int = 20000):
+    scripts = _scripts(rounds)
+    actions = sum(len(a) for _, a in scripts)
+    print(f"[bench_bet] 8인 {rounds} 라운드, {actions} 액션")
+
+    old_elapsed, old_states = _run(bet_manager_outdated.BetManager, scripts)
+    new_elapsed, new_states = _run(BetManager, scripts)
+    print(f"outdated BetManager  {old_elapsed:7.3f}s  {actions / old_elapsed:12,.0f} actions/s")
+    print(f"BetManager           {new_elapsed:7.3f}s  {actions / new_elapsed:12,.0f} actions/s  x{old_elapsed / new_elapsed:.2f}")
+    assert old_states == new_states, "기존 구현과 결과가 다릅니다"
+    print("[bench_bet] 결과 대조 OK")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
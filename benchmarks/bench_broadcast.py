@@ -0,0 +1,66 @@
+# benchmarks/bench_broadcast.py
+
+"""
+상태 브로드캐스트 벤치마크. 플레이어마다 StateMessage를 만들어 직렬화하던 방식과
+공개 상태를 한 번만 만들고 홀카드만 붙이는 state_broadcast(웹소켓 서버에서 expand_outgoing으로 나눔)를 비교한다.
+테이블 인원별로 워커 쪽 비용(모델 생성 + JSON), publish 횟수/바이트, 웹소켓 서버 쪽 나누기 비용을 출력한다.
+
+    python -m benchmarks.bench_broadcast [반복 수]
+"""
+
+import contextlib
+import io
+import json
+import sys
+import warnings
+from time import perf_counter
+
+import app.services.game_manager as game_manager
+from app.services.game_manager import GameManager
+from app.services.messaging import expand_outgoing
+
+
+def _table(players: int) -> GameManager:
+    game_manager.save_game_result = lambda **kwargs: None
+    game_manager.append_hand_log = lambda record: None
+    gm = GameManager("00000000-0000-0000-0000-000000000000", "quick_play",
+                     [f"u{k}" for k in range(players)], [f"p{k}" for k in range(players)],
+                     [2000] * players, sb=10, bb=20, seed=players)
+    gm.verbose = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        gm.wake()
+    return gm
+
+
+def _per_player(gm: GameManager) -> list:
+    # 이전 방식: 플레이어마다 _get_state
+    return [msg.json() for player_id in gm.player_ids for msg in gm._get_state(player_id)]
+
+
+def _broadcast(gm: GameManager) -> list:
+    return [msg.json() for msg in gm._broadcast_state()]
+
+
+def _timed(fn, repeat: int) -> tuple:
+    start = perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    return (perf_counter() - start) / repeat * 1e6, out
+
+
+def main(repeat: int = 2000):
+    warnings.simplefilter("ignore")  # pydantic .json() 폐기 예정 경고
+    print(f"[bench_broadcast] 브로드캐스트 {repeat}회 평균")
+    for players in (2, 4, 6, 8):
+        gm = _table(players)
+        old_us, old = _timed(lambda: _per_player(gm), repeat)
+        new_us, new = _timed(lambda: _broadcast(gm), repeat)
+        # 웹소켓 서버: 받은 메시지 파싱 → 플레이어별 json.dumps
+        old_ws_us, _ = _timed(lambda: [json.dumps(msg) for data in old for _, msg in expand_outgoing(json.loads(data))], repeat)
+        new_ws_us, _ = _timed(lambda: [json.dumps(msg) for _, msg in expand_outgoing(json.loads(new[0]))], repeat)
+        print(f"{players}인  플레이어별      워커 {old_us:6.1f}us  publish {len(old)}회 {sum(map(len, old)):>5}B  웹소켓 {old_ws_us:5.1f}us")
+        print(f"     state_broadcast 워커 {new_us:6.1f}us  publish {len(new)}회 {sum(map(len, new)):>5}B  웹소켓 {new_ws_us:5.1f}us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,70 @@
+# benchmarks/bench_delta.py
+
+"""
+state_update 델타 벤치마크. 웹소켓 노드가 플레이어마다 전체 state_update를 JSON으로 보내던 방식과
+StateDelta로 직전 상태에서 바뀐 필드만 state_delta로 보내는 방식의 전송 바이트/인코딩 시간을 비교한다.
+
+실제 GameManager로 8인 테이블을 진행하며 나온 state_broadcast를 expand_outgoing으로 플레이어별로 나누고,
+플레이어(연결)마다 StateDelta 하나를 둔다. 모든 델타는 apply()로 되돌려 전체 상태와 같은지 확인한다.
+
+    python -m benchmarks.bench_delta [액션 수]
+"""
+
+import json
+import sys
+import warnings
+from time import perf_counter
+
+from app.services.messaging import expand_outgoing
+from app.protocol.state_delta import StateDelta, apply
+from benchmarks.bench_outbound import _play
+
+TABLES = 20
+PLAYERS = 8
+
+
+def main(actions: int = 3000):
+    warnings.simplefilter("ignore")  # pydantic .json() 폐기 예정 경고
+    print(f"[bench_delta] 테이블 {TABLES}개({PLAYERS}인), 액션 {actions}개")
+    states = []  # [(game_id, player_id, state_update dict)]
+    for gm, msg in _play(TABLES, actions, PLAYERS):
+        if msg.type == "state_broadcast":
+            payload = json.loads(msg.json())
+            states += [(gm.game_id, player_id, m) for player_id, m in expand_outgoing(payload)]
+
+    start = perf_counter()
+    full = [json.dumps(m) for _, _, m in states]
+    full_time = perf_counter() - start
+
+    encoders = {}
+    start = perf_counter()
+    encoded = []
+    for game_id, player_id, m in states:
+        encoder = encoders.setdefault((game_id, player_id), StateDelta())
+        encoded.append(json.dumps(encoder.encode(m)))
+    delta_time = perf_counter() - start
+
+    # 클라이언트 쪽 적용 결과가 전체 상태와 같은지
+    held = {}
+    deltas = 0
+    for (game_id, player_id, m), data in zip(states, encoded):
+        msg = json.loads(data)
+        if msg["type"] == "state_delta":
+            assert held[(game_id, player_id)]["action_count"] == msg["base"]
+            held[(game_id, player_id)] = apply(held[(game_id, player_id)], msg)
+            deltas += 1
+        else:
+            held[(game_id, player_id)] = msg["payload"]
+        assert held[(game_id, player_id)] == m["payload"]
+
+    full_bytes = sum(map(len, full))
+    delta_bytes = sum(map(len, encoded))
+    n = len(states)
+    print(f"전송 {n}건 (그중 state_delta {deltas}건), 확인 완료: 적용 결과 = 전체 상태")
+    print(f"{'전체 state_update':<18} {full_bytes / 1e6:7.2f}MB  평균 {full_bytes / n:6.0f}B  인코딩 {full_time / n * 1e6:6.2f}µs/건")
+    print(f"{'state_delta':<18} {delta_bytes / 1e6:7.2f}MB  평균 {delta_bytes / n:6.0f}B  인코딩 {delta_time / n * 1e6:6.2f}µs/건 (diff 포함)")
+    print(f"바이트 {delta_bytes / full_bytes:.1%}, 인코딩 시간 {delta_time / full_time:.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
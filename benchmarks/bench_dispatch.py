@@ -0,0 +1,160 @@
+# benchmarks/bench_dispatch.py
+
+"""
+step handler head-of-line blocking 벤치마크. 태스크 하나가 모든 게임을 차례로 처리하고 기록(SQLite/핸드 로그)도
+이벤트 루프에서 하던 방식과, 게임별 메일박스를 STEP_TASKS개 태스크가 나눠 맡고 기록은 스레드로 넘기는 방식의
+메시지 대기 시간(인박스에 들어온 뒤 처리 시작까지)을 비교한다.
+
+게임 로직, Inbox, _step_task, history_logger 기록은 실제 코드를 돌린다. Redis만 파이프라인 왕복마다
+RTT를 기다리는 대역으로 바꾼다. 부하는 INTERVAL 동안 모든 게임에 액션 하나씩 나눠 넣는다 (앞 액션이 처리된 게임만).
+
+    python -m benchmarks.bench_dispatch [측정 시간(초)] [RTT(ms)]
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from time import time
+
+import app.services.game_manager as game_manager
+import servers.history_logger as history_logger
+from app.services.game_manager import GameManager
+from servers.registry import game_registry, inbox
+from servers.game_step_handler import STEP_TASKS, _step_task, metrics
+
+GAMES = 60
+PLAYERS = 4
+INTERVAL = 0.05
+SPREAD = 6  # 한 번에 넣는 게임 수
+
+
+class _SimulatedPipeline:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, command):
+        return lambda *args: self  # set/srem/rpush/publish: 쌓기만
+
+    async def execute(self):
+        await asyncio.sleep(self.rtt)
+
+
+class _SimulatedRedis:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    def pipeline(self, transaction: bool = False):
+        return _SimulatedPipeline(self.rtt)
+
+
+def _new_game(serial: int) -> GameManager:
+    gm = GameManager(f"00000000-0000-0000-0000-{serial:012d}", "quick_play",
+                     [f"u{k}" for k in range(PLAYERS)], [f"p{k}" for k in range(PLAYERS)],
+                     [200] * PLAYERS, sb=10, bb=20, seed=serial)
+    gm.verbose = False
+    gm.wake()
+    game_registry[gm.game_id] = gm
+    return gm
+
+
+def _action(gm: GameManager, rng: random.Random) -> str:
+    rm = gm.round
+    i = rm.get_current_player()
+    contributions = rm.get_contributions()
+    chips = rm.bm.chips[i]
+    to_call = max(contributions) - contributions[i]
+    x = rng.random()
+    if x < 0.2:
+        amt = 0
+    elif x < 0.8 or chips - to_call < rm.bm.min_raise_by:
+        amt = min(to_call, chips)
+    else:
+        amt = chips  # 올인 - 게임이 빨리 끝나 기록이 자주 생긴다
+    return json.dumps({
+        "type": "action", "game_id": gm.game_id,
+        "player_id": gm.player_ids[gm.round_index_to_game_index[i]],
+        "amount": amt, "action_count": gm.action_count, "received_at": time(),
+    })
+
+
+async def _drive(seconds: float) -> int:
+    rng = random.Random(0)
+    games = [_new_game(g) for g in range(GAMES)]
+    serial = GAMES
+    sent = {}
+    finished = 0
+    loop = asyncio.get_running_loop()
+    end = loop.time() + seconds
+    while loop.time() < end:
+        for k, gm in enumerate(games):
+            if gm.done:
+                finished += 1
+                game_registry.pop(gm.game_id, None)
+                gm = games[k] = _new_game(serial)
+                serial += 1
+            if sent.get(gm.game_id) == gm.action_count:
+                continue  # 앞 액션이 아직 처리 중
+            if gm.is_sleeping:
+                gm.wake()  # 라운드 사이 대기는 타임아웃 경로라 측정에서 뺀다
+            sent[gm.game_id] = gm.action_count
+            inbox.put(_action(gm, rng))
+            if k % SPREAD == SPREAD - 1:
+                await asyncio.sleep(INTERVAL / (GAMES // SPREAD))  # 한 번에 몰리지 않게 나눠 넣는다
+    return finished
+
+
+async def _run(tasks: int, offload: bool, seconds: float, rtt: float) -> tuple:
+    if offload:
+        game_manager.save_game_result = history_logger.save_game_result
+        game_manager.append_hand_log = history_logger.append_hand_log
+    else:
+        game_manager.save_game_result = history_logger._save_game_result
+        game_manager.append_hand_log = history_logger._append_hand_log
+    game_registry.clear()
+    inbox.__init__(inbox.limit)  # 앞 실행에서 남은 메일박스 비우기
+    metrics.summary()
+    log = lambda *args: None
+    workers = [asyncio.create_task(_step_task(0, _SimulatedRedis(rtt), log)) for _ in range(tasks)]
+    finished = await _drive(seconds)
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return finished, metrics.summary()
+
+
+def main(seconds: float = 5.0, rtt_ms: float = 1.0):
+    tmp = Path(tempfile.mkdtemp())
+    history_logger.DB_PATH = str(tmp / "bench.db")
+    history_logger.HAND_LOG_DIR = str(tmp / "hands")
+    with sqlite3.connect(history_logger.DB_PATH) as conn:
+        conn.execute("CREATE TABLE game_history (game_id TEXT PRIMARY KEY, game_type TEXT, created_at TEXT, "
+                     "duration REAL, players TEXT, rankings TEXT)")
+
+    print(f"[bench_dispatch] 게임 {GAMES}개 x {PLAYERS}인, {INTERVAL * 1000:.0f}ms마다 액션, RTT {rtt_ms}ms, {seconds}초")
+    modes = (("태스크 1개 + 기록 인라인", 1, False), (f"태스크 {STEP_TASKS}개 + 기록 스레드", STEP_TASKS, True))
+
+    async def run_all():
+        # Inbox의 Event가 한 이벤트 루프에 묶이므로 모든 경우를 같은 루프에서 돌린다
+        return [await _run(tasks, offload, seconds, rtt_ms / 1000) for _, tasks, offload in modes]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = asyncio.run(run_all())
+    for (name, _, _), (finished, summary) in zip(modes, results):
+        print(f"{name:<20} 종료 게임 {finished:>4}  {summary}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 1.0)
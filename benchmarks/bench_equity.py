@@ -0,0 +1,45 @@
+# benchmarks/bench_equity.py
+
+"""
+에퀴티 계산기 벤치마크.
+
+    python -m benchmarks.bench_equity
+"""
+
+from time import perf_counter
+
+from holdemlogic.card import Card
+from holdemlogic.equity import equity
+
+
+def _cards(text: str) -> list:
+    return [Card(c[1], c[0]) for c in text.split()]
+
+
+def _bench(label: str, holes: list, board: list = (), repeat: int = 5, **kwargs):
+    equity(holes, board, **kwargs)  # 워밍업
+    start = perf_counter()
+    for _ in range(repeat):
+        result = equity(holes, board, **kwargs)
+    elapsed = (perf_counter() - start) / repeat * 1000
+    print(f"{label:<26} {elapsed:8.2f}ms  {result}")
+    return result
+
+
+def main():
+    aa_kk = [_cards("As Ah"), _cards("Kd Kc")]
+    _bench("AA vs KK flop (exact)", aa_kk, _cards("2c 7d 9h"))
+    _bench("AA vs KK turn (exact)", aa_kk, _cards("2c 7d 9h Ts"))
+    _bench("AA vs KK preflop (MC)", aa_kk, seed=1)
+
+    eight = [_cards(h) for h in ["As Ah", "Kd Kc", "Qs Jh", "Tc 9c", "8d 8h", "7s 6s", "5c 4d", "3h 2h"]]
+    result = _bench("8-way preflop (MC)", eight, seed=1)
+
+    # 큰 표본을 기준값으로 오차 확인
+    reference = equity(eight, seed=2, error=0.0005)
+    worst = max(abs(a - b) for a, b in zip(result.equities, reference.equities))
+    print(f"8-way preflop 기준값 대비 최대 오차: {worst:.4f} (reference samples={reference.samples})")
+
+
+if __name__ == "__main__":
+    main()
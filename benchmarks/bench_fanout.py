@@ -0,0 +1,123 @@
+# benchmarks/bench_fanout.py
+
+"""
+웹소켓 노드 fan-out 벤치마크. outgoing_ws 리더를 세 가지로 돌려 정상 클라이언트의 전달 지연(노드 도착 → 소켓 쓰기 완료)을 비교한다.
+
+    폴링+순차 : get_message(timeout=10ms) 후 없으면 10ms sleep, 소켓마다 send_text를 차례로 기다림 (예전 방식)
+    대기+순차 : 메시지가 올 때까지 기다림(listen), 전송은 여전히 차례로 기다림
+    대기+큐   : listen + 연결별 SendQueue (실제 코드) - 리더는 넣기만 하고 writer 태스크가 보낸다
+
+pub/sub은 asyncio.Queue, 소켓은 FAST_SEND/SLOW_SEND만큼 기다리는 대역이다. 메시지는 일정한 간격으로 도착하고
+메시지 하나는 연결 하나로 간다 (연결을 차례로 돈다). 두 가지 부하를 돌린다.
+
+    한가한 노드 : 정상 연결만, 초당 메시지 수의 1/10 - 폴링 지연만 보인다
+    느린 연결   : CONNECTIONS개 중 SLOW개가 send_text 한 번에 SLOW_SEND가 걸려 밀린다
+
+    python -m benchmarks.bench_fanout [메시지 수] [초당 메시지 수]
+"""
+
+import asyncio
+import sys
+from time import perf_counter
+
+import app.network.send_queue as send_queue
+from app.network.send_queue import SendQueue
+
+CONNECTIONS = 60
+SLOW = 2
+FAST_SEND = 0.0002
+SLOW_SEND = 0.5
+LIMIT = 16
+
+
+class _Socket:
+    def __init__(self, delay: float, latencies: list):
+        self.delay = delay
+        self.latencies = latencies
+        self.closed = None
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.latencies.append(perf_counter() - text)  # text 대신 도착 시각을 넣어 보낸다
+
+    async def close(self, code=None):
+        self.closed = code
+
+
+async def _publish(channel: asyncio.Queue, count: int, rate: float):
+    start = perf_counter()
+    for k in range(count):
+        delay = start + k / rate - perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await channel.put((k % CONNECTIONS, perf_counter()))
+    await channel.put(None)
+
+
+async def _poll_reader(channel, deliver):
+    while True:
+        try:
+            message = await asyncio.wait_for(channel.get(), timeout=0.01)
+        except asyncio.TimeoutError:
+            await asyncio.sleep(0.01)
+            continue
+        if message is None:
+            return
+        await deliver(*message)
+
+
+async def _listen_reader(channel, deliver):
+    while (message := await channel.get()) is not None:
+        await deliver(*message)
+
+
+async def _run(mode: str, count: int, rate: float, slow_count: int):
+    fast, slow = [], []
+    sockets = [_Socket(SLOW_SEND if k < slow_count else FAST_SEND, slow if k < slow_count else fast)
+               for k in range(CONNECTIONS)]
+    channel = asyncio.Queue()
+    send_queue.metrics.__init__()
+
+    if mode == "queue":
+        queues = [SendQueue(ws, f"uid{k:05d}", LIMIT) for k, ws in enumerate(sockets)]
+
+        async def deliver(k, arrived):
+            queues[k].push(arrived)
+    else:
+        async def deliver(k, arrived):
+            await sockets[k].send_text(arrived)
+
+    reader = _poll_reader if mode == "poll" else _listen_reader
+    await asyncio.gather(_publish(channel, count, rate), reader(channel, deliver))
+    if mode == "queue":
+        await asyncio.sleep(0.1)  # 정상 연결 큐가 비워질 시간
+        dropped = send_queue.metrics.drops
+        closed = sum(1 for ws in sockets if ws.closed is not None)
+        for q in queues:
+            q.close()
+        return fast, f"버림 {dropped}건, 끊은 연결 {closed}개"
+    return fast, ""
+
+
+def _summary(latencies):
+    latencies = sorted(latencies)
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+    return f"p50 {pick(0.5):8.2f}ms  p99 {pick(0.99):8.2f}ms  max {latencies[-1] * 1000:8.2f}ms"
+
+
+def main(count: int = 3000, rate: float = 500.0):
+    print(f"[bench_fanout] 연결 {CONNECTIONS}개, 큐 길이 제한 {LIMIT}")
+    scenarios = (
+        (f"한가한 노드: 메시지 {count // 10}건, {rate / 10:.0f}건/초", count // 10, rate / 10, 0),
+        (f"느린 연결 {SLOW}개(전송 {SLOW_SEND * 1000:.0f}ms): 메시지 {count}건, {rate:.0f}건/초", count, rate, SLOW),
+    )
+    for title, n, r, slow_count in scenarios:
+        print(title)
+        for mode, name in (("poll", "폴링+순차"), ("listen", "대기+순차"), ("queue", "대기+큐")):
+            fast, note = asyncio.run(_run(mode, n, r, slow_count))
+            print(f"  {name:<8} 정상 연결 {len(fast):>5}건  {_summary(fast)}  {note}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 500.0)
@@ -0,0 +1,60 @@
+# benchmarks/bench_hand.py
+
+"""
+핸드 평가 벤치마크: 기존 combinations 루프(hand_outdated) vs 룩업 테이블 평가기.
+
+    python -m benchmarks.bench_hand [핸드 수]
+"""
+
+import sys
+from time import perf_counter
+
+from holdemlogic.card import Deck
+from holdemlogic.hand import Hand, HandRanking
+from holdemlogic.evaluator import evaluate
+from holdemlogic import hand_outdated
+
+
+def _deal_showdowns(count: int, players: int = 8) -> list:
+    showdowns = []
+    for k in range(count):
+        deck = Deck(seed=k)
+        board = deck.draw(5)
+        showdowns.append([deck.draw(2) + board for _ in range(players)])
+    return showdowns
+
+
+def _bench(label: str, fn, showdowns: list, baseline: float = None) -> float:
+    start = perf_counter()
+    for hands in showdowns:
+        fn(hands)
+    elapsed = perf_counter() - start
+    per_hand = elapsed / (len(showdowns) * len(showdowns[0])) * 1e6
+    speedup = f"  x{baseline / elapsed:.1f}" if baseline else ""
+    print(f"{label:<28} {elapsed:8.3f}s  {per_hand:8.2f}us/hand{speedup}")
+    return elapsed
+
+
+def main(count: int = 2000):
+    showdowns = _deal_showdowns(count)
+    print(f"[bench_hand] 8인 쇼다운 {count}회 ({count * 8} 핸드)")
+
+    baseline = _bench(
+        "outdated Hand + rank_players",
+        lambda hands: hand_outdated.HandRanking.rank_players({i: hand_outdated.Hand(h) for i, h in enumerate(hands)}),
+        showdowns,
+    )
+    _bench(
+        "Hand + rank_players",
+        lambda hands: HandRanking.rank_players({i: Hand(h) for i, h in enumerate(hands)}),
+        showdowns, baseline,
+    )
+    _bench(
+        "evaluate + rank_players",
+        lambda hands: HandRanking.rank_players({i: evaluate(h) for i, h in enumerate(hands)}),
+        showdowns, baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,126 @@
+# benchmarks/bench_members.py
+
+"""
+웹소켓 노드 전달 지연 벤치마크. send_to_player가 메시지마다 Redis GET 두 번(player_id → uid, uid → 게임)을
+차례로 기다리던 방식과 Members 캐시에서 찾는 방식의 전달 지연(노드가 메시지를 받은 뒤 소켓에 쓰기까지)을 비교한다.
+
+실제 GameManager로 6인 테이블을 진행하며 나온 메시지를 일정한 간격(초당 메시지 수)으로 흘려 넣고, subscribe_outgoing_ws처럼
+한 건씩 expand_outgoing → 플레이어별 전송을 차례로 처리한다. Redis는 GET/HGETALL마다 RTT를 기다리는 대역,
+소켓은 아무것도 하지 않는 대역이다. (fastapi 없이 돌리려고 전송 경로 두 가지를 여기서 그대로 옮겨 적었다)
+
+    python -m benchmarks.bench_members [메시지 수] [RTT(ms)] [초당 메시지 수]
+"""
+
+import asyncio
+import json
+import sys
+import warnings
+from time import perf_counter
+
+from app.services.messaging import expand_outgoing
+from servers.outbound import Members
+from benchmarks.bench_outbound import _play
+
+TABLES = 20
+
+
+class _SimulatedRedis:
+    def __init__(self, rtt: float, data: dict, hashes: dict):
+        self.rtt = rtt
+        self.data = data
+        self.hashes = hashes
+
+    async def get(self, key):
+        await asyncio.sleep(self.rtt)
+        return self.data.get(key)
+
+    async def hgetall(self, key):
+        await asyncio.sleep(self.rtt)
+        return dict(self.hashes.get(key, {}))
+
+
+class _Socket:
+    async def send_text(self, text):
+        pass
+
+
+async def _send_redis(r, ws_registry, game_id, player_id, payload):
+    uid = await r.get(f"game:{game_id}:player:{player_id}:uid")
+    ws = ws_registry.get(uid)
+    if ws:
+        if await r.get(f"user:{uid}:game") != game_id:
+            return
+        await ws.send_text(json.dumps(payload))
+
+
+async def _send_cached(members, ws_registry, game_id, player_id, payload):
+    uid = members.uid_for(game_id, player_id)
+    ws = ws_registry.get(uid)
+    if ws:
+        if members.games.get(uid) != game_id:
+            return
+        await ws.send_text(json.dumps(payload))
+
+
+async def _deliver(stream, rate, send):
+    # 메시지 i는 시작 후 i / rate 초에 도착한다. 늦어진 만큼이 지연으로 쌓인다
+    latencies = []
+    start = perf_counter()
+    for k, data in enumerate(stream):
+        arrival = start + k / rate
+        delay = arrival - perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        payload = json.loads(data)
+        for player_id, msg in expand_outgoing(payload):
+            await send(payload["game_id"], player_id, msg)
+            latencies.append(perf_counter() - arrival)
+    return latencies
+
+
+def _summary(latencies):
+    latencies = sorted(latencies)
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+    return f"p50 {pick(0.5):7.2f}ms  p99 {pick(0.99):7.2f}ms  max {latencies[-1] * 1000:7.2f}ms"
+
+
+async def _run(count, rtt, rate):
+    games = {}
+    stream = []
+    for gm, msg in _play(TABLES, count):
+        games[gm.game_id] = gm
+        stream.append(msg.json())
+    data, hashes = {}, {}
+    for game_id, gm in games.items():
+        hashes[f"player_id_to_uid:{game_id}"] = dict(zip(gm.player_ids, gm.uids))
+        for uid, player_id in zip(gm.uids, gm.player_ids):
+            data[f"game:{game_id}:player:{player_id}:uid"] = uid
+            data[f"user:{uid}:game"] = game_id
+    redis = _SimulatedRedis(rtt, data, hashes)
+    ws_registry = {uid: _Socket() for gm in games.values() for uid in gm.uids}
+
+    results = {}
+    results["Redis GET x2"] = await _deliver(
+        stream, rate, lambda g, p, m: _send_redis(redis, ws_registry, g, p, m))
+
+    members = Members()
+    members.r = redis
+    for uid in ws_registry:
+        await members.attach(uid)  # 소켓 연결 시점
+    results["구성원 캐시"] = await _deliver(
+        stream, rate, lambda g, p, m: _send_cached(members, ws_registry, g, p, m))
+    return results
+
+
+def main(count: int = 2000, rtt_ms: float = 0.5, rate: float = 50.0):
+    warnings.simplefilter("ignore")  # pydantic .json() 폐기 예정 경고
+    print(f"[bench_members] 테이블 {TABLES}개(6인), 메시지 {count}건, {rate:.0f}건/초, Redis RTT {rtt_ms}ms")
+    results = asyncio.run(_run(count, rtt_ms / 1000, rate))
+    for name, latencies in results.items():
+        print(f"{name:<14} 전송 {len(latencies):>6}건  {_summary(latencies)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 0.5,
+         float(sys.argv[3]) if len(sys.argv) > 3 else 50.0)
@@ -0,0 +1,91 @@
+# benchmarks/bench_outbound.py
+
+"""
+웹소켓 노드별 수신량 벤치마크. 모든 노드가 outgoing_ws 하나를 구독하던 방식과
+Outbound.route()로 수신자가 붙은 노드 채널에만 보내는 방식에서 노드 하나가 받는 메시지 수/바이트를 비교한다.
+
+노드 수에 비례해 테이블/액션 수를 늘리고(노드당 사용자 수 고정, 사용자는 노드에 무작위 배치),
+실제 GameManager로 6인 테이블을 진행하며 나온 메시지를 route()에 넣어 채널별로 센다.
+(Redis와 웹소켓 서버 프로세스는 띄우지 않는다 - 노드는 uid → 노드 표로만 존재)
+
+    python -m benchmarks.bench_outbound [노드당 액션 수]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import warnings
+from collections import Counter
+
+import app.services.game_manager as game_manager
+from app.services.game_manager import GameManager
+from servers.outbound import Outbound, FALLBACK_CHANNEL, node_channel
+
+TABLES_PER_NODE = 20
+PLAYERS = 6
+NODE_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+def _play(tables: int, actions: int, players: int = PLAYERS) -> list:
+    # [(GameManager, 메시지)] - 게임마다 랜덤 액션
+    game_manager.save_game_result = lambda **kwargs: None
+    game_manager.append_hand_log = lambda record: None
+    rng = random.Random(0)
+    games = []
+    for t in range(tables):
+        uids = [f"uid{t * players + k}" for k in range(players)]
+        gm = GameManager(f"00000000-0000-0000-0000-{t:012d}", "quick_play", uids,
+                         [f"p{k}" for k in range(players)], [2000] * players, sb=10, bb=20, seed=t)
+        gm.verbose = False
+        games.append(gm)
+    out = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for gm in games:
+            out += [(gm, msg) for msg in gm.wake()]
+        while len(out) < actions:
+            gm = rng.choice(games)
+            if gm.done:
+                continue
+            if gm.is_sleeping:
+                out += [(gm, msg) for msg in gm.wake()]
+                continue
+            rm = gm.round
+            i = rm.get_current_player()
+            contributions = rm.get_contributions()
+            to_call = max(contributions) - contributions[i]
+            amt = 0 if rng.random() < 0.3 else min(to_call, rm.bm.chips[i])
+            out += [(gm, msg) for msg in gm.handle_action(amt, gm.action_count, 0.0,
+                                                          player_id=gm.player_ids[gm.round_index_to_game_index[i]],
+                                                          is_timeout=True)]
+    return out
+
+
+def main(actions_per_node: int = 1000):
+    warnings.simplefilter("ignore")  # pydantic .json() 폐기 예정 경고
+    print(f"[bench_outbound] 노드당 테이블 {TABLES_PER_NODE}개(6인), 액션 {actions_per_node}개")
+    print(f"{'노드':>4}  {'공용 채널: 노드당 수신':>24}  {'노드 채널: 노드당 평균 / 최대':>34}")
+    rng = random.Random(0)
+    for nodes in NODE_COUNTS:
+        stream = _play(TABLES_PER_NODE * nodes, actions_per_node * nodes)
+        uids = list(dict.fromkeys(uid for gm, _ in stream for uid in gm.uids))
+        total_messages = len(stream)
+        total_bytes = sum(len(msg.json()) for _, msg in stream)
+
+        outbound = Outbound()
+        outbound.nodes = {uid: f"node{rng.randrange(nodes)}" for uid in uids}
+        messages, size = Counter(), Counter()
+        for gm, msg in stream:
+            for channel, data in outbound.route(msg, gm):
+                messages[channel] += 1
+                size[channel] += len(data)
+        assert FALLBACK_CHANNEL not in messages
+        per_node = [(messages[node_channel(f"node{k}")], size[node_channel(f"node{k}")]) for k in range(nodes)]
+        avg_m = sum(m for m, _ in per_node) / nodes
+        avg_b = sum(b for _, b in per_node) / nodes
+        print(f"{nodes:>4}  {total_messages:>8}건 {total_bytes / 1e6:6.2f}MB"
+              f"      {avg_m:>8.0f}건 {avg_b / 1e6:6.2f}MB / {max(m for m, _ in per_node):>6}건 {max(b for _, b in per_node) / 1e6:5.2f}MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
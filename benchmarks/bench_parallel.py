@@ -0,0 +1,47 @@
+# benchmarks/bench_parallel.py
+
+"""
+병렬 에퀴티 벤치마크. 워커 수별 처리량과, 워커 수와 무관하게 결과가 같은지 확인한다.
+
+    python -m benchmarks.bench_parallel [샘플 수]
+"""
+
+import os
+import sys
+from time import perf_counter
+
+from holdemlogic.card import Card
+from holdemlogic.equity import equity
+from holdemlogic.parallel import parallel_equity, get_pool, shutdown_pools
+
+
+def _cards(text: str) -> list:
+    return [Card(c[1], c[0]) for c in text.split()]
+
+
+def main(samples: int = 1 << 20):
+    eight = [_cards(h) for h in ["As Ah", "Kd Kc", "Qs Jh", "Tc 9c", "8d 8h", "7s 6s", "5c 4d", "3h 2h"]]
+
+    start = perf_counter()
+    serial = equity(eight, seed=1, error=0, max_samples=samples)
+    elapsed = perf_counter() - start
+    print(f"[bench_parallel] serial      {elapsed:7.3f}s  {samples / elapsed:12,.0f} samples/s")
+
+    workers = 1
+    cpus = os.cpu_count() or 1
+    while workers <= cpus:
+        pool = get_pool(workers)
+        list(pool.map(abs, range(workers)))  # 워커 기동 비용은 재사용되므로 측정에서 제외
+        start = perf_counter()
+        result = parallel_equity(eight, seed=1, error=0, max_samples=samples, workers=workers)
+        elapsed = perf_counter() - start
+        same = result.equities == serial.equities
+        print(f"[bench_parallel] workers={workers:<3} {elapsed:7.3f}s  {samples / elapsed:12,.0f} samples/s  same_as_serial={same}")
+        assert same, "워커 수에 따라 결과가 달라졌습니다"
+        workers *= 2
+
+    shutdown_pools()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 20)
@@ -0,0 +1,47 @@
+# benchmarks/bench_routing.py
+
+"""
+game → worker 라우팅 벤치마크. 워커를 하나 늘렸을 때 배치가 바뀌는 게임 비율(modulo vs consistent-hash 링),
+워커별 분포, 조회 시간을 잰다.
+
+    python -m benchmarks.bench_routing [게임 수]
+"""
+
+import sys
+import uuid
+from time import perf_counter
+
+from servers.routing import HashRing, Router
+
+
+def main(games: int = 100000):
+    game_ids = [str(uuid.UUID(int=k * 0x9E3779B97F4A7C15 % (1 << 128))) for k in range(games)]
+    print(f"[bench_routing] 게임 {games}개")
+
+    for workers in (4, 8, 16):
+        ring, grown = HashRing(list(range(workers))), HashRing(list(range(workers + 1)))
+        mod_moved = sum(int(uuid.UUID(g)) % workers != int(uuid.UUID(g)) % (workers + 1) for g in game_ids)
+        ring_moved = sum(ring.lookup(g) != grown.lookup(g) for g in game_ids)
+        counts = [0] * workers
+        for g in game_ids:
+            counts[ring.lookup(g)] += 1
+        spread = (max(counts) - min(counts)) / (games / workers)
+        print(f"워커 {workers:2d} → {workers + 1:2d}  이동 비율 modulo {mod_moved / games:6.1%}  링 {ring_moved / games:6.1%}"
+              f"  (이상적 {1 / (workers + 1):5.1%})  링 분포 편차 {spread:5.1%}")
+
+    router = Router()
+    router.routes = {g: k % 8 for k, g in enumerate(game_ids)}
+    start = perf_counter()
+    for g in game_ids:
+        router.worker_for(g)
+    cached = (perf_counter() - start) / games
+    router.routes = {}
+    start = perf_counter()
+    for g in game_ids:
+        router.worker_for(g)
+    ring_only = (perf_counter() - start) / games
+    print(f"worker_for 조회: 테이블 사본 {cached * 1e9:6.0f} ns  링 계산 {ring_only * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
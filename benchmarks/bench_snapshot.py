@@ -0,0 +1,114 @@
+# benchmarks/bench_snapshot.py
+
+"""
+GameManager 스냅샷 인코딩 벤치마크 (8인 테이블). servers.snapshot 바이너리 포맷을 pickle/JSON과 비교한다.
+
+    python -m benchmarks.bench_snapshot [게임 수]
+"""
+
+import contextlib
+import io
+import json
+import pickle
+import random
+import sys
+from time import perf_counter
+
+import app.services.game_manager as game_manager
+from app.services.game_manager import GameManager
+from servers.snapshot import encode_static, encode_state, decode
+
+
+def _collect(games: int, players: int = 8) -> list:
+    # 랜덤 액션으로 게임을 진행하며 액션마다 (static, state) 스냅샷을 모은다
+    game_manager.save_game_result = lambda **kwargs: None
+    game_manager.append_hand_log = lambda record: None
+    rng = random.Random(0)
+    snapshots = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for g in range(games):
+            gm = GameManager(f"00000000-0000-0000-0000-{g:012d}", "quick_play",
+                             [f"u{k}" for k in range(players)], [f"p{k}" for k in range(players)],
+                             [2000] * players, sb=10, bb=20, seed=g)
+            gm.verbose = False
+            static = encode_static(gm)
+            gm.wake()
+            while not gm.done and gm.round_count < 30:
+                if gm.is_sleeping:
+                    gm.wake()
+                    continue
+                snapshots.append((static, encode_state(gm)))
+                rm = gm.round
+                i = rm.get_current_player()
+                contributions = rm.get_contributions()
+                chips = rm.bm.chips[i]
+                to_call = max(contributions) - contributions[i]
+                x = rng.random()
+                if x < 0.2:
+                    amt = 0
+                elif x < 0.9 or chips - to_call < rm.bm.min_raise_by:
+                    amt = min(to_call, chips)
+                else:
+                    amt = to_call + rm.bm.min_raise_by
+                gm.handle_action(amt, gm.action_count, 0.0,
+                                 player_id=gm.player_ids[gm.round_index_to_game_index[i]], is_timeout=True)
+    return snapshots
+
+
+def _pickle_state(gm: GameManager) -> dict:
+    # wake는 클로저라 pickle할 수 없으므로 제외
+    return {k: v for k, v in vars(gm).items() if k != "wake"}
+
+
+def _json_state(gm: GameManager) -> dict:
+    state = {k: v for k, v in vars(gm).items() if k not in ("wake", "round")}
+    rm = gm.round
+    bm = rm.bm
+    state["round"] = {
+        "seed": rm.seed,
+        "deck": rm.deck.codes(),
+        "pos": rm.deck.pos,
+        "initial_chips": rm.initial_chips,
+        "timebanks": rm.timebanks,
+        "deadline": rm.deadline,
+        "actions": rm.actions,
+        "bm": {k: v for k, v in vars(bm).items() if k not in ("stages", "positions", "to_act")},
+    }
+    return state
+
+
+def _time(fn, items: list) -> float:
+    start = perf_counter()
+    for item in items:
+        fn(item)
+    return (perf_counter() - start) / len(items)
+
+
+def main(games: int = 20):
+    snapshots = _collect(games)
+    managers = [decode(static, state) for static, state in snapshots]
+    print(f"[bench_snapshot] 8인 {games} 게임, 스냅샷 {len(snapshots)}개")
+
+    binary = [encode_state(gm) for gm in managers]
+    pickled = [pickle.dumps(_pickle_state(gm), protocol=pickle.HIGHEST_PROTOCOL) for gm in managers]
+    dumped = [json.dumps(_json_state(gm)) for gm in managers]
+
+    rows = [
+        ("binary", binary, _time(encode_state, managers), _time(lambda s: decode(s[0], s[1]), snapshots)),
+        ("pickle", pickled, _time(lambda gm: pickle.dumps(_pickle_state(gm), protocol=pickle.HIGHEST_PROTOCOL), managers),
+         _time(pickle.loads, pickled)),
+        ("json", dumped, _time(lambda gm: json.dumps(_json_state(gm)), managers), _time(json.loads, dumped)),
+    ]
+    for name, blobs, encode_time, decode_time in rows:
+        size = sum(len(b) for b in blobs) / len(blobs)
+        print(f"{name:7}  평균 {size:7.1f} B  최대 {max(len(b) for b in blobs):6d} B  "
+              f"encode {encode_time * 1e6:7.1f} µs  decode {decode_time * 1e6:7.1f} µs")
+    print(f"binary static 헤더 {len(snapshots[0][0])} B (게임당 한 번)")
+    print("※ json decode는 문자열 → dict 파싱까지만, binary decode는 GameManager 재구성까지 포함")
+
+    assert all(encode_state(decode(static, state)) == state for static, state in snapshots), "스냅샷 왕복 결과가 다릅니다"
+    print("[bench_snapshot] 왕복 대조 OK")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,116 @@
+# benchmarks/bench_step.py
+
+"""
+step handler 처리량 벤치마크 (워커 하나, 액션/초). 메시지마다 Redis 명령을 하나씩 await하던 방식과
+STEP_BATCH개씩 꺼내 파이프라인 한 번으로 flush하는 방식을 비교한다.
+
+게임 로직과 메시지 직렬화는 servers.game_step_handler의 실제 코드(_handle_message, StepBatch)를 그대로 돌리고,
+Redis는 왕복 횟수만 세어 처리량 = 액션 수 / (CPU 시간 + 왕복 수 x RTT)로 계산한다.
+
+    python -m benchmarks.bench_step [액션 수] [RTT(ms)]
+"""
+
+import contextlib
+import io
+import json
+import random
+import sys
+from time import perf_counter, time
+
+import app.services.game_manager as game_manager
+from app.services.game_manager import GameManager
+from servers.registry import game_registry
+from servers.game_step_handler import StepBatch, STEP_BATCH, _handle_message
+
+GAMES = 200
+PLAYERS = 6
+
+
+def _new_games() -> list:
+    game_manager.save_game_result = lambda **kwargs: None
+    game_manager.append_hand_log = lambda record: None
+    game_registry.clear()
+    games = []
+    for g in range(GAMES):
+        gm = GameManager(f"00000000-0000-0000-0000-{g:012d}", "quick_play",
+                         [f"u{k}" for k in range(PLAYERS)], [f"p{k}" for k in range(PLAYERS)],
+                         [2000] * PLAYERS, sb=10, bb=20, seed=g)
+        gm.verbose = False
+        gm.wake()
+        game_registry[gm.game_id] = gm
+        games.append(gm)
+    return games
+
+
+def _wave(games: list, rng: random.Random) -> list:
+    # 진행 중인 게임마다 현재 차례 플레이어의 액션 하나
+    raws = []
+    for gm in games:
+        if gm.done:
+            continue
+        if gm.is_sleeping:
+            gm.wake()  # 라운드 사이 대기는 타임아웃 경로라 측정에서 뺀다
+        rm = gm.round
+        i = rm.get_current_player()
+        contributions = rm.get_contributions()
+        chips = rm.bm.chips[i]
+        to_call = max(contributions) - contributions[i]
+        x = rng.random()
+        if x < 0.2:
+            amt = 0
+        elif x < 0.9 or chips - to_call < rm.bm.min_raise_by:
+            amt = min(to_call, chips)
+        else:
+            amt = to_call + rm.bm.min_raise_by
+        raws.append(json.dumps({
+            "type": "action", "game_id": gm.game_id,
+            "player_id": gm.player_ids[gm.round_index_to_game_index[i]],
+            "amount": amt, "action_count": gm.action_count, "received_at": time(),
+        }))
+    return raws
+
+
+def _commands(batch: StepBatch) -> int:
+    return len(batch.changed) + len(batch.finished) + len(batch.forwards) + len(batch.outgoing)
+
+
+def _run(batch_size: int, actions: int, per_command: bool) -> tuple:
+    rng = random.Random(0)
+    games = _new_games()
+    log = lambda *args: None
+    done = round_trips = 0
+    cpu = 0.0
+    while done < actions:
+        raws = _wave(games, rng)
+        if not raws:
+            games = _new_games()
+            continue
+        start = perf_counter()
+        for k in range(0, len(raws), batch_size):
+            batch = StepBatch(0)
+            for raw in raws[k:k + batch_size]:
+                _handle_message(raw, json.loads(raw), batch, log)
+            # flush 직전까지의 실제 작업량: 명령 직렬화
+            batch.outgoing = [(channel, data.encode()) for channel, data in batch.outgoing]
+            round_trips += _commands(batch) if per_command else 1
+        cpu += perf_counter() - start
+        done += len(raws)
+    return done, cpu, round_trips
+
+
+def main(actions: int = 20000, rtt_ms: float = 0.2):
+    rtt = rtt_ms / 1000
+    print(f"[bench_step] 액션 {actions}개, 게임 {GAMES}개 x {PLAYERS}인, RTT {rtt_ms}ms")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = [
+            ("메시지별 await", *_run(1, actions, per_command=True)),
+            (f"배치 {STEP_BATCH} + 파이프라인", *_run(STEP_BATCH, actions, per_command=False)),
+        ]
+    for name, done, cpu, round_trips in results:
+        total = cpu + round_trips * rtt
+        print(f"{name:<22} 왕복 {round_trips:>7}회  CPU {cpu:6.2f}s  → {done / total:8,.0f} actions/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 0.2)
@@ -0,0 +1,86 @@
+# benchmarks/bench_timeout.py
+
+"""
+타임아웃 감지 벤치마크. 기존 폴링 루프(blpop 10ms + sleep 10ms)와 DeadlineScheduler의
+유휴 CPU 사용량, 타임아웃 발생 지연(데드라인 대비 늦은 정도)을 비교한다.
+폴링 쪽 blpop은 asyncio.sleep으로 대신하므로 Redis 왕복 비용은 빠져 있다 (실제보다 유리한 쪽).
+
+    python -m benchmarks.bench_timeout [데드라인 수]
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from sortedcontainers import SortedList
+
+from servers.game_timeout_detector import DeadlineScheduler
+
+IDLE_SECONDS = 2.0
+
+
+async def _polling_loop(entries: SortedList, fired: list, stop: asyncio.Event):
+    # game_timeout_detector_outdated의 루프 구조
+    while not stop.is_set():
+        await asyncio.sleep(0.01)  # blpop(queue, timeout=0.01) - 요청 없음
+        now = time.time()
+        while entries and entries[0][0] <= now:
+            deadline, _ = entries.pop(0)
+            fired.append(now - deadline)
+        await asyncio.sleep(0.01)
+
+
+async def _idle_cpu(kind: str) -> float:
+    stop = asyncio.Event()
+    if kind == "polling":
+        task = asyncio.create_task(_polling_loop(SortedList(), [], stop))
+    else:
+        scheduler = DeadlineScheduler(lambda game_id, action_count: None)
+        scheduler.arm("far", time.time() + 3600, 0)
+        task = asyncio.create_task(scheduler.run())
+    start = time.process_time()
+    await asyncio.sleep(IDLE_SECONDS)
+    used = time.process_time() - start
+    stop.set()
+    task.cancel()
+    return used / IDLE_SECONDS
+
+
+async def _lateness(kind: str, deadlines: list) -> list:
+    fired = []
+    stop = asyncio.Event()
+    if kind == "polling":
+        entries = SortedList((d, f"g{k}") for k, d in enumerate(deadlines))
+        task = asyncio.create_task(_polling_loop(entries, fired, stop))
+    else:
+        scheduler = DeadlineScheduler(lambda game_id, action_count: fired.append(time.time() - armed[game_id]))
+        armed = {}
+        task = asyncio.create_task(scheduler.run())
+        for k, d in enumerate(deadlines):
+            armed[f"g{k}"] = d
+            scheduler.arm(f"g{k}", d, 0)
+    while len(fired) < len(deadlines):
+        await asyncio.sleep(0.05)
+    stop.set()
+    task.cancel()
+    return sorted(fired)
+
+
+def _pct(values: list, p: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def main(count: int = 2000):
+    print(f"[bench_timeout] 유휴 {IDLE_SECONDS:.0f}s, 데드라인 {count}개 (2초 구간에 랜덤)")
+    for kind in ("polling", "scheduler"):
+        cpu = await _idle_cpu(kind)
+        rng = random.Random(0)
+        now = time.time()
+        late = await _lateness(kind, [now + 0.1 + rng.random() * 2.0 for _ in range(count)])
+        print(f"{kind:9}  유휴 CPU {cpu:6.2%}  지연 p50 {_pct(late, 0.5) * 1000:6.2f}ms  "
+              f"p99 {_pct(late, 0.99) * 1000:6.2f}ms  max {late[-1] * 1000:6.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,86 @@
+# benchmarks/bench_wheel.py
+
+"""
+데드라인 자료구조 벤치마크. 기존 (데드라인, game_id) SortedList + deadline dict 방식과
+TimingWheel의 예약/재예약/만료 처리 비용을 테이블 수별로 비교한다.
+시계는 가상 시각을 쓰므로 실제 대기 없이 자료구조 비용만 잰다.
+
+    테이블 N개를 데드라인 5~30초로 예약한 뒤, 매 스텝 가상 시각을 1ms씩 진행하면서
+    무작위 테이블 몇 개가 액션(재예약)하고, 만료된 테이블은 다음 턴으로 다시 예약한다.
+
+    python -m benchmarks.bench_wheel [스텝 수]
+"""
+
+import random
+import sys
+import time
+
+from sortedcontainers import SortedList
+
+from servers.timing_wheel import TimingWheel
+
+TABLE_COUNTS = (10_000, 100_000)
+ACTIONS_PER_STEP = 20
+TURN = (5.0, 30.0)
+
+
+class SortedListDeadlines:
+    # game_timeout_detector_outdated / 이전 DeadlineScheduler의 구조
+    def __init__(self, now: float):
+        self.entries = SortedList()
+        self.deadline = {}
+
+    def schedule(self, game_id: str, action_count: int, deadline: float):
+        old = self.deadline.get(game_id)
+        if old is not None:
+            self.entries.remove((old, game_id))
+        self.deadline[game_id] = deadline
+        self.entries.add((deadline, game_id))
+
+    def advance(self, now: float) -> list:
+        expired = []
+        while self.entries and self.entries[0][0] <= now:
+            _, game_id = self.entries.pop(0)
+            del self.deadline[game_id]
+            expired.append((game_id, 0))
+        return expired
+
+
+def _run(cls, n: int, steps: int, seed: int = 0) -> tuple:
+    rng = random.Random(seed)
+    now = 1_000_000.0
+    games = [f"g{k}" for k in range(n)]
+    action_count = dict.fromkeys(games, 0)
+    timers = cls(now)
+
+    start = time.perf_counter()
+    for game_id in games:
+        timers.schedule(game_id, 0, now + rng.uniform(*TURN))
+    arm_us = (time.perf_counter() - start) / n * 1e6
+
+    ops = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        now += 0.001
+        for game_id in rng.sample(games, ACTIONS_PER_STEP):
+            action_count[game_id] += 1
+            timers.schedule(game_id, action_count[game_id], now + rng.uniform(*TURN))
+        ops += ACTIONS_PER_STEP
+        for game_id, _ in timers.advance(now):
+            action_count[game_id] += 1
+            timers.schedule(game_id, action_count[game_id], now + rng.uniform(*TURN))
+            ops += 1
+    elapsed = time.perf_counter() - start
+    return arm_us, ops / elapsed, elapsed / ops * 1e6
+
+
+def main(steps: int = 5000):
+    print(f"[bench_wheel] 스텝 {steps}회 (1ms씩), 스텝당 액션 {ACTIONS_PER_STEP}개")
+    for n in TABLE_COUNTS:
+        for name, cls in (("sortedlist", SortedListDeadlines), ("wheel", TimingWheel)):
+            arm_us, ops, us = _run(cls, n, steps)
+            print(f"{n:>7}개 {name:<10} 최초 예약 {arm_us:5.2f}us  재예약+만료 {ops:>9,.0f} ops/s ({us:5.2f}us/op)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,66 @@
+# benchmarks/bench_wire.py
+
+"""
+메시지 인코딩 벤치마크. 메시지 종류별로 JSON과 MessagePack 위치 스키마(app/protocol/wire.py)의
+크기와 인코딩/디코딩 시간을 비교하고, 두 인코딩 모두 pydantic 모델로 되돌렸을 때 원래 메시지와 같은지 확인한다.
+
+실제 GameManager로 6인 테이블을 진행하며 나온 메시지를 쓴다.
+state_broadcast는 워커 → 웹소켓 노드, state_update는 노드가 플레이어별로 나눈 뒤 클라이언트로 가는 메시지다.
+
+    python -m benchmarks.bench_wire [액션 수]
+"""
+
+import json
+import sys
+import warnings
+from time import perf_counter
+
+from app.protocol import wire
+from app.protocol.message_models import StateMessage, StateBroadcastMessage, RoundResultMessage, GameEndMessage
+from app.services.messaging import expand_outgoing
+from benchmarks.bench_outbound import _play
+
+TABLES = 20
+MODELS = {
+    "state_broadcast": StateBroadcastMessage,
+    "state_update": StateMessage,
+    "round_result": RoundResultMessage,
+    "game_end": GameEndMessage,
+}
+
+
+def _time(fn, items) -> tuple:
+    start = perf_counter()
+    out = [fn(item) for item in items]
+    return out, (perf_counter() - start) / len(items) * 1e6
+
+
+def main(actions: int = 3000):
+    warnings.simplefilter("ignore")  # pydantic .json()/.dict() 폐기 예정 경고
+    print(f"[bench_wire] 테이블 {TABLES}개(6인), 액션 {actions}개")
+    by_type = {msg_type: [] for msg_type in MODELS}
+    for _, msg in _play(TABLES, actions):
+        payload = json.loads(msg.json())
+        by_type[msg.type].append(payload)
+        if msg.type == "state_broadcast":
+            by_type["state_update"] += [m for _, m in expand_outgoing(payload)]
+
+    print(f"{'종류':<16}{'건수':>7}  {'JSON 크기':>9} {'인코딩':>8} {'디코딩':>8}  {'msgpack 크기':>11} {'인코딩':>8} {'디코딩':>8}")
+    for msg_type, messages in by_type.items():
+        if not messages:
+            continue
+        model = MODELS[msg_type]
+        originals = [model(**m) for m in messages]
+        row = f"{msg_type:<16}{len(messages):>7}"
+        for encode, decode in ((json.dumps, json.loads), (wire.encode, wire.decode)):
+            encoded, encode_us = _time(encode, messages)
+            decoded, decode_us = _time(decode, encoded)
+            assert [model(**m) for m in decoded] == originals, f"{msg_type} 왕복 불일치"
+            size = sum(map(len, encoded)) / len(encoded)
+            row += f"  {size:>8.0f}B {encode_us:>6.2f}µs {decode_us:>6.2f}µs"
+        print(row)
+    print("확인 완료: JSON/msgpack 모두 pydantic 모델로 되돌린 결과 = 원래 메시지")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
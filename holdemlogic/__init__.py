@@ -1,13 +1,19 @@
 # holdemlogic/__init__.py
 
+# NumPy를 쓰는 모듈(batch, equity, parallel)과 simulator는 여기서 import하지 않는다.
+# 워커/웹소켓 프로세스가 import holdemlogic만으로 NumPy를 올리지 않도록 필요한 곳에서 서브모듈로 가져온다.
+#   from holdemlogic.equity import equity
+
 from .card import Card, Deck
 from .hand import Hand, HandRanking
+from .evaluator import evaluate, evaluate_codes
 from .bet_manager import BetManager
 from .round_manager import RoundManager
 
 __all__ = [
     "Card", "Deck",
     "Hand", "HandRanking",
+    "evaluate", "evaluate_codes",
     "BetManager",
-    "RoundManager"
+    "RoundManager",
 ]
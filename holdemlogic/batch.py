@@ -0,0 +1,115 @@
+# holdemlogic/batch.py
+
+"""
+NumPy 기반 배치 핸드 평가기.
+
+evaluator.py와 같은 테이블을 배열로 옮겨 수백만 핸드를 한 번에 평가한다.
+결과는 evaluate()/evaluate_codes()와 완전히 같은 정수 세기다.
+"""
+
+import numpy as np
+
+from .evaluator import _FLUSH_TABLE, _RANK_TABLE, _CODE_KEY, _CODE_BIT
+
+_FLUSH = np.array(_FLUSH_TABLE, dtype=np.int32)
+_CODE_KEY_NP = np.array(_CODE_KEY, dtype=np.int64)
+# 카드 코드 → 수트별 13비트 마스크를 한 정수에 모은 값 (suit * 13 + rank 번째 비트)
+_CODE_SUIT_BIT_NP = np.array(
+    [_CODE_BIT[code] << (13 * (code & 3)) for code in range(52)], dtype=np.int64
+)
+
+_LO_RANKS = 7                 # 랭크 키의 하위 7자리(2~8)와 상위 6자리(9~A)를 나눠 조회
+_LO_BASE = 5 ** _LO_RANKS
+
+
+def _build_dense_rank_table() -> tuple:
+    """
+    _RANK_TABLE은 키 공간이 희소(최대 ~1.7e9)하므로 배열 인덱스로 바로 쓸 수 없다.
+    랭크 키를 하위/상위 자릿수로 나눠 각각 조밀한 id로 바꾸고, 두 id의 장수 합이 7 이하인
+    조합만 이어 붙인 1차원 테이블을 만든다.
+        index = _LO_OFFSET[_LO_ID[key % 5^7]] + _HI_ID[key // 5^7]
+    """
+    def multisets(ranks: int) -> list:
+        # (장수, 키) 목록을 장수 오름차순으로
+        found = []
+
+        def fill(r: int, remaining: int, key: int, total: int):
+            if r == ranks:
+                found.append((total, key))
+                return
+            for c in range(min(4, remaining) + 1):
+                fill(r + 1, remaining - c, key + c * 5 ** r, total + c)
+
+        fill(0, 7, 0, 0)
+        return sorted(found)
+
+    lo = multisets(_LO_RANKS)
+    hi = multisets(13 - _LO_RANKS)
+
+    lo_id = np.zeros(_LO_BASE, dtype=np.int32)
+    hi_id = np.zeros(5 ** (13 - _LO_RANKS), dtype=np.int32)
+    hi_prefix = [0] * 8  # hi_prefix[c] = 장수 c 이하인 상위 조합 수
+    for h, (total, key) in enumerate(hi):
+        hi_id[key] = h
+        for c in range(total, 8):
+            hi_prefix[c] += 1
+
+    lo_offset = np.zeros(len(lo), dtype=np.int64)
+    values = []
+    for l, (total, key) in enumerate(lo):
+        lo_id[key] = l
+        lo_offset[l] = len(values)
+        for _, hi_key in hi[:hi_prefix[7 - total]]:
+            values.append(_RANK_TABLE.get(key + hi_key * _LO_BASE, 0))
+    return lo_id, hi_id, lo_offset, np.array(values, dtype=np.int32)
+
+
+_LO_ID, _HI_ID, _LO_OFFSET, _DENSE_RANK = _build_dense_rank_table()
+
+CHUNK = 1 << 18  # 임시 배열 메모리를 제한하기 위한 행 단위
+
+
+def _evaluate_chunk(codes: np.ndarray) -> np.ndarray:
+    # 서로 다른 카드의 비트는 겹치지 않으므로 합 == OR
+    suit_bits = _CODE_SUIT_BIT_NP[codes].sum(axis=1)
+    flush = _FLUSH[suit_bits & 0x1FFF]
+    for s in range(1, 4):
+        np.maximum(flush, _FLUSH[(suit_bits >> (13 * s)) & 0x1FFF], out=flush)
+
+    keys = _CODE_KEY_NP[codes].sum(axis=1)
+    hi, lo = np.divmod(keys, _LO_BASE)
+    ranked = _DENSE_RANK[_LO_OFFSET[_LO_ID[lo]] + _HI_ID[hi]]
+    return np.where(flush > 0, flush, ranked)
+
+
+def evaluate_batch(codes) -> np.ndarray:
+    """
+    (N, k) 카드 코드 배열(k = 5~7, 값 0~51)을 받아 (N,) int32 세기 배열을 반환한다.
+    """
+    codes = np.asarray(codes, dtype=np.uint8)
+    assert codes.ndim == 2 and 5 <= codes.shape[1] <= 7, f"(N, 5~7) 배열이 필요합니다: {codes.shape}"
+    out = np.empty(len(codes), dtype=np.int32)
+    for start in range(0, len(codes), CHUNK):
+        out[start:start + CHUNK] = _evaluate_chunk(codes[start:start + CHUNK])
+    return out
+
+
+def showdown_batch(hole, board) -> tuple:
+    """
+    hole: (N, players, 2), board: (N, 5) 카드 코드 배열.
+    Returns: (strengths (N, players) int32, winners (N, players) bool)
+    winners는 판마다 최고 세기를 가진 플레이어(공동 1등 포함) 마스크다.
+    """
+    hole = np.asarray(hole, dtype=np.uint8)
+    board = np.asarray(board, dtype=np.uint8)
+    assert hole.ndim == 3 and hole.shape[2] == 2, f"(N, players, 2) 배열이 필요합니다: {hole.shape}"
+    assert board.ndim == 2 and board.shape[0] == hole.shape[0], f"(N, 5) 배열이 필요합니다: {board.shape}"
+    n, players, _ = hole.shape
+
+    cards = np.concatenate([
+        hole,
+        np.broadcast_to(board[:, None, :], (n, players, board.shape[1])),
+    ], axis=2)
+    strengths = evaluate_batch(cards.reshape(n * players, -1)).reshape(n, players)
+    winners = strengths == strengths.max(axis=1, keepdims=True)
+    return strengths, winners
@@ -30,7 +30,21 @@ class BetManager:
         self.dead_raise = False
         self.action_cnt = [0 for _ in range(n)]
         self._force_blind_bets()
+        self._recount()
         self.debug = False
+
+
+    def _recount(self):
+        # 액션마다 갱신하는 집계값을 기본 상태로부터 다시 계산 (생성/복원 시에만 호출)
+        self.high_bet = max(self.contributions)  # 현재 최고 베팅액
+        self.active = self.folded.count(False)  # 폴드하지 않은 인원
+        self.can_act = sum(1 for i in range(self.n) if not self.folded[i] and self.chips[i] > 0)  # 폴드/올인 아닌 인원
+        # 이번 베팅라운드에 아직 행동해야 하는 플레이어
+        self.to_act = {
+            i for i in range(self.n)
+            if not self.folded[i] and self.chips[i] > 0
+            and (self.contributions[i] < self.high_bet or self.action_cnt[i] == 0)
+        }
     
     
     def _force_blind_bets(self):
@@ -56,29 +70,18 @@ class BetManager:
         
         
     def _find_next_player(self):
-        not_folded = 0
-        not_all_in = 0
-        for i in range(self.n):
-            if not self.folded[i]:
-                not_folded += 1
-                if self.chips[i] > 0:
-                    not_all_in += 1
-        if not_folded == 1: # 폴드로 인한 조기종료
+        if self.active == 1: # 폴드로 인한 조기종료
             if self.debug:
                 print("폴드로 인한 조기종료")
             self.finished = True
             return
-        if not_all_in == 0: # 올인으로 인한 조기종료
+        if self.can_act == 0: # 올인으로 인한 조기종료
             if self.debug:
                 print("올인으로 인한 조기종료")
             self.finished = True
             return
-        undone = []
-        for i in range(self.n):
-            if not self.folded[i] and self.chips[i] > 0 and (self.contributions[i] < max(self.contributions) or self.action_cnt[i] == 0):
-                undone.append(i)
-        if len(undone) > 0:
-            while self.folded[self.i] or self.chips[self.i] == 0 or (self.contributions[self.i] == max(self.contributions) and self.action_cnt[self.i] > 0):
+        if self.to_act:
+            while self.i not in self.to_act:
                 self.i += 1
                 self.i %= self.n
             return
@@ -92,14 +95,15 @@ class BetManager:
             if self.debug:
                 print(f"<{self.stages[self.stage]} 시작>")
             self.min_raise_by = self.bb
+            self.dead_raise = False
+            for i in range(self.n):
+                self.action_cnt[i] = 0
+            self.to_act = {i for i in range(self.n) if not self.folded[i] and self.chips[i] > 0}
             self.i = 1 if self.n == 2 else 0 # 헤즈업일경우 BB부터, 3인이상 SB부터
-            while self.folded[self.i] or self.chips[self.i] == 0:
+            while self.i not in self.to_act:
                 self.i += 1
                 self.i %= self.n
-            self.dead_raise = False
-            for i in range(self.n):
-                self.action_cnt[i] = 0            
-            if not_all_in == 1:
+            if self.can_act == 1:
                 if self.debug:
                     print("올인으로 인한 조기종료")
                 self.finished = True
@@ -117,31 +121,39 @@ class BetManager:
     def _apply_amt(self, amt):
         assert amt >= 0, "음수 베팅 불가"
         assert self.chips[self.i] >= amt, "가진 칩보다 많이 베팅 불가"
+        i = self.i
         if amt == 0:
-            if self.contributions[self.i] < max(self.contributions): # 폴드
+            if self.contributions[i] < self.high_bet: # 폴드
                 if self.debug:
                     print("폴드")
-                self.folded[self.i] = True
+                self.folded[i] = True
+                self.active -= 1
+                if self.chips[i] > 0:
+                    self.can_act -= 1
+                self.to_act.discard(i)
                 return
             else: # 체크
                 if self.debug:
                     print("체크")
-                self.action_cnt[self.i] += 1
+                self.action_cnt[i] += 1
+                self.to_act.discard(i)
                 return
-        to_call = max(self.contributions) - self.contributions[self.i]
+        to_call = self.high_bet - self.contributions[i]
         if amt == to_call: # 콜
             if self.debug:
                 print("콜")
-            self.contributions[self.i] += amt
-            self.chips[self.i] -= amt
-            self.action_cnt[self.i] += 1
+            self.contributions[i] += amt
+            self.chips[i] -= amt
+            self.action_cnt[i] += 1
+            self._after_bet(i)
             return
         if amt < to_call: #올인콜
             if self.debug:
                 print("올인콜")
-            assert amt == self.chips[self.i], f"{amt}는 콜하기 위한 최소 칩({to_call}) 보다 적습니다"
-            self.contributions[self.i] += amt
-            self.chips[self.i] = 0
+            assert amt == self.chips[i], f"{amt}는 콜하기 위한 최소 칩({to_call}) 보다 적습니다"
+            self.contributions[i] += amt
+            self.chips[i] = 0
+            self._after_bet(i)
             return
         # 레이즈/벳
         assert not self.dead_raise, "이미 데드레이즈가 있는 베팅라운드에서는 더이상 레이즈할 수 없습니다"
@@ -150,19 +162,32 @@ class BetManager:
             if self.debug:
                 print("풀레이즈")
             self.min_raise_by = max(raise_by, self.min_raise_by)
-            self.contributions[self.i] += amt
-            self.chips[self.i] -= amt
-            self.action_cnt[self.i] += 1
+            self.contributions[i] += amt
+            self.chips[i] -= amt
+            self.action_cnt[i] += 1
+            self.high_bet = self.contributions[i]
+            # 레이즈에 응답해야 하는 플레이어 다시 추가
+            for j in range(self.n):
+                if j != i and not self.folded[j] and self.chips[j] > 0:
+                    self.to_act.add(j)
+            self._after_bet(i)
             return
         else: # 데드레이즈(올인)
             assert False, f"데드레이즈는 허용되지 않습니다."
             if self.debug:
                 print("데드레이즈")
-            assert amt == self.chips[self.i], f"{amt}는 레이즈하기 위한 최소배팅({self.min_raise_by + to_call})보다 적습니다"
-            self.contributions[self.i] += amt
-            self.chips[self.i] = 0
+            assert amt == self.chips[i], f"{amt}는 레이즈하기 위한 최소배팅({self.min_raise_by + to_call})보다 적습니다"
+            self.contributions[i] += amt
+            self.chips[i] = 0
             self.dead_raise = True
             return
+
+
+    def _after_bet(self, i):
+        # 콜/올인콜/레이즈 후 집계 갱신
+        self.to_act.discard(i)
+        if self.chips[i] == 0:
+            self.can_act -= 1
         
     def _current_state(self):
         return f"[{self.stages[self.stage]}/{self.positions[self.i]}] bets: {self.contributions}   chips: {self.chips}   folded: {self.folded}   act cnt: {self.action_cnt}"
@@ -1,10 +1,22 @@
 # holdemlogic/card.py
 
 class Card:
+    """
+    카드는 0~51 정수 코드로 표현한다. code = rank_index * 4 + suit_index
+    52장 모두 모듈 로드 시 한 번만 만들어지고(intern), Card(...)는 항상 같은 객체를 돌려준다.
+    """
     SUITS = ['♠', '♥', '♦', '♣']  # 스페이드, 하트, 다이아, 클로버
     RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']  # T는 10
 
-    def __init__(self, suit: str, rank: str):
+    __slots__ = ("code",)
+
+    # 코드 → 값 조회용 튜플 (아래에서 채움)
+    RANK_OF = ()
+    SUIT_OF = ()
+    REPRS = ()
+    _interned = ()
+
+    def __new__(cls, suit: str, rank: str):
         if suit in ['S', 'H', 'D', 'C']:
             suit = ['♠', '♥', '♦', '♣'][['S', 'H', 'D', 'C'].index(suit)]
         if suit in ['s', 'h', 'd', 'c']:
@@ -15,48 +27,124 @@ class Card:
             rank = rank.upper()
         assert suit in Card.SUITS, f"Invalid suit: {suit}"
         assert rank in Card.RANKS, f"Invalid rank: {rank}"
-        self.suit = suit
-        self.rank = rank
+        return Card._interned[Card.RANKS.index(rank) * 4 + Card.SUITS.index(suit)]
+
+    @staticmethod
+    def from_code(code: int) -> "Card":
+        return Card._interned[code]
+
+    @property
+    def rank(self) -> str:
+        return Card.RANKS[Card.RANK_OF[self.code]]
+
+    @property
+    def suit(self) -> str:
+        return Card.SUITS[Card.SUIT_OF[self.code]]
 
     def __repr__(self):
-        return f"{self.rank}{self.suit}"
+        return Card.REPRS[self.code]
 
     def rank_value(self):
         # 숫자 비교용 값
-        return Card.RANKS.index(self.rank)
+        return Card.RANK_OF[self.code]
 
     def __lt__(self, other):
-        return self.rank_value() < other.rank_value()
+        return Card.RANK_OF[self.code] < Card.RANK_OF[other.code]
 
     def __eq__(self, other):
-        return self.rank == other.rank and self.suit == other.suit
+        return isinstance(other, Card) and self.code == other.code
+
+    def __hash__(self):
+        return self.code
+
+    def __reduce__(self):
+        # pickle 후에도 intern된 객체를 유지
+        return (Card.from_code, (self.code,))
+
+
+def _intern_cards():
+    cards = []
+    for code in range(52):
+        card = object.__new__(Card)
+        card.code = code
+        cards.append(card)
+    Card.RANK_OF = tuple(code >> 2 for code in range(52))
+    Card.SUIT_OF = tuple(code & 3 for code in range(52))
+    Card.REPRS = tuple(f"{Card.RANKS[code >> 2]}{Card.SUITS[code & 3]}" for code in range(52))
+    Card._interned = tuple(cards)
+
+
+_intern_cards()
+CARDS = Card._interned
 
 
 
 
 import random
+import hashlib
+
+def derive_seed(seed: int, *keys) -> int:
+    """
+    게임 시드와 키(라운드 번호 등)로 64비트 하위 시드를 만든다.
+    Python 버전/프로세스와 무관하게 항상 같은 값이 나온다.
+    """
+    text = ":".join(str(x) for x in (seed,) + keys)
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+
 
 class Deck:
-    def __init__(self):
-        self.cards = [Card(suit, rank) for suit in Card.SUITS for rank in Card.RANKS]
-        self.shuffle()
+    """
+    생성 시 한 번 섞어 두고 커서를 앞으로 옮기며 딜링한다. draw()는 O(1).
+    덱마다 자체 RNG를 쓰므로 같은 seed면 같은 순서로 딜링된다 (감사/재현용).
+    order(카드 코드 목록)를 주면 섞지 않고 그 순서대로 딜링한다 (리플레이용).
+    내부에는 카드 코드만 들고 있고, draw()가 돌려줄 때만 intern된 Card로 바꾼다.
+    """
+    def __init__(self, seed: int = None, order: list = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.pos = 0
+        if order is not None:
+            assert sorted(order) == list(range(52)), "덱 순서가 올바르지 않습니다"
+            self.order = list(order)
+        else:
+            self.order = list(range(52))
+            self.shuffle()
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        # 남은 카드만 다시 섞는다
+        rest = self.order[self.pos:]
+        self.rng.shuffle(rest)
+        self.order[self.pos:] = rest
+
+    def draw_codes(self, count=1) -> list:
+        # 카드 코드 count개를 리스트로 뽑는다 (RoundManager 딜링용)
+        assert 52 - self.pos >= count, "Not enough cards left in the deck"
+        assert count > 0
+        picked = self.order[self.pos:self.pos + count]
+        self.pos += count
+        return picked
 
     def draw(self, count=1):
-        assert len(self.cards) >= count, "Not enough cards left in the deck"
+        assert 52 - self.pos >= count, "Not enough cards left in the deck"
         assert count > 0
         if count > 1:
-            picked = random.sample(self.cards, count)
-            self.cards = [x for x in self.cards if x not in picked]
+            picked = [CARDS[code] for code in self.order[self.pos:self.pos + count]]
+            self.pos += count
             return picked
-            
+
         else:
-            picked = random.choice(self.cards)
-            self.cards.remove(picked)
+            picked = CARDS[self.order[self.pos]]
+            self.pos += 1
             return picked
 
-    def __len__(self):
-        return len(self.cards)
+    @property
+    def cards(self) -> list:
+        # 남은 카드 (딜링 순서대로)
+        return [CARDS[code] for code in self.order[self.pos:]]
 
+    def codes(self) -> list:
+        # 전체 딜링 순서의 카드 코드 (감사 기록용)
+        return self.order[:]
+
+    def __len__(self):
+        return 52 - self.pos
@@ -0,0 +1,143 @@
+# holdemlogic/equity.py
+
+"""
+팟 에퀴티 계산기.
+
+남은 런아웃 수가 exact_limit 이하(턴/리버, 대부분의 플랍)면 모두 열거해 정확한 값을,
+그보다 많으면(프리플랍 등) 시드 고정 몬테카를로로 목표 오차 안에 들어올 때까지 샘플링한다.
+"""
+
+from itertools import combinations
+from math import comb, sqrt
+
+import numpy as np
+
+from .batch import showdown_batch
+
+EXACT_LIMIT = 20000     # 이 이하의 런아웃은 전수 열거
+BATCH = 4096            # 몬테카를로 한 번에 뽑는 런아웃 수
+MAX_SAMPLES = 1 << 20
+Z = 1.96                # 95% 신뢰구간
+
+
+class EquityResult:
+    def __init__(self, equities: list, win: list, tie: list, samples: int, exact: bool, margin: float):
+        self.equities = equities    # 팟 지분 기대값 (무승부는 나눠 가짐)
+        self.win = win              # 단독 승리 확률
+        self.tie = tie              # 공동 승리 확률
+        self.samples = samples      # 평가한 런아웃 수
+        self.exact = exact          # 전수 열거 여부
+        self.margin = margin        # 에퀴티 95% 신뢰구간 반폭 (exact면 0)
+
+    def __repr__(self):
+        eq = ", ".join(f"{e:.4f}" for e in self.equities)
+        mode = "exact" if self.exact else f"±{self.margin:.4f}"
+        return f"EquityResult([{eq}], samples={self.samples}, {mode})"
+
+
+def _code(card) -> int:
+    return card if isinstance(card, (int, np.integer)) else card.code
+
+
+def _shares(holes: np.ndarray, board: np.ndarray, runouts: np.ndarray) -> tuple:
+    # runouts: (N, 5 - len(board)) → 플레이어별 (지분, 단독승, 공동승) 배열
+    n = len(runouts)
+    boards = np.concatenate([np.broadcast_to(board, (n, len(board))), runouts], axis=1)
+    _, winners = showdown_batch(np.broadcast_to(holes, (n,) + holes.shape), boards)
+    counts = winners.sum(axis=1, keepdims=True)
+    shares = winners / counts
+    sole = winners & (counts == 1)
+    return shares, sole, winners & ~sole
+
+
+def chunk_sums(holes: np.ndarray, board: np.ndarray, runouts: np.ndarray) -> np.ndarray:
+    """
+    런아웃 묶음 하나의 합계. (4, players): 지분 합, 지분 제곱 합, 단독승 수, 공동승 수
+    청크 단위 합계를 순서대로 더하면 전체 결과가 되므로 병렬 실행(parallel.py)에서도 쓴다.
+    """
+    shares, sole, tied = _shares(holes, board, runouts)
+    return np.stack([shares.sum(axis=0), (shares * shares).sum(axis=0), sole.sum(axis=0), tied.sum(axis=0)])
+
+
+def sample_chunk_sums(holes: np.ndarray, board: np.ndarray, remaining: np.ndarray, n: int, seed) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    missing = 5 - len(board)
+    picked = np.argpartition(rng.random((n, len(remaining))), missing, axis=1)[:, :missing]
+    return chunk_sums(holes, board, remaining[picked])
+
+
+def all_runouts(board: np.ndarray, remaining: np.ndarray) -> np.ndarray:
+    missing = 5 - len(board)
+    if not missing:
+        return np.empty((1, 0), dtype=np.uint8)
+    return np.array(list(combinations(remaining.tolist(), missing)), dtype=np.uint8)
+
+
+def chunk_seeds(seed, count: int) -> list:
+    # 청크별 독립 시드. 같은 seed면 청크 k의 시드는 항상 같다
+    return np.random.SeedSequence(seed).spawn(count)
+
+
+def margin_of(sums: np.ndarray, samples: int) -> float:
+    mean = sums[0] / samples
+    var = np.maximum(sums[1] / samples - mean * mean, 0.0)
+    return float(Z * sqrt(var.max() / samples))
+
+
+def to_result(sums: np.ndarray, samples: int, exact: bool) -> EquityResult:
+    return EquityResult(
+        equities=(sums[0] / samples).tolist(),
+        win=(sums[2] / samples).tolist(),
+        tie=(sums[3] / samples).tolist(),
+        samples=samples,
+        exact=exact,
+        margin=0.0 if exact else margin_of(sums, samples),
+    )
+
+
+def prepare(holes, board=(), dead=()) -> tuple:
+    """
+    입력 검증 후 (holes, board, remaining) 카드 코드 배열을 반환한다.
+    """
+    holes = [[_code(c) for c in hole] for hole in holes]
+    board = [_code(c) for c in board]
+    dead = [_code(c) for c in dead]
+    assert 2 <= len(holes) <= 8, "플레이어는 2~8명이어야 합니다"
+    assert all(len(hole) == 2 for hole in holes), "홀카드는 2장이어야 합니다"
+    assert len(board) in (0, 3, 4, 5), "보드는 0/3/4/5장이어야 합니다"
+    used = [c for hole in holes for c in hole] + board + dead
+    assert len(set(used)) == len(used), "중복된 카드가 있습니다"
+    remaining = np.array([c for c in range(52) if c not in set(used)], dtype=np.uint8)
+    return np.array(holes, dtype=np.uint8), np.array(board, dtype=np.uint8), remaining
+
+
+def is_exact(board: np.ndarray, remaining: np.ndarray, exact_limit: int) -> bool:
+    return comb(len(remaining), 5 - len(board)) <= exact_limit
+
+
+def equity(holes, board=(), dead=(), error: float = 0.005, seed=None,
+           exact_limit: int = EXACT_LIMIT, max_samples: int = MAX_SAMPLES) -> EquityResult:
+    """
+    holes: 플레이어별 홀카드 2장 (Card 또는 카드 코드), 2~8명
+    board: 0/3/4/5장의 보드 카드
+    dead : 덱에서 빠진 것으로 볼 카드 (폴드된 공개 카드 등)
+    error: 몬테카를로 모드에서 허용하는 에퀴티 오차 (95% 신뢰구간 반폭, 0이면 max_samples까지)
+    seed : 몬테카를로 난수 시드 (같은 시드면 같은 결과, parallel_equity와도 같다)
+    """
+    holes, board, remaining = prepare(holes, board, dead)
+    if is_exact(board, remaining, exact_limit):
+        runouts = all_runouts(board, remaining)
+        sums = sum(chunk_sums(holes, board, runouts[k:k + BATCH]) for k in range(0, len(runouts), BATCH))
+        return to_result(sums, len(runouts), exact=True)
+
+    chunks = -(-max_samples // BATCH)
+    seeds = chunk_seeds(seed, chunks)
+    sums = 0
+    samples = 0
+    for k in range(chunks):
+        n = min(BATCH, max_samples - samples)
+        sums = sums + sample_chunk_sums(holes, board, remaining, n, seeds[k])
+        samples += n
+        if margin_of(sums, samples) <= error:
+            break
+    return to_result(sums, samples, exact=False)
@@ -0,0 +1,222 @@
+# holdemlogic/evaluator.py
+
+"""
+룩업 테이블 기반 핸드 평가기.
+
+5~7장의 카드를 하나의 정수 세기(strength)로 바꾼다. 값이 클수록 강한 핸드이며
+두 핸드의 비교는 정수 비교 한 번으로 끝난다.
+
+    strength = (category << 20) | (r1 << 16) | (r2 << 12) | (r3 << 8) | (r4 << 4) | r5
+
+    category: Hand.RANK_ORDER 인덱스 (0: High Card ... 9: Royal Flush)
+    r1..r5  : 비교 순서대로 나열한 랭크 인덱스 (2 → 0, ..., A → 12)
+
+테이블은 두 개다.
+    _FLUSH_TABLE: 한 수트의 13비트 랭크 마스크 → 플러시/스트레이트 플러시 세기 (5장 미만이면 0)
+    _RANK_TABLE : 랭크 구성(각 랭크 장수를 5진수 자릿수로 더한 키) → 플러시가 아닐 때의 세기
+7장 이하에서는 플러시가 성립하면 풀하우스/포카드가 동시에 나올 수 없으므로
+플러시 테이블에서 값이 나오면 그대로 반환한다.
+
+랭크 테이블 생성은 0.5초쯤 걸리므로 처음 만든 테이블을 __pycache__에 marshal로 저장해 두고
+이후 import에서는 읽기만 한다. 이 파일이 바뀌면 캐시 이름이 달라져 다시 만든다.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+from .card import Card
+
+HIGH_CARD = 0
+ONE_PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+ROYAL_FLUSH = 9
+
+CATEGORY_SHIFT = 20
+
+_RANK_KEY = [5 ** r for r in range(13)]
+# 카드 코드 → 랭크 키 / 랭크 비트
+_CODE_KEY = tuple(_RANK_KEY[Card.RANK_OF[code]] for code in range(52))
+_CODE_BIT = tuple(1 << Card.RANK_OF[code] for code in range(52))
+_WHEEL = (1 << 12) | 0b1111  # A-2-3-4-5
+
+
+def _pack(category: int, ranks: list) -> int:
+    strength = category
+    for k in range(5):
+        strength = (strength << 4) | (ranks[k] if k < len(ranks) else 0)
+    return strength
+
+
+def category_of(strength: int) -> int:
+    return strength >> CATEGORY_SHIFT
+
+
+def ranks_of(strength: int) -> list:
+    # strength에 담긴 r1..r5를 꺼낸다
+    return [(strength >> shift) & 0xF for shift in (16, 12, 8, 4, 0)]
+
+
+def _build_straight_table() -> list:
+    table = [-1] * 8192
+    for mask in range(8192):
+        for top in range(12, 3, -1):
+            window = 0b11111 << (top - 4)
+            if mask & window == window:
+                table[mask] = top
+                break
+        else:
+            if mask & _WHEEL == _WHEEL:
+                table[mask] = 3  # 5-high 스트레이트
+    return table
+
+
+_STRAIGHT_TOP = None  # 13비트 랭크 마스크 → 스트레이트 최고 랭크 (-1: 없음). 테이블을 만들 때만 채운다
+
+
+def _build_flush_table() -> list:
+    table = [0] * 8192
+    for mask in range(8192):
+        if bin(mask).count("1") < 5:
+            continue
+        top = _STRAIGHT_TOP[mask]
+        if top == 12:
+            table[mask] = _pack(ROYAL_FLUSH, [top])
+        elif top >= 0:
+            table[mask] = _pack(STRAIGHT_FLUSH, [top])
+        else:
+            ranks = [r for r in range(12, -1, -1) if mask >> r & 1]
+            table[mask] = _pack(FLUSH, ranks[:5])
+    return table
+
+
+def _strength_from_counts(counts: list) -> int:
+    present = [r for r in range(12, -1, -1) if counts[r]]
+    quads = [r for r in present if counts[r] == 4]
+    trips = [r for r in present if counts[r] == 3]
+    pairs = [r for r in present if counts[r] == 2]
+
+    if quads:
+        q = quads[0]
+        return _pack(FOUR_OF_A_KIND, [q, next(r for r in present if r != q)])
+    if trips and (len(trips) > 1 or pairs):
+        t = trips[0]
+        return _pack(FULL_HOUSE, [t, max(trips[1:] + pairs)])
+
+    mask = 0
+    for r in present:
+        mask |= 1 << r
+    top = _STRAIGHT_TOP[mask]
+    if top >= 0:
+        return _pack(STRAIGHT, [top])
+
+    if trips:
+        t = trips[0]
+        return _pack(THREE_OF_A_KIND, [t] + [r for r in present if r != t][:2])
+    if len(pairs) >= 2:
+        p1, p2 = pairs[0], pairs[1]
+        return _pack(TWO_PAIR, [p1, p2] + [r for r in present if r != p1 and r != p2][:1])
+    if pairs:
+        p = pairs[0]
+        return _pack(ONE_PAIR, [p] + [r for r in present if r != p][:3])
+    return _pack(HIGH_CARD, present[:5])
+
+
+def _build_rank_table() -> dict:
+    # 5~7장으로 만들 수 있는 모든 랭크 구성(랭크당 최대 4장)을 열거
+    table = {}
+    counts = [0] * 13
+
+    def fill(start: int, remaining: int, key: int):
+        if remaining <= 2:
+            table[key] = _strength_from_counts(counts)
+        for r in range(start, 13):
+            for c in range(1, min(4, remaining) + 1):
+                counts[r] = c
+                fill(r + 1, remaining - c, key + c * _RANK_KEY[r])
+            counts[r] = 0
+
+    fill(0, 7, 0)
+    return table
+
+
+def _build_tables() -> tuple:
+    global _STRAIGHT_TOP
+    _STRAIGHT_TOP = _build_straight_table()
+    return _build_flush_table(), _build_rank_table()
+
+
+def _cache_path() -> str:
+    # 파이썬 버전(marshal 형식)과 이 파일 내용(테이블 정의)이 같을 때만 같은 캐시를 쓴다
+    with open(__file__, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    return os.path.join(os.path.dirname(__file__), "__pycache__",
+                        f"evaluator_tables.{sys.implementation.cache_tag}.{digest}.marshal")
+
+
+def _load_tables() -> tuple:
+    # (_FLUSH_TABLE, _RANK_TABLE) - 캐시가 있으면 읽고, 없으면 만들어서 저장한다
+    try:
+        path = _cache_path()
+    except OSError:
+        return _build_tables()
+    try:
+        with open(path, "rb") as f:
+            flush, rank = marshal.loads(f.read())  # 파일 객체에서 바로 marshal.load하면 몇 배 느리다
+        return flush, rank
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    tables = _build_tables()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"  # 여러 프로세스가 동시에 만들어도 완성된 파일만 보이게
+        with open(tmp, "wb") as f:
+            marshal.dump(tables, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # 읽기 전용 설치 등 - 캐시 없이 매번 만든다
+    return tables
+
+
+_FLUSH_TABLE, _RANK_TABLE = _load_tables()
+
+
+def evaluate(cards) -> int:
+    """
+    5~7장의 Card를 받아 정수 세기를 반환한다.
+    """
+    key = 0
+    masks = [0, 0, 0, 0]
+    for c in cards:
+        code = c.code
+        key += _CODE_KEY[code]
+        masks[code & 3] |= _CODE_BIT[code]
+    for mask in masks:
+        strength = _FLUSH_TABLE[mask]
+        if strength:
+            return strength
+    return _RANK_TABLE[key]
+
+
+def evaluate_codes(codes) -> int:
+    """
+    evaluate()와 같지만 카드 코드(0~51) 정수열을 받는다.
+    """
+    key = 0
+    masks = [0, 0, 0, 0]
+    for code in codes:
+        key += _CODE_KEY[code]
+        masks[code & 3] |= _CODE_BIT[code]
+    for mask in masks:
+        strength = _FLUSH_TABLE[mask]
+        if strength:
+            return strength
+    return _RANK_TABLE[key]
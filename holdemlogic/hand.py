@@ -1,8 +1,11 @@
 # holdemlogic/hand.py
 
-from collections import Counter
-from itertools import combinations
 from .card import Card, Deck
+from .evaluator import (
+    evaluate, category_of, ranks_of,
+    STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH,
+    THREE_OF_A_KIND, TWO_PAIR, ONE_PAIR,
+)
 
 class Hand:
     RANK_ORDER = [
@@ -12,74 +15,61 @@ class Hand:
 
     def __init__(self, cards: list):
         self.cards = cards
-        self.rank, self.best_hand = self.evaluate_hand()
-    
+        self.strength = evaluate(cards)
+        self.rank = category_of(self.strength)
+        self._best_hand = None
+
     def __str__(self):
         card_str = [str(c) for c in self.best_hand]
         return f"[{', '.join(card_str)}] → {Hand.RANK_ORDER[self.rank]}"
 
+    @property
+    def best_hand(self) -> list:
+        # 표시용이므로 필요할 때만 계산
+        if self._best_hand is None:
+            self._best_hand = self._pick_best_five()
+        return self._best_hand
 
     def evaluate_hand(self) -> tuple:
-        best_rank = -1
-        best_hand = None
-        for combo in combinations(self.cards, 5):
-            rank = self.classify_hand(combo)
-            if best_rank < rank or (best_rank == rank and self.compare_kickers(combo, best_hand) > 0):
-                best_rank = rank
-                best_hand = combo
-        return best_rank, sorted(best_hand, key=lambda c: c.rank_value(), reverse=True)
-
-    def classify_hand(self, cards: tuple) -> int:
-        suits = [c.suit for c in cards]
-        ranks = sorted([c.rank for c in cards], key=lambda r: "23456789TJQKA".index(r), reverse=True)
-        rank_counts = Counter(ranks)
-        count_values = sorted(rank_counts.values(), reverse=True)
-        is_flush = len(set(suits)) == 1
-
-        rank_indexes = sorted(["23456789TJQKA".index(r) for r in set(ranks)], reverse=True)
-        is_straight = len(rank_indexes) >= 5 and all(
-            rank_indexes[i] - 1 == rank_indexes[i + 1] for i in range(4)
-        )
-
-        if is_flush and set(ranks) >= set(['T', 'J', 'Q', 'K', 'A']):
-            return 9  # Royal Flush
-        if is_flush and is_straight:
-            return 8  # Straight Flush
-        if count_values == [4, 1]:
-            return 7  # Four of a Kind
-        if count_values == [3, 2]:
-            return 6  # Full House
-        if is_flush:
-            return 5  # Flush
-        if is_straight:
-            return 4  # Straight
-        if count_values == [3, 1, 1]:
-            return 3  # Three of a Kind
-        if count_values == [2, 2, 1]:
-            return 2  # Two Pair
-        if count_values == [2, 1, 1, 1]:
-            return 1  # One Pair
-        return 0  # High Card
-
-    def compare_kickers(self, hand1, hand2) -> int:
-        if not hand2:
-            return 1
-        h1 = sorted(hand1, key=lambda c: c.rank_value(), reverse=True)
-        h2 = sorted(hand2, key=lambda c: c.rank_value(), reverse=True)
-        for c1, c2 in zip(h1, h2):
-            if c1.rank_value() > c2.rank_value():
-                return 1
-            elif c1.rank_value() < c2.rank_value():
-                return -1
-        return 0
+        return self.rank, self.best_hand
+
+    def _pick_best_five(self) -> list:
+        ranks = ranks_of(self.strength)
+        if self.rank in (STRAIGHT, STRAIGHT_FLUSH, ROYAL_FLUSH):
+            top = ranks[0]
+            needed = [(top - k, 1) for k in range(4)] + [(top - 4 if top > 3 else 12, 1)]  # 5-high는 A가 마지막
+        elif self.rank == FOUR_OF_A_KIND:
+            needed = [(ranks[0], 4), (ranks[1], 1)]
+        elif self.rank == FULL_HOUSE:
+            needed = [(ranks[0], 3), (ranks[1], 2)]
+        elif self.rank == THREE_OF_A_KIND:
+            needed = [(ranks[0], 3), (ranks[1], 1), (ranks[2], 1)]
+        elif self.rank == TWO_PAIR:
+            needed = [(ranks[0], 2), (ranks[1], 2), (ranks[2], 1)]
+        elif self.rank == ONE_PAIR:
+            needed = [(ranks[0], 2), (ranks[1], 1), (ranks[2], 1), (ranks[3], 1)]
+        else:
+            needed = [(r, 1) for r in ranks]
+
+        pool = self.cards
+        if self.rank in (FLUSH, STRAIGHT_FLUSH, ROYAL_FLUSH):
+            suits = [Card.SUIT_OF[c.code] for c in self.cards]
+            flush_suit = max(range(4), key=suits.count)
+            pool = [c for c in self.cards if Card.SUIT_OF[c.code] == flush_suit]
+
+        picked = []
+        for rank, count in needed:
+            picked += [c for c in pool if Card.RANK_OF[c.code] == rank][:count]
+        return sorted(picked, key=lambda c: c.code, reverse=True)
+
+    def __int__(self):
+        return self.strength
 
     def __lt__(self, other):
-        if self.rank != other.rank:
-            return self.rank < other.rank
-        return self.compare_kickers(self.best_hand, other.best_hand) < 0
+        return self.strength < other.strength
 
     def __eq__(self, other):
-        return self.rank == other.rank and self.compare_kickers(self.best_hand, other.best_hand) == 0
+        return self.strength == other.strength
 
     def __repr__(self):
         return f"{Hand.RANK_ORDER[self.rank]}: {self.best_hand}"
@@ -89,21 +79,24 @@ class HandRanking:
     @staticmethod
     def rank_players(player_hands: dict) -> list:
         """
-        플레이어 ID와 Hand 객체 딕셔너리를 받아 등수 그룹별로 나눈다.
+        플레이어 ID와 Hand 객체(또는 evaluate()의 정수 세기) 딕셔너리를 받아 등수 그룹별로 나눈다.
         Returns: list[list[player_id]] 형태 (ex. [["A"], ["B", "C"], ["D"]])
         """
-        sorted_entries = sorted(player_hands.items(), key=lambda x: x[1], reverse=True)
+        sorted_entries = sorted(
+            ((pid, int(hand)) for pid, hand in player_hands.items()),
+            key=lambda x: x[1], reverse=True
+        )
         grouped = []
         current_group = [sorted_entries[0][0]]
-        current_hand = sorted_entries[0][1]
+        current_strength = sorted_entries[0][1]
 
-        for pid, hand in sorted_entries[1:]:
-            if hand == current_hand:
+        for pid, strength in sorted_entries[1:]:
+            if strength == current_strength:
                 current_group.append(pid)
             else:
                 grouped.append(current_group)
                 current_group = [pid]
-                current_hand = hand
+                current_strength = strength
         grouped.append(current_group)
         return grouped
 
@@ -0,0 +1,105 @@
+# holdemlogic/parallel.py
+
+"""
+멀티코어 실행 계층.
+
+프로세스 풀은 프로세스당 한 번만 만들어 재사용한다(get_pool). 작업은 풀 크기와 무관하게
+고정된 청크로 나누고 청크마다 정해진 시드를 쓰며, 결과는 항상 청크 순서대로 합친다.
+따라서 같은 seed라면 워커 수가 몇이든(직렬 equity()와도) 결과가 같다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .equity import (
+    BATCH, EXACT_LIMIT, MAX_SAMPLES, EquityResult,
+    prepare, is_exact, all_runouts, chunk_seeds, chunk_sums, sample_chunk_sums, margin_of, to_result,
+)
+
+_pools: dict = {}  # workers → ProcessPoolExecutor
+
+
+def resolve_workers(workers: int = None) -> int:
+    # 풀 크기 (None이면 CPU 수)
+    return workers or os.cpu_count() or 1
+
+
+def get_pool(workers: int = None) -> ProcessPoolExecutor:
+    workers = resolve_workers(workers)
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        _pools[workers] = pool
+    return pool
+
+
+def shutdown_pools():
+    for pool in _pools.values():
+        pool.shutdown(cancel_futures=True)
+    _pools.clear()
+
+
+def run_chunks(fn, chunk_args: list, workers: int = None, window: int = None, stop=None) -> list:
+    """
+    chunk_args의 각 인자 튜플로 fn을 풀에서 실행하고 결과를 청크 순서대로 반환한다.
+    window개까지만 미리 제출하며, stop(결과)이 True를 반환하면 그 청크까지의 결과만 반환하고
+    아직 시작되지 않은 청크는 취소한다.
+    """
+    workers = resolve_workers(workers)
+    pool = get_pool(workers)
+    window = window or workers * 2
+    pending = []
+    results = []
+    next_chunk = 0
+    try:
+        while next_chunk < len(chunk_args) or pending:
+            while next_chunk < len(chunk_args) and len(pending) < window:
+                pending.append(pool.submit(fn, *chunk_args[next_chunk]))
+                next_chunk += 1
+            result = pending.pop(0).result()
+            results.append(result)
+            if stop is not None and stop(result):
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+    return results
+
+
+def parallel_equity(holes, board=(), dead=(), error: float = 0.005, seed=None,
+                    exact_limit: int = EXACT_LIMIT, max_samples: int = MAX_SAMPLES,
+                    workers: int = None) -> EquityResult:
+    """
+    equity()와 같은 인자/결과. 런아웃 열거나 몬테카를로 샘플링을 BATCH 단위 청크로 나눠 풀에서 실행한다.
+    """
+    holes, board, remaining = prepare(holes, board, dead)
+
+    if is_exact(board, remaining, exact_limit):
+        runouts = all_runouts(board, remaining)
+        chunks = [(holes, board, runouts[k:k + BATCH]) for k in range(0, len(runouts), BATCH)]
+        sums = sum(run_chunks(chunk_sums, chunks, workers))
+        return to_result(sums, len(runouts), exact=True)
+
+    sizes = [min(BATCH, max_samples - k) for k in range(0, max_samples, BATCH)]
+    seeds = chunk_seeds(seed, len(sizes))
+    chunks = [(holes, board, remaining, n, seeds[k]) for k, n in enumerate(sizes)]
+
+    sums = 0
+    samples = 0
+    for k, chunk_result in enumerate(run_chunks(sample_chunk_sums, chunks, workers, stop=_margin_reached(sizes, error))):
+        sums = sums + chunk_result
+        samples += sizes[k]
+    return to_result(sums, samples, exact=False)
+
+
+def _margin_reached(sizes: list, error: float):
+    # 청크 순서대로 누적하면서 직렬 equity()와 같은 지점에서 멈춘다
+    state = {"sums": 0, "samples": 0, "k": 0}
+
+    def stop(chunk_result) -> bool:
+        state["sums"] = state["sums"] + chunk_result
+        state["samples"] += sizes[state["k"]]
+        state["k"] += 1
+        return margin_of(state["sums"], state["samples"]) <= error
+
+    return stop
@@ -0,0 +1,96 @@
+# holdemlogic/replay.py
+
+"""
+액션 로그(RoundManager.get_log()) 기반 핸드 리플레이 엔진.
+
+로그의 덱 순서/블라인드/칩으로 RoundManager를 다시 만들고 액션을 그대로 적용한 뒤
+보드, 지급액, 최종 칩이 기록과 같은지 확인한다. 분쟁 처리, 감사, 엔진 회귀 테스트용.
+
+    python -m holdemlogic.replay logs/hands/20261018.jsonl --workers 8
+"""
+
+import argparse
+import json
+from time import perf_counter
+
+from .round_manager import RoundManager
+
+CHUNK = 2000  # 병렬 리플레이 시 한 작업에 담는 로그 수
+
+
+def replay(log: dict) -> RoundManager:
+    """
+    로그를 재실행한 RoundManager를 반환한다. (검증은 하지 않음)
+    """
+    deck_order = list(bytes.fromhex(log["deck"])) if log.get("deck") else None
+    rm = RoundManager(log["chips"], log["sb"], log["bb"], seed=log.get("seed"), deck_order=deck_order)
+    for seat, amt, t in log["actions"]:
+        rm.step(seat, amt, t)
+    return rm
+
+
+def verify(log: dict) -> list:
+    """
+    로그를 재실행하고 기록과 다른 항목을 문자열 목록으로 반환한다. 빈 목록이면 일치.
+    """
+    try:
+        rm = replay(log)
+    except Exception as e:
+        return [f"replay failed: {e!r}"]
+
+    errors = []
+    board = bytes(rm.board).hex()
+    if board != log.get("board", board):
+        errors.append(f"board: expected={log['board']} got={board}")
+    if "payouts" in log:
+        if not rm.is_done():
+            errors.append("round not finished")
+        elif rm.get_showdown().payouts != log["payouts"]:
+            errors.append(f"payouts: expected={log['payouts']} got={rm.get_showdown().payouts}")
+    if "final_chips" in log and rm.chips != log["final_chips"]:
+        errors.append(f"final_chips: expected={log['final_chips']} got={rm.chips}")
+    return errors
+
+
+def _verify_chunk(logs: list) -> list:
+    return [verify(log) for log in logs]
+
+
+def verify_many(logs: list, workers: int = None) -> list:
+    """
+    여러 로그를 프로세스 풀에서 검증한다. 결과는 입력 순서대로 (오류 목록)의 리스트.
+    """
+    from .parallel import run_chunks
+
+    chunks = [(logs[k:k + CHUNK],) for k in range(0, len(logs), CHUNK)]
+    results = []
+    for chunk_result in run_chunks(_verify_chunk, chunks, workers):
+        results += chunk_result
+    return results
+
+
+def load_logs(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="핸드 로그 일괄 리플레이/검증")
+    parser.add_argument("paths", nargs="+", help="JSONL 핸드 로그 파일")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logs = []
+    for path in args.paths:
+        logs += load_logs(path)
+
+    start = perf_counter()
+    results = verify_many(logs, args.workers)
+    elapsed = perf_counter() - start
+
+    failed = 0
+    for log, errors in zip(logs, results):
+        if errors:
+            failed += 1
+            print(f"❌ game={log.get('game_id', '?')} round={log.get('round', '?')}: {'; '.join(errors)}")
+    print(f"replayed {len(logs)} hands in {elapsed:.3f}s ({len(logs) / max(elapsed, 1e-9):,.0f} hands/s), {failed} mismatched")
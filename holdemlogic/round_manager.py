@@ -1,20 +1,57 @@
 # holdemlogic/round_manager.py
 
 from .bet_manager import BetManager
-from .card import Deck
+from .card import Deck, CARDS
 from .hand import Hand, HandRanking
+from .evaluator import evaluate_codes, CATEGORY_SHIFT
 import time
 
+
+class ShowdownResult:
+    """
+    라운드 종료 시 한 번만 계산되는 결과. RoundManager.get_showdown()이 캐시해서 돌려준다.
+    모든 리스트는 라운드 인덱스 기준이다.
+    """
+    def __init__(self, strengths: list, groups: list, pots: list, payouts: list, uncontested: bool):
+        self.strengths = strengths      # 정수 핸드 세기 (폴드/무경쟁이면 None)
+        self.groups = groups            # 등수 그룹 (ex. [[2], [0, 3]]) - 폴드한 플레이어 제외
+        self.pots = pots                # 사이드팟 분할: [(금액, [수령자 인덱스]), ...]
+        self.payouts = payouts          # 플레이어별 지급액
+        self.uncontested = uncontested  # 폴드로 인한 조기종료 여부
+        self.hand_names = [
+            None if strength is None else Hand.RANK_ORDER[strength >> CATEGORY_SHIFT]
+            for strength in strengths
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "strengths": self.strengths,
+            "hand_names": self.hand_names,
+            "groups": self.groups,
+            "pots": [[amount, winners] for amount, winners in self.pots],
+            "payouts": self.payouts,
+            "uncontested": self.uncontested,
+        }
+
+    def __repr__(self):
+        return f"ShowdownResult(groups={self.groups}, pots={self.pots}, payouts={self.payouts})"
+
+
 class RoundManager:
-    def __init__(self, chips: list[int], sb=1, bb=2, base_time=15.0, timebank=30.0, grace=1.0):
+    def __init__(self, chips: list[int], sb=1, bb=2, base_time=15.0, timebank=30.0, grace=1.0, seed: int = None,
+                 deck_order: list = None):
         self.bm = BetManager(chips[:], sb, bb)
         self.n = len(chips)
+        self.initial_chips = chips[:]
         self.chips = self.bm.chips[:]
-        self.deck = Deck()
+        self.seed = seed
+        self.deck = Deck(seed, order=deck_order)
+        self.actions = []  # 액션 로그: (seat, amount, t)
         self.burnt = []
         self.board = []
         self.hole = [[] for _ in range(self.n)]
         self.debug = False
+        self._showdown = None
 
         # ⏱️ 타이머 관련 필드
         self.base_time = base_time
@@ -37,9 +74,9 @@ class RoundManager:
             
     def _deal_hole(self):
         for i in range(self.n):
-            self.hole[i] += self.deck.draw(2)
+            self.hole[i] += self.deck.draw_codes(2)
         if self.debug:
-            print(self.hole)
+            print([[CARDS[code] for code in hole] for hole in self.hole])
             
     
     def _number_of_cards_on_board(self):
@@ -63,11 +100,12 @@ class RoundManager:
     
     
     def get_hole(self, idx):
-        return self.hole[idx][:]
+        # 홀/보드는 카드 코드로 들고 있다가 밖으로 줄 때만 Card로 바꾼다
+        return [CARDS[code] for code in self.hole[idx]]
     
     
     def get_board(self):
-        return self.board[:]
+        return [CARDS[code] for code in self.board]
     
     
     def get_contributions(self):
@@ -91,19 +129,47 @@ class RoundManager:
     
     
     def get_distributions(self):
-        return self._distribute()
-    
-    
+        return self.get_showdown().payouts[:]
+
+
+    def get_showdown(self) -> ShowdownResult:
+        assert self.bm.finished
+        if self._showdown is None:
+            self._showdown = self._distribute()
+        return self._showdown
+    
+    
+    def get_log(self) -> dict:
+        """
+        리플레이용 압축 로그. 덱/보드는 카드 코드 바이트의 hex 문자열.
+        라운드가 끝났으면 검증용 결과(payouts, final_chips)를 함께 담는다.
+        """
+        log = {
+            "seed": self.seed,
+            "deck": bytes(self.deck.codes()).hex(),
+            "sb": self.bm.sb,
+            "bb": self.bm.bb,
+            "chips": self.initial_chips[:],
+            "actions": [[seat, amt, round(t, 3)] for seat, amt, t in self.actions],
+            "board": bytes(self.board).hex(),
+        }
+        if self.bm.finished:
+            log["payouts"] = self.get_showdown().payouts[:]
+            log["final_chips"] = self.chips[:]
+        return log
+
+
     def get_hands(self):
         assert self.bm.finished
-        hands = {i: Hand(self.hole[i] + self.board) for i in range(self.n)}
+        hands = {i: Hand(self.get_hole(i) + self.get_board()) for i in range(self.n)}
         return hands
     
         
-    def step(self, player_idx: int, amt: int) -> dict:
+    def step(self, player_idx: int, amt: int, t: float = 0.0) -> dict:
         assert player_idx == self.current_player(), f"차례가 아닙니다"
 
         finished, i, contributions, folded = self.bm.step(amt)
+        self.actions.append((player_idx, amt, t))
         self.chips = self.bm.chips[:]
 
         drawn_cards = []
@@ -112,9 +178,9 @@ class RoundManager:
 
             
             while len(self.board) < target_board_size:
-                card = self.deck.draw()
-                self.board.append(card)
-                drawn_cards.append(card)
+                code = self.deck.draw_codes(1)[0]
+                self.board.append(code)
+                drawn_cards.append(CARDS[code])
 
         return {
             "round_finished": finished,
@@ -125,26 +191,33 @@ class RoundManager:
         }
                 
     
-    def _distribute(self):
+    def _distribute(self) -> ShowdownResult:
         distributions = [0 for i in range(self.n)]
-        if self.get_folded().count(False) == 1:
-            return [0 if self.get_folded()[i] else sum(self.bm.contributions) for i in range(self.n)]
-        hands = {i: Hand(self.hole[i] + self.board) for i in range(self.n)}
-        # 핸드 비교 및 순위 결정
-        result = HandRanking.rank_players(hands)
+        folded = self.bm.folded
+        if folded.count(False) == 1:
+            winner = folded.index(False)
+            pot = sum(self.bm.contributions)
+            distributions[winner] = pot
+            return ShowdownResult([None] * self.n, [[winner]], [(pot, [winner])], distributions, uncontested=True)
+        strengths = [None if folded[i] else evaluate_codes(self.hole[i] + self.board) for i in range(self.n)]
+        # 핸드 비교 및 순위 결정 (정수 세기 비교)
+        groups = HandRanking.rank_players({i: strengths[i] for i in range(self.n) if not folded[i]})
+        result = groups[:]
+        pots = []
         contributions = self.bm.contributions[:]
         if self.debug:
             print(contributions)
             print("result: ", result)
         while sum(contributions) > 0:
             strongest_hands = result.pop(0)
-            winners = [i for i in strongest_hands if not self.bm.folded[i]]
+            winners = [i for i in strongest_hands if not folded[i]]
             winners_contributions = {i: contributions[i] for i in winners}
             while sum(winners_contributions.values()) > 0:
                 mincon_nonzero = min(x for x in winners_contributions.values() if x != 0)
                 pie_winners = [i for i in winners if winners_contributions[i] > 0]
                 num_pie_winners = len(pie_winners)
                 pie = sum([min(contributions[i], mincon_nonzero) for i in range(self.n)])
+                pots.append((pie, sorted(pie_winners)))
                 for i in range(self.n):
                     contributions[i] -= min(contributions[i], mincon_nonzero)
                 pie_per_person = int(pie / num_pie_winners)
@@ -159,4 +232,4 @@ class RoundManager:
                     leftover_pie -= 1
         if self.debug:
             print(distributions)
-        return distributions
\ No newline at end of file
+        return ShowdownResult(strengths, groups, pots, distributions, uncontested=False)
\ No newline at end of file
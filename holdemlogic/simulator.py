@@ -0,0 +1,176 @@
+# holdemlogic/simulator.py
+
+"""
+헤드리스 시뮬레이터: 타이머/로그/DB 없이 RoundManager로 싯앤고 게임을 끝까지 빠르게 돌린다.
+엔진 회귀 벤치마크와 워커 용량 산정에 사용한다.
+
+게임 진행 규칙(SB 순환, 탈락, 칩 정산)은 GameManager와 같다.
+
+    python -m holdemlogic.simulator --games 1000 --players 8 --policy random
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from .card import derive_seed
+from .round_manager import RoundManager
+
+MAX_ROUNDS = 10000  # 한 게임이 끝나지 않는 경우를 막기 위한 상한 (도달한 게임은 우승자 없이 truncated로 센다)
+
+
+# ================================================================
+# ✅ 봇 정책: (round, seat, rng) → 베팅액
+# ================================================================
+
+def legal_bets(rm: RoundManager, seat: int) -> tuple:
+    """
+    Returns: (to_call, min_raise_to, stack) - min_raise_to가 None이면 레이즈 불가
+    """
+    bm = rm.bm
+    stack = bm.chips[seat]
+    to_call = bm.high_bet - bm.contributions[seat]
+    min_raise_to = to_call + bm.min_raise_by
+    return to_call, (min_raise_to if stack >= min_raise_to else None), stack
+
+
+def check_call_policy(rm: RoundManager, seat: int, rng: random.Random) -> int:
+    to_call, _, stack = legal_bets(rm, seat)
+    return min(to_call, stack)
+
+
+def random_policy(rm: RoundManager, seat: int, rng: random.Random) -> int:
+    to_call, min_raise_to, stack = legal_bets(rm, seat)
+    x = rng.random()
+    if x < 0.25:
+        return 0  # 체크 또는 폴드
+    if x < 0.75 or min_raise_to is None:
+        return min(to_call, stack)
+    return stack if x > 0.95 else min_raise_to
+
+
+def aggressive_policy(rm: RoundManager, seat: int, rng: random.Random) -> int:
+    to_call, min_raise_to, stack = legal_bets(rm, seat)
+    if min_raise_to is None:
+        return min(to_call, stack)
+    return stack if rng.random() < 0.2 else min_raise_to
+
+
+POLICIES = {
+    "check_call": check_call_policy,
+    "random": random_policy,
+    "aggressive": aggressive_policy,
+}
+
+
+# ================================================================
+# ✅ 시뮬레이션
+# ================================================================
+
+class SimulationReport:
+    PHASES = ["deal", "policy", "step", "showdown"]
+
+    def __init__(self):
+        self.games = 0
+        self.hands = 0
+        self.actions = 0
+        self.elapsed = 0.0
+        self.phases = {phase: 0.0 for phase in SimulationReport.PHASES}
+        self.wins = {}  # 좌석 → 우승 횟수 (끝까지 간 게임만)
+        self.truncated = 0  # MAX_ROUNDS에 걸려 끝나지 않은 게임
+
+    def __str__(self):
+        lines = [
+            f"games={self.games}  truncated={self.truncated}  hands={self.hands}  actions={self.actions}  elapsed={self.elapsed:.3f}s",
+            f"hands/s={self.hands / self.elapsed:,.0f}  actions/s={self.actions / self.elapsed:,.0f}",
+        ]
+        for phase in SimulationReport.PHASES:
+            t = self.phases[phase]
+            lines.append(f"  {phase:<9} {t:8.3f}s  {t / self.elapsed * 100:5.1f}%  {t / max(self.hands, 1) * 1e6:8.2f}us/hand")
+        return "\n".join(lines)
+
+
+def play_game(policies: list, chips: list, sb: int, bb: int, seed: int, rng: random.Random, report: SimulationReport) -> int:
+    """
+    싯앤고 한 게임을 끝까지 진행하고 우승자 좌석을 반환한다. MAX_ROUNDS 안에 끝나지 않으면 None.
+    """
+    n = len(chips)
+    chips = chips[:]
+    sb_index = 0
+    phases = report.phases
+    for round_count in range(MAX_ROUNDS):
+        if sum(1 for c in chips if c > 0) < 2:
+            return max(range(n), key=lambda i: chips[i])
+        t0 = perf_counter()
+        while chips[sb_index] == 0:
+            sb_index = (sb_index + 1) % n
+        order = [i for i in list(range(n))[sb_index:] + list(range(n))[:sb_index] if chips[i] > 0]
+        rm = RoundManager([chips[i] for i in order], sb, bb, seed=derive_seed(seed, round_count))
+        t1 = perf_counter()
+        phases["deal"] += t1 - t0
+
+        while not rm.is_done():
+            t0 = perf_counter()
+            seat = rm.current_player()
+            amt = policies[order[seat]](rm, seat, rng)
+            t1 = perf_counter()
+            rm.step(seat, amt)
+            t2 = perf_counter()
+            phases["policy"] += t1 - t0
+            phases["step"] += t2 - t1
+            report.actions += 1
+
+        t0 = perf_counter()
+        payouts = rm.get_showdown().payouts
+        for r, g in enumerate(order):
+            chips[g] = rm.chips[r] + payouts[r]
+        phases["showdown"] += perf_counter() - t0
+
+        sb_index = (sb_index + 1) % n
+        report.hands += 1
+    if sum(1 for c in chips if c > 0) < 2:
+        return max(range(n), key=lambda i: chips[i])
+    return None  # 상한 도달 - 칩 선두를 우승자로 치지 않는다
+
+
+def simulate(games: int, players: int = 8, policies=None, chips: int = 2000, sb: int = 10, bb: int = 20,
+             seed: int = 0) -> SimulationReport:
+    """
+    policies: 좌석별 정책 리스트 (None이면 전원 random_policy)
+    """
+    policies = policies or [random_policy] * players
+    assert len(policies) == players
+    rng = random.Random(seed)
+    report = SimulationReport()
+    start = perf_counter()
+    for game in range(games):
+        winner = play_game(policies, [chips] * players, sb, bb, derive_seed(seed, game), rng, report)
+        if winner is None:
+            report.truncated += 1
+        else:
+            report.wins[winner] = report.wins.get(winner, 0) + 1
+        report.games += 1
+    report.elapsed = perf_counter() - start
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="헤드리스 싯앤고 시뮬레이터")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--policy", default="random", help=f"{', '.join(POLICIES)} 또는 좌석별 콤마 구분 목록")
+    parser.add_argument("--chips", type=int, default=2000)
+    parser.add_argument("--sb", type=int, default=10)
+    parser.add_argument("--bb", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    names = args.policy.split(",")
+    if len(names) == 1:
+        names = names * args.players
+    report = simulate(args.games, args.players, [POLICIES[name] for name in names],
+                      args.chips, args.sb, args.bb, args.seed)
+    print(report)
+    print(f"wins by seat: {dict(sorted(report.wins.items()))}")
+    if report.truncated:
+        print(f"⚠️ truncated: {report.truncated}/{report.games} games hit MAX_ROUNDS={MAX_ROUNDS} (not counted in wins)")
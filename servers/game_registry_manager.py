@@ -1,78 +1,259 @@
 # servers/game_registry_manager.py
 
+import asyncio
 import json
+from time import perf_counter, time
 from datetime import datetime
 from redis.asyncio import Redis
 from pydantic import BaseModel
 
 from app.services.game_manager import GameManager
-from .registry import game_registry  # dict[game_id] → GameManager
+from .registry import game_registry, restored  # dict[game_id] → GameManager
+from .registry import frozen, forwarding, inbox
+from .game_timeout_detector import scheduler
 from .logger_utils import make_logger  # 위에서 정의한 색상 로거
+from .snapshot import save_static_snapshot, save_snapshot, delete_snapshot, load_owned_snapshots, load_snapshot, move_owned
+from .routing import router, registry_queue
+from .transport import QueueReader, send
+from .outbound import outbound, publish_game_start, publish_game_end
+
+FORWARD_TTL = 60.0  # 이전 후 옛 워커로 늦게 도착한 메시지를 전달해 주는 기간(초)
+REGISTRY_BATCH = 16
 
 r = Redis(decode_responses=True)
+_background = set()  # 백그라운드 태스크 참조 유지
 
 async def game_registry_manager_loop(i: int):
-    redis = Redis(decode_responses=True)
     logger = make_logger("game_registry_manager", i)
-    queue_name = f"game_registry_manager_queue_{i}"
+    queue_name = registry_queue(i)
+    reader = QueueReader(Redis(decode_responses=True), queue_name, i)
+    await reader.start()
+
+    await router.register_worker(i)  # consistent-hash 링에 참여
+    await outbound.start()  # uid → 웹소켓 노드 표 (상태 전송 경로)
+    try:
+        await restore_games(i, logger)
+    except Exception as e:
+        logger(f"❌스냅샷 복구 실패: {e}")
+    finally:
+        restored.set()
 
     logger(f"loop started. listening on {queue_name}")
 
     while True:
         try:
-            _, raw = await redis.blpop(queue_name)
-            logger(f"got sth")
-            msg = json.loads(raw)
-            msg_type = msg.get("type")
-            body = msg.get("body", {})
-
-            if msg_type == "init":
-                game_id = body["game_id"]
-                if game_id in game_registry:
-                    logger(f"⚠️게임 {game_id:.4} 이미 존재함 → 무시")
-                    continue
-                
-                game_type = body["game_type"]
-                uids = body["uids"]
-                player_ids = body["player_ids"]
-
-                gm = GameManager(
-                    game_id=game_id,
-                    game_type=game_type,
-                    uids=uids,
-                    player_ids=player_ids,
-                    **body["room_settings"]
-                )
-                game_registry[game_id] = gm
-                await set_game_info_on_redis(game_id, uids, player_ids)
-                logger(f"게임 {game_id:.4} 등록 완료")
-                # GameManager 등록 후 game_step_handler_queue로 초기화 메시지 전송
-                step_queue = f"game_step_handler_queue_{i}"
-                await redis.rpush(step_queue, json.dumps({
-                    "type": "game_init",
-                    "game_id": game_id
-                }))
-                logger(f"game_step_handler_queue에 game_init 전송 완료: {game_id:.4}")
-
-            elif msg_type == "gc":
-                game_id = body["game_id"]
-                gm = game_registry.get(game_id)
-                if not gm:
-                    logger(f"⚠️GC 요청 받았지만 {game_id:.4} 존재하지 않음 → 무시")
-                    continue
-                if not gm.done:
-                    logger(f"⚠️GC 요청 받았지만 {game_id:.4} 아직 완료되지 않음 → 무시")
-                    continue
-                await clear_game_info_from_redis(game_id)
-                del game_registry[game_id]
-                logger(f"게임 {game_id:.4} 정리 완료 (del)")
-
-            else:
-                logger(f"⚠️알 수 없는 메시지 {msg_type=}")
-
+            entries = await reader.read(REGISTRY_BATCH)
         except Exception as e:
-            logger(f"❌예외 발생: {e}")
+            logger(f"❌큐 읽기 실패: {e}")
+            await asyncio.sleep(1.0)
+            continue
+        for _, raw in entries:
+            try:
+                await handle_registry_message(i, raw, logger)
+            except Exception as e:
+                logger(f"❌예외 발생: {e}")
+        try:
+            await reader.ack([entry_id for entry_id, _ in entries])
+        except Exception as e:
+            logger(f"❌ack 실패: {e}")
+
+
+async def handle_registry_message(i: int, raw: str, logger):
+    msg = json.loads(raw)
+    msg_type = msg.get("type")
+    body = msg.get("body", {})
+
+    if msg_type == "init":
+        game_id = body["game_id"]
+        if game_id in game_registry:
+            logger(f"⚠️게임 {game_id:.4} 이미 존재함 → 무시")
+            return
+        
+        game_type = body["game_type"]
+        uids = body["uids"]
+        player_ids = body["player_ids"]
+
+        gm = GameManager(
+            game_id=game_id,
+            game_type=game_type,
+            uids=uids,
+            player_ids=player_ids,
+            **body["room_settings"]
+        )
+        game_registry[game_id] = gm
+        await set_game_info_on_redis(game_id, uids, player_ids)
+        await save_static_snapshot(gm, i)
+        await save_snapshot(gm)
+        logger(f"게임 {game_id:.4} 등록 완료")
+        # GameManager 등록 후 같은 워커의 step handler 인박스로 초기화 메시지 전달
+        inbox.put(json.dumps({
+            "type": "game_init",
+            "game_id": game_id
+        }))
+        logger(f"step handler에 game_init 전달 완료: {game_id:.4}")
+
+    elif msg_type == "gc":
+        game_id = body["game_id"]
+        gm = game_registry.get(game_id)
+        if not gm:
+            logger(f"⚠️GC 요청 받았지만 {game_id:.4} 존재하지 않음 → 무시")
+            return
+        if not gm.done:
+            logger(f"⚠️GC 요청 받았지만 {game_id:.4} 아직 완료되지 않음 → 무시")
+            return
+        await delete_snapshot(game_id, i)
+        await router.clear_route(game_id)
+        await clear_game_info_from_redis(game_id, logger)
+        del game_registry[game_id]
+        logger(f"게임 {game_id:.4} 정리 완료 (del)")
+
+    elif msg_type == "migrate_out":
+        await migrate_out(i, body["game_id"], int(body["target"]), logger)
+
+    elif msg_type == "migrate_in":
+        await migrate_in(i, body["game_id"], int(body["source"]), logger)
+
+    elif msg_type == "migrate_done":
+        await migrate_done(i, body["game_id"], int(body["target"]), logger)
+
+    elif msg_type == "migrate_flush":
+        await migrate_flush(i, body["game_id"], body["messages"], logger)
+
+    elif msg_type == "migrate_abort":
+        await migrate_abort(i, body["game_id"], logger)
+
+    else:
+        logger(f"⚠️알 수 없는 메시지 {msg_type=}")
+
+
+
+# ================================================================
+# ✅ 워커 재시작 시 스냅샷으로 게임 복구
+# ================================================================
+
+async def restore_games(i: int, logger):
+    """
+    이 워커가 보유하던 게임을 스냅샷에서 복원해 game_registry에 다시 올린다.
+    데드라인은 같은 프로세스의 스케줄러에 직접 다시 넣는다. 상태 재전송은 백그라운드로 넘겨 복구 시간에서 뺀다.
+    """
+    start = perf_counter()
+    games, missing = await load_owned_snapshots(i)
+    if missing:
+        logger(f"⚠️스냅샷 없음/손상 {len(missing)}개 → 건너뜀: {[game_id[:4] for game_id in missing]}")
+
+    live = []
+    for gm in games:
+        game_registry[gm.game_id] = gm
+        if gm.done:
+            continue  # GC 대기 중인 게임은 등록만
+        scheduler.arm(gm.game_id, gm.deadline, gm.action_count)
+        live.append(gm)
+
+    logger(f"♻️게임 {len(games)}개 복구 완료 ({(perf_counter() - start) * 1000:.0f}ms)")
+    task = asyncio.create_task(push_restored_states(live, logger))
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def push_restored_states(games: list, logger, batch: int = 100):
+    # 접속 중인 플레이어에게 현재 상태를 다시 보낸다 (batch 게임마다 파이프라인 한 번)
+    for k in range(0, len(games), batch):
+        async with r.pipeline(transaction=False) as pipe:
+            for gm in games[k:k + batch]:
+                if gm.done or gm.is_sleeping:
+                    continue  # 라운드 사이라면 다음 라운드 시작 시 전송됨
+                for msg in gm._broadcast_state():
+                    for channel, data in outbound.route(msg, gm):
+                        pipe.publish(channel, data)
+            await pipe.execute()
+    logger(f"♻️복구 게임 {len(games)}개 상태 재전송 완료")
+
+
+# ================================================================
+# ✅ 워커 간 게임 이전 (마이그레이션)
+# ================================================================
+#
+#   원래 워커(S)                                 새 워커(T)
+#   migrate_out : 액션 사이에서 동결, 스냅샷 저장
+#                 이후 메시지는 S에서 버퍼링   ──▶ migrate_in   : 스냅샷 로드(동결 상태로), 보유 목록 이동,
+#                                                                 라우팅 테이블 갱신 → 새 메시지는 T에서 버퍼링
+#   migrate_done: S 버퍼를 넘기고 이후 늦은    ◀──
+#                 메시지는 T로 전달            ──▶ migrate_flush: S 버퍼 + T 버퍼 순서로 인박스 맨 앞에 넣고 동결 해제
+#
+#   T에서 로드에 실패하면 migrate_abort로 S가 게임을 그대로 다시 맡는다.
+
+def _unfreeze(game_id: str, earlier: list = ()) -> int:
+    # 동결을 풀고 버퍼링된 메시지를 메일박스 맨 앞에 원래 순서대로 되돌린다 (await 없이 한 번에)
+    gm, buffered = frozen.pop(game_id)
+    game_registry[game_id] = gm
+    if not gm.done:
+        scheduler.arm(game_id, gm.deadline, gm.action_count)
+    messages = list(earlier) + buffered
+    inbox.put_front(messages)
+    return len(messages)
+
+
+async def migrate_out(i: int, game_id: str, target: int, logger):
+    gm = game_registry.get(game_id)
+    if gm is None or gm.done or target == i or game_id in frozen:
+        logger(f"⚠️이전 불가: {game_id:.4} → worker {target} 무시")
+        return
 
+    # 이 게임을 맡은 step 태스크의 flush가 끝난 뒤(액션 사이)에 동결 → 이후 메시지는 버퍼링
+    await inbox.settle(game_id)
+    if game_registry.get(game_id) is not gm or gm.done or game_id in frozen:
+        logger(f"⚠️이전 불가: {game_id:.4} 대기 중 종료/이전됨")
+        return
+    frozen[game_id] = (gm, [])
+    del game_registry[game_id]
+    scheduler.disarm(game_id)
+    await save_snapshot(gm)
+
+    await send(r, registry_queue(target), json.dumps({
+        "type": "migrate_in",
+        "body": {"game_id": game_id, "source": i}
+    }))
+    logger(f"🚚게임 {game_id:.4} 동결 → worker {target}로 이전 요청")
+
+
+async def migrate_in(i: int, game_id: str, source: int, logger):
+    if game_id in frozen or game_id in game_registry:
+        logger(f"⚠️이미 받은 이전 요청: {game_id:.4} → 무시")  # stream 재전달
+        return
+    gm = await load_snapshot(game_id)
+    if gm is None:
+        logger(f"❌이전 실패: {game_id:.4} 스냅샷 없음 → worker {source}로 반환")
+        await send(r, registry_queue(source), json.dumps({"type": "migrate_abort", "body": {"game_id": game_id}}))
+        return
+
+    forwarding.pop(game_id, None)  # 예전에 이 워커에서 내보낸 게임이 돌아온 경우
+    frozen[game_id] = (gm, [])     # S의 버퍼가 도착할 때까지 새 메시지는 버퍼링
+    await move_owned(game_id, source, i)
+    await router.set_route(game_id, i)  # 이 시점부터 새 메시지는 이 워커로 온다
+    await send(r, registry_queue(source), json.dumps({
+        "type": "migrate_done",
+        "body": {"game_id": game_id, "target": i}
+    }))
+
+
+async def migrate_done(i: int, game_id: str, target: int, logger):
+    _, buffered = frozen.pop(game_id)
+    forwarding[game_id] = (target, time() + FORWARD_TTL)
+    await send(r, registry_queue(target), json.dumps({
+        "type": "migrate_flush",
+        "body": {"game_id": game_id, "messages": buffered}
+    }))
+    logger(f"🚚게임 {game_id:.4} 이전 완료, 버퍼 메시지 {len(buffered)}개 → worker {target}")
+
+
+async def migrate_flush(i: int, game_id: str, messages: list, logger):
+    count = _unfreeze(game_id, earlier=messages)
+    logger(f"🚚게임 {game_id:.4} 인수 완료, 버퍼 메시지 {count}개 처리 대기")
+
+
+async def migrate_abort(i: int, game_id: str, logger):
+    count = _unfreeze(game_id)
+    logger(f"⚠️게임 {game_id:.4} 이전 취소, 버퍼 메시지 {count}개 복귀")
 
 
 # ================================================================
@@ -89,16 +270,17 @@ async def set_game_info_on_redis(game_id: str, uids: list[str], player_ids: list
         await r.set(f"game:{game_id}:player:{p}:uid", u)
         await r.set(f"user:{u}:game", game_id)
 
+    # 웹소켓 노드의 구성원 캐시 갱신 (이 노드에 붙어 있던 uid가 새 게임으로 옮겨 감)
+    await publish_game_start(r, game_id, uids, player_ids)
+
 
-async def clear_game_info_from_redis(game_id: str):
+async def clear_game_info_from_redis(game_id: str, logger):
     """
     게임 종료 시 Redis 내 유저-게임 관련 상태 제거
     """
-    logger = make_logger("game_registry_manager", i)
-    
     logger(f"🪩게임 종료 redis 정리 시작: {game_id:.4}")
 
-    uids = await r.hgetall(f"player_id_to_uid:{game_id}").values()
+    uids = (await r.hgetall(f"player_id_to_uid:{game_id}")).values()
     for uid in uids:
         await r.delete(f"user:{uid}:game")
 
@@ -107,5 +289,6 @@ async def clear_game_info_from_redis(game_id: str):
 
     await r.delete(f"uid_to_player_id:{game_id}")
     await r.delete(f"player_id_to_uid:{game_id}")
+    await publish_game_end(r, game_id)
 
     logger(f"✅게임 종료 redis 정리 완료: {game_id:.4}")
\ No newline at end of file
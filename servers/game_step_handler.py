@@ -1,114 +1,241 @@
 # servers/game_step_handler.py
 
+import asyncio
 import json
 import os
 import traceback
 from redis.asyncio import Redis
-from time import time
+from time import time, monotonic
 from pydantic import BaseModel
-from .registry import game_registry
+from .registry import game_registry, restored, frozen, forwarding, inbox
+from .routing import step_queue
+from .transport import QueueReader, send, stage_ack
+from .outbound import outbound
+from .game_timeout_detector import scheduler
 from .logger_utils import make_logger
+from .snapshot import stage_snapshot, stage_disown
 from app.protocol.message_models import *
 
 r = Redis(decode_responses=True)
+STEP_BATCH = int(os.getenv("STEP_BATCH", 64))  # 태스크 하나가 한 번에 맡는 최대 메시지 수
+STEP_TASKS = int(os.getenv("STEP_TASKS", 8))   # 동시에 도는 step 태스크 수 (서로 다른 게임만 동시에 처리)
+METRICS_INTERVAL = 10.0
+
+
+class StepBatch:
+    """
+    배치 하나를 처리하며 생긴 Redis 명령 모음. 처리 중에는 쌓기만 하고 flush()에서 파이프라인 한 번으로 보낸다.
+    스냅샷이 상태 전파보다 먼저 가도록 스냅샷 → 보유 해제 → 전달 → publish 순서로 넣는다.
+    """
+    def __init__(self, worker: int):
+        self.worker = worker
+        self.changed = {}   # game_id → GameManager (배치 안에서 여러 번 바뀌어도 마지막 상태만 저장)
+        self.finished = []  # 끝난 game_id
+        self.forwards = []  # (step 큐, 원본 메시지) : 이전된 게임으로 전달
+        self.outgoing = []  # (웹소켓 노드 채널, JSON)
+        self.acks = []      # 처리가 끝난 큐 항목 id (stream 모드)
+
+    def publish(self, messages: list[BaseModel]):
+        for msg in messages:
+            assert hasattr(msg, "game_id") and hasattr(msg, "player_id")
+            self.outgoing += outbound.route(msg, game_registry.get(msg.game_id))
+
+    async def flush(self, redis):
+        if not (self.changed or self.forwards or self.outgoing or any(self.acks)):
+            return
+        async with redis.pipeline(transaction=False) as pipe:
+            for gm in self.changed.values():
+                stage_snapshot(pipe, gm)
+            for game_id in self.finished:
+                stage_disown(pipe, game_id, self.worker)
+            for queue, raw in self.forwards:
+                send(pipe, queue, raw)
+            for channel, data in self.outgoing:
+                pipe.publish(channel, data)
+            stage_ack(pipe, step_queue(self.worker), self.acks)  # 결과가 남은 뒤에 ack → 그 전에 죽으면 다시 읽는다
+            await pipe.execute()
+
+
+class StepMetrics:
+    """
+    head-of-line blocking 지표: 메시지가 인박스에 들어온 뒤 처리되기 시작할 때까지의 대기 시간.
+    METRICS_INTERVAL마다 p50/p99/max를 로그로 남기고 비운다.
+    """
+    def __init__(self):
+        self.waits = []
+
+    def observe(self, wait: float):
+        self.waits.append(wait)
+
+    def summary(self) -> str:
+        waits = sorted(self.waits)
+        self.waits = []
+        if not waits:
+            return "처리 0건"
+        pick = lambda q: waits[min(len(waits) - 1, int(len(waits) * q))] * 1000
+        return f"처리 {len(waits)}건, 대기 p50 {pick(0.5):.2f}ms p99 {pick(0.99):.2f}ms max {waits[-1] * 1000:.2f}ms"
+
+
+metrics = StepMetrics()
+
 
 async def game_step_handler_loop(i: int):
-    redis = Redis(decode_responses=True)
     logger = make_logger("game_step_handler", i)
-    queue = f"game_step_handler_queue_{i}"
+    queue = step_queue(i)
+    reader = QueueReader(Redis(decode_responses=True), queue, i)
+    await reader.start()
+
+    await restored.wait()  # 스냅샷 복구가 끝난 뒤에 큐를 읽는다
+    await outbound.start()
+    pump = asyncio.create_task(_pump_redis_queue(reader, logger))
+    reporter = asyncio.create_task(_report_metrics(reader, logger))
+    logger(f"loop started. listening on {queue} (tasks={STEP_TASKS}, batch={STEP_BATCH})")
 
-    logger(f"loop started. listening on {queue}")
+    # 게임별 메일박스를 STEP_TASKS개 태스크가 나눠 맡는다: 한 태스크가 flush를 기다리는 동안 다른 게임은 계속 처리
+    await asyncio.gather(*(_step_task(i, r, logger) for _ in range(STEP_TASKS)))
 
+
+async def _step_task(i: int, redis, logger):
     while True:
+        claimed = await inbox.claim(STEP_BATCH)
+        batch = StepBatch(i)
         try:
-            _, raw = await redis.blpop(queue)
-            msg = json.loads(raw)
-
-            msg_type = msg.get("type")
-            game_id = msg.get("game_id")
-            gm = game_registry.get(game_id)
-            messages = []
-
-            if msg_type == "game_init":
-                logger(f"game_init 메시지 수신: {game_id:.4}")
-                
-                if gm is None:
-                    logger(f"등록되지 않은 game_id={game_id:.4} → 무시")
-                else:
+            for game_id, entries in claimed:
+                for enqueued_at, raw, msg, entry_id in entries:
+                    metrics.observe(monotonic() - enqueued_at)
+                    batch.acks.append(entry_id)
+                    try:
+                        _handle_message(raw, msg, batch, logger)
+                    except Exception as e:
+                        logger(f"❌[EXCEPTION] {e}")
+                        traceback.print_exc()
+            await batch.flush(redis)
+        except Exception as e:
+            logger(f"❌[EXCEPTION - flush] {e}")
+            traceback.print_exc()
+        finally:
+            # flush가 끝난 뒤에 놓아야 같은 게임의 다음 메시지 결과가 앞지르지 않는다
+            inbox.release([game_id for game_id, _ in claimed])
+
+
+async def _report_metrics(reader: QueueReader, logger):
+    while True:
+        await asyncio.sleep(METRICS_INTERVAL)
+        try:
+            queue = await reader.stats()
+        except Exception as e:
+            queue = f"조회 실패 {e}"
+        logger(f"📈{metrics.summary()}, 인박스 {len(inbox)}건, 큐 {queue}")
+
+
+def _handle_message(raw: str, msg: dict, batch: StepBatch, logger):
+    """
+    메시지 하나를 처리한다. Redis에 보낼 것은 batch에 쌓기만 하므로 중간에 await가 없다.
+    (마이그레이션 동결/해제도 await 없이 일어나므로 처리 도중 게임이 사라지지 않는다)
+    """
+    msg_type = msg.get("type")
+    game_id = msg.get("game_id")
+
+    # 🚚 마이그레이션 중이면 버퍼링, 이전이 끝났으면 새 워커로 전달
+    if game_id in frozen:
+        frozen[game_id][1].append(raw)
+        return
+    if game_id in forwarding and game_id not in game_registry:
+        target, until = forwarding[game_id]
+        if time() < until:
+            batch.forwards.append((step_queue(target), raw))
+            return
+        del forwarding[game_id]
+
+    gm = game_registry.get(game_id)
+    messages = []
+    changed = False  # 게임 상태가 바뀌었으면 스냅샷 저장
+
+    if msg_type == "game_init":
+        logger(f"game_init 메시지 수신: {game_id:.4}")
+        
+        if gm is None:
+            logger(f"등록되지 않은 game_id={game_id:.4} → 무시")
+        else:
+            messages += gm.wake()
+            changed = True
+        
+
+    elif msg_type == "action":
+        if gm is None:
+            msg = ErrorMessage(
+                type="error",
+                game_id=game_id,
+                player_id=msg["player_id"],
+                payload=ErrorPayload(message=f"no such game is not found")
+            )
+            messages += [msg]
+        else:
+            if _validate_user_action(msg, gm):
+                messages += gm.handle_action(
+                    player_id=msg["player_id"],
+                    amount=msg["amount"],
+                    client_action_count=msg["action_count"],
+                    received_at=msg["received_at"],
+                    is_timeout=False
+                )
+                changed = True
+            else:
+                msg = ErrorMessage(
+                    type="error",
+                    game_id=game_id,
+                    player_id=msg["player_id"],
+                    payload=ErrorPayload(message=f"action is not valid or timeout")
+                )
+                messages+= [msg]
+
+    elif msg_type == "timeout_possibility":
+        if gm is None:
+            logger(f"없는 game_id → 무시: {game_id:.4}")
+        else:
+            if time() < gm.deadline or msg.get("action_count", gm.action_count) != gm.action_count:
+                logger(f"stale timeout_msg → 무시: {game_id:.4}")
+            else:
+                changed = True
+                if gm.is_sleeping:
                     messages += gm.wake()
-                    await push_timeout_request(game_id)
-                
-
-            elif msg_type == "action":
-                if gm is None:
-                    msg = ErrorMessage(
-                        type="error",
-                        game_id=game_id,
-                        player_id=msg["player_id"],
-                        payload=ErrorPayload(message=f"no such game is not found")
-                    )
-                    messages += [msg]
                 else:
-                    if _validate_user_action(msg, gm):
-                        messages += gm.handle_action(
-                            player_id=msg["player_id"],
-                            amount=msg["amount"],
-                            client_action_count=msg["action_count"],
-                            received_at=msg["received_at"],
-                            is_timeout=False
-                        )
-                        await push_timeout_request(game_id)
-                    else:
-                        msg = ErrorMessage(
-                            type="error",
-                            game_id=game_id,
-                            player_id=msg["player_id"],
-                            payload=ErrorPayload(message=f"action is not valid or timeout")
-                        )
-                        messages+= [msg]
-                        await push_timeout_request(game_id)
-
-            elif msg_type == "timeout_possibility":
-                if gm is None:
-                    logger(f"없는 game_id → 무시: {game_id:.4}")
-                else:
-                    if time() < gm.deadline:
-                        logger(f"stale timeout_msg → 무시: {game_id:.4}")
-                    else:
-                        if gm.is_sleeping:
-                            messages += gm.wake()
-                        else:
-                            messages += gm.handle_action(
-                                amount=0,
-                                client_action_count=gm.action_count,
-                                received_at=time(),
-                                is_timeout=True
-                            )
-                            await push_timeout_request(game_id)
-            
-            elif msg_type == "send_state_to_user":
-                messages = []
-                player_id = msg["player_id"]
-                if gm is None:
-                    logger(f"없는 game_id → 오류: {game_id:.4}")
-                    msg = ErrorMessage(
-                        type="error",
-                        game_id=game_id,
-                        player_id=player_id,
-                        payload=ErrorPayload(message=f"action is not valid or timeout")
+                    messages += gm.handle_action(
+                        amount=0,
+                        client_action_count=gm.action_count,
+                        received_at=time(),
+                        is_timeout=True
                     )
-                    messages += [msg]
-                else:
-                    messages += gm._get_state(player_id)
+    
+    elif msg_type == "send_state_to_user":
+        messages = []
+        player_id = msg["player_id"]
+        if gm is None:
+            logger(f"없는 game_id → 오류: {game_id:.4}")
+            msg = ErrorMessage(
+                type="error",
+                game_id=game_id,
+                player_id=player_id,
+                payload=ErrorPayload(message=f"action is not valid or timeout")
+            )
+            messages += [msg]
+        else:
+            messages += gm._get_state(player_id)
 
-            else:
-                logger(f"⚠️알 수 없는 메시지 type={msg_type}")
-            
-            await request_publish_messages(messages)
+    else:
+        logger(f"⚠️알 수 없는 메시지 type={msg_type}")
 
-        except Exception as e:
-            logger(f"❌[EXCEPTION] {e}")
-            traceback.print_exc()
+    # 💾 상태 전파 전에 스냅샷을 먼저 남긴다 (크래시 복구용, flush에서 publish보다 앞에 들어간다)
+    if changed:
+        # ⏱️ 새 데드라인 예약 (라운드 시작 포함) - 같은 프로세스의 스케줄러에 직접
+        if gm.done:
+            scheduler.disarm(game_id)
+            batch.finished.append(game_id)
+        else:
+            scheduler.arm(game_id, gm.deadline, gm.action_count)
+        batch.changed[game_id] = gm
+    
+    batch.publish(messages)
 
 
 def _validate_user_action(msg, gm):
@@ -129,31 +256,18 @@ def _validate_user_action(msg, gm):
     except Exception:
         return False
 
-async def request_publish_messages(messages: list[BaseModel]):
-    """
-    상태 메시지를 Redis Pub/Sub을 통해 전파.
-    WebSocket 직접 전송은 하지 않음. 
-    WebSocket 서버가 Redis 구독을 통해 전송을 담당함.
-    """
-    
-    for msg in messages:
-        assert hasattr(msg, "game_id") and hasattr(msg, "player_id")
-        await r.publish("outgoing_ws", msg.json())
-
-async def push_timeout_request(game_id: str):
-    import json
-
-    # 워커 인덱스 결정
-    import uuid
-    num_workers = int(os.getenv("NUM_WORKERS", 1))
-    worker_index = int(uuid.UUID(game_id)) % num_workers
-    queue_name = f"game_timeout_detector_queue_{worker_index}"
-
-    
-    # 메시지 구성
-    msg = {
-        "game_id": game_id
-    }
-
-    # Redis 전송
-    await r.rpush(queue_name, json.dumps(msg))
\ No newline at end of file
+async def _pump_redis_queue(reader: QueueReader, logger):
+    # Redis step 큐 → 인박스 (인박스가 가득 차면 잠시 멈춘다)
+    while True:
+        try:
+            await inbox.wait_space()
+            # 이미 쌓여 있는 메시지는 왕복 한 번에 최대 STEP_BATCH개 (LPOP count / XREADGROUP COUNT)
+            for entry_id, raw in await reader.read(STEP_BATCH):
+                try:
+                    inbox.put(raw, entry_id)
+                except ValueError:
+                    logger(f"⚠️JSON이 아닌 메시지 → 무시: {raw[:80]}")
+                    await reader.ack([entry_id])
+        except Exception as e:
+            logger(f"❌[EXCEPTION - 큐 읽기] {e}")
+            await asyncio.sleep(1.0)
@@ -1,63 +1,79 @@
 # servers/game_timeout_detector.py
 
-import json
-from redis.asyncio import Redis
 import asyncio
+import json
 import traceback
 from time import time
 
-from .registry import game_registry, timeouts, deadline
+from .registry import game_registry, restored, inbox
 from .logger_utils import make_logger
+from .timing_wheel import TimingWheel
+
+
+class DeadlineScheduler:
+    """
+    게임별 데드라인을 계층형 타이밍 휠에 (game_id, action_count)로 예약하고 다음 할 일이 생기는 시각까지 잠든다.
+    폴링하지 않는다: 더 이른 데드라인이 등록되면 잠들어 있는 run()을 깨운다.
+    """
+    def __init__(self, on_timeout):
+        self.on_timeout = on_timeout  # 데드라인이 지난 (game_id, action_count)를 받는 콜백
+        self.wheel = TimingWheel(time())
+        self.wake_at = None           # run()이 깨어나기로 한 시각
+        self.changed = asyncio.Event()
+
+    def arm(self, game_id: str, deadline: float, action_count: int):
+        # 재예약도 O(1): 이전 타이머는 action_count가 달라 발화 시점에 버려진다
+        self.wheel.schedule(game_id, action_count, deadline)
+        if self.wake_at is None or deadline < self.wake_at:
+            self.changed.set()  # 가장 이른 데드라인이 바뀜 → 다시 잠들 시간 계산
+
+    def disarm(self, game_id: str):
+        self.wheel.cancel(game_id)
+
+    def __len__(self):
+        return len(self.wheel)
+
+    async def run(self):
+        while True:
+            self.changed.clear()
+            for game_id, action_count in self.wheel.advance(time()):
+                self.on_timeout(game_id, action_count)
+            self.wake_at = self.wheel.next_wake()
+            if self.wake_at is None:
+                await self.changed.wait()
+                continue
+            delay = self.wake_at - time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+
+def _deliver_timeout(game_id: str, action_count: int):
+    # 같은 워커의 step handler 인박스로 바로 전달 (Redis 왕복 없음)
+    gm = game_registry.get(game_id)
+    if gm is None or gm.done or gm.action_count != action_count:
+        return
+    inbox.put(json.dumps({
+        "type": "timeout_possibility",
+        "game_id": game_id,
+        "action_count": action_count,
+    }))
+
+
+scheduler = DeadlineScheduler(_deliver_timeout)
+
 
 async def game_timeout_detector_loop(i: int):
-    redis = Redis(decode_responses=True)
     logger = make_logger("game_timeout_detector", i)
-    queue = f"game_timeout_detector_queue_{i}"
-    step_queue = f"game_step_handler_queue_{i}"
 
-    logger(f"loop started. listening on {queue}")
+    await restored.wait()  # 스냅샷 복구가 끝난 뒤에 시작
+    logger(f"scheduler started. {len(scheduler)} deadlines armed")
 
     while True:
-        # 1. 타임아웃 정렬 갱신 요청 처리
-        try:
-            msg = await redis.blpop(queue, timeout=0.01)
-            if msg:
-                _, raw = msg
-                data = json.loads(raw)
-                game_id = data.get("game_id")
-                gm = game_registry.get(game_id)
-                logger(gm.game_id)
-                logger(timeouts)
-                logger(deadline)
-                if gm:
-                    if gm in timeouts:
-                        if gm.deadline == deadline[gm.game_id]:
-                            logger(f"⚠️이미 deadline이 최신임: {game_id:.4} {deadline[gm.game_id]=}")
-                        timeouts.remove(gm)
-                        del deadline[gm.game_id]
-                    timeouts.add(gm)
-                    deadline[gm.game_id] = gm.deadline
-                    logger(f"정렬 갱신됨: {game_id:.4} {deadline=}")
-        except Exception as e:
-            logger(f"❌[EXCEPTION - 정렬 처리] {e}")
-            traceback.print_exc()
-            
-        # 2. 타임아웃 도달 검사
         try:
-            now = time()
-            while len(timeouts) and timeouts[0].deadline <= now:
-                gm = timeouts.pop(0)
-                del deadline[gm.game_id]
-                if gm.done:
-                    continue
-                msg = {
-                    "type": "timeout_possibility",
-                    "game_id": gm.game_id,
-                }
-                await redis.rpush(step_queue, json.dumps(msg))
-                logger(f"timeout_possibility 전송: {gm.game_id:.4}")
+            await scheduler.run()
         except Exception as e:
             logger(f"❌[EXCEPTION - 타임아웃 처리] {e}")
             traceback.print_exc()
-        
-        await asyncio.sleep(0.01)
\ No newline at end of file
@@ -1,11 +1,39 @@
 # app/services/history_logger.py
 import sqlite3
 import json
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
 DB_PATH = "users.db"
+HAND_LOG_DIR = os.getenv("HAND_LOG_DIR", "logs/hands")
+
+# SQLite/파일 기록은 블로킹이므로 step handler 이벤트 루프 대신 이 스레드에서 들어온 순서대로 처리한다
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history")
+
+
+def _submit(fn, *args):
+    def report(future):
+        if future.exception() is not None:
+            traceback.print_exception(future.exception())
+    _writer.submit(fn, *args).add_done_callback(report)
+
 
 def save_game_result(game_id: str, game_type: str, player_uid_name_map: dict[str, str], rankings: dict[str, int], duration: float):
+    _submit(_save_game_result, game_id, game_type, player_uid_name_map, rankings, duration)
+
+
+def append_hand_log(record: dict):
+    """
+    라운드 하나의 액션 로그를 날짜별 JSONL 파일에 추가한다 (기록 스레드에서).
+    python -m holdemlogic.replay logs/hands/YYYYMMDD.jsonl 로 일괄 검증할 수 있다.
+    """
+    _submit(_append_hand_log, record)
+
+
+def _save_game_result(game_id: str, game_type: str, player_uid_name_map: dict[str, str], rankings: dict[str, int], duration: float):
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
@@ -23,3 +51,10 @@ def save_game_result(game_id: str, game_type: str, player_uid_name_map: dict[str
     ))
     conn.commit()
     conn.close()
+
+
+def _append_hand_log(record: dict):
+    path = Path(HAND_LOG_DIR) / f"{datetime.utcnow():%Y%m%d}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
@@ -0,0 +1,235 @@
+# servers/outbound.py
+
+"""
+워커 → 웹소켓 노드 전송 경로
+
+    - 웹소켓 서버 프로세스(노드)마다 채널 outgoing_ws:{node}를 구독한다.
+    - 노드는 소켓이 붙고 떨어질 때 uid → 노드를 Redis 해시 ws:nodes에 기록하고 ws_nodes_updates로 알린다.
+    - 워커는 Outbound(outbound)가 그 표의 로컬 사본을 들고 수신자 uid가 붙어 있는 노드 채널에만 publish한다.
+      state_broadcast는 노드별로 그 노드의 플레이어 홀카드만 남겨 한 건씩 보낸다.
+    - 노드를 모르는 수신자(표 갱신 전, 접속 안 함)는 예전처럼 모든 노드가 구독하는 outgoing_ws로 보낸다.
+    - 본문은 JSON이 기본이고 OUTGOING_FORMAT=msgpack이면 MessagePack 위치 스키마(app/protocol/wire.py)로 보낸다.
+      노드는 첫 바이트로 구분해 둘 다 읽으므로 워커를 하나씩 바꿔도 된다.
+    - 노드는 받은 메시지의 player_id → uid, uid의 현재 게임을 Members(members) 캐시에서 찾는다.
+      게임 시작/종료 때 워커가 ws_games_updates로 알리므로 메시지마다 Redis에 묻지 않는다.
+
+따라서 노드 하나가 받는 양은 전체 트래픽이 아니라 자기 소켓 몫이다.
+"""
+
+import asyncio
+import json
+import os
+
+from redis.asyncio import Redis
+
+from app.protocol import wire
+
+NODES_KEY = "ws:nodes"
+UPDATES_CHANNEL = "ws_nodes_updates"
+FALLBACK_CHANNEL = "outgoing_ws"
+OUTGOING_FORMAT = os.getenv("OUTGOING_FORMAT", "json")
+
+assert OUTGOING_FORMAT in ("json", "msgpack"), f"알 수 없는 OUTGOING_FORMAT={OUTGOING_FORMAT}"
+
+
+def node_channel(node: str) -> str:
+    return f"outgoing_ws:{node}"
+
+
+class Outbound:
+    def __init__(self):
+        self.r = Redis(decode_responses=True)
+        self.nodes = {}  # uid → 노드 (ws:nodes의 로컬 사본)
+        self._task = None
+
+    async def start(self):
+        # 구독을 먼저 걸고 전체를 읽어야 그 사이 갱신을 놓치지 않는다 (여러 번 호출해도 한 번만 시작)
+        if self._task is not None:
+            return
+        pubsub = self.r.pubsub()
+        await pubsub.subscribe(UPDATES_CHANNEL)
+        self._task = asyncio.create_task(self._listen(pubsub))
+        self.nodes.update(await self.r.hgetall(NODES_KEY))
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _listen(self, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                update = json.loads(message["data"])
+                if update["op"] == "set":
+                    self.nodes[update["uid"]] = update["node"]
+                elif update["op"] == "del" and self.nodes.get(update["uid"]) == update["node"]:
+                    del self.nodes[update["uid"]]
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await pubsub.unsubscribe(UPDATES_CHANNEL)
+            await pubsub.close()
+
+    # ---------------- 워커: 메시지 → [(채널, JSON)] ----------------
+
+    def route(self, msg, gm) -> list:
+        """
+        msg를 받을 플레이어가 붙어 있는 노드 채널로 나눈다. gm은 player_id → uid 조회용 (없으면 전부 공용 채널).
+        """
+        binary = OUTGOING_FORMAT == "msgpack"
+        if msg.type != "state_broadcast":
+            return [(self._channel(gm, msg.player_id), wire.encode(msg.dict()) if binary else msg.json())]
+
+        groups = {}
+        for player_id, hole_cards in msg.holes.items():
+            groups.setdefault(self._channel(gm, player_id), {})[player_id] = hole_cards
+        if binary:
+            return list(zip(groups, wire.encode_broadcast(msg.game_id, msg.state.dict(), list(groups.values()))))
+        if len(groups) == 1:
+            return [(channel, msg.json()) for channel in groups]
+        # 공개 상태는 한 번만 직렬화하고 노드마다 holes만 바꿔 붙인다
+        head = f'{{"type":"state_broadcast","game_id":{json.dumps(msg.game_id)},"player_id":"*","state":{msg.state.json()},"holes":'
+        return [(channel, head + json.dumps(holes) + "}") for channel, holes in groups.items()]
+
+    def _channel(self, gm, player_id: str) -> str:
+        if gm is None or player_id not in gm.player_ids:
+            return FALLBACK_CHANNEL
+        node = self.nodes.get(gm.uids[gm.player_ids.index(player_id)])
+        return node_channel(node) if node else FALLBACK_CHANNEL
+
+
+outbound = Outbound()
+
+
+# ---------------- 웹소켓 노드: 소켓 등록/해제 ----------------
+
+async def register_connection(r: Redis, uid: str, node: str):
+    await r.hset(NODES_KEY, uid, node)
+    await r.publish(UPDATES_CHANNEL, json.dumps({"op": "set", "uid": uid, "node": node}))
+
+
+async def unregister_connection(r: Redis, uid: str, node: str):
+    # 그 사이 다른 노드로 다시 붙었으면 지우지 않는다
+    if await r.hget(NODES_KEY, uid) == node:
+        await r.hdel(NODES_KEY, uid)
+        await r.publish(UPDATES_CHANNEL, json.dumps({"op": "del", "uid": uid, "node": node}))
+
+
+# ---------------- 웹소켓 노드: 게임 구성원 캐시 ----------------
+
+GAMES_CHANNEL = "ws_games_updates"
+
+
+class Members:
+    """
+    웹소켓 노드가 메시지마다 Redis에서 읽던 player_id → uid, uid → 게임을 메모리에 둔다.
+        players: game_id → {player_id → uid}  (이 노드에 붙은 uid가 있는 게임만)
+        games  : uid → game_id                (이 노드에 붙은 uid만)
+    소켓이 붙을 때 attach()가 그 게임을 Redis에서 한 번 읽고, 게임 시작/종료는 ws_games_updates로 받아 고친다.
+    """
+    def __init__(self):
+        self.r = Redis(decode_responses=True)
+        self.players = {}
+        self.games = {}
+        self.local = {}  # game_id → 이 노드에 붙은 uid 수 (0이 되면 players에서 뺀다)
+        self._task = None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        pubsub = self.r.pubsub()
+        await pubsub.subscribe(GAMES_CHANNEL)
+        self._task = asyncio.create_task(self._listen(pubsub))
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _listen(self, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                update = json.loads(message["data"])
+                if update["op"] == "start":
+                    self._on_start(update["game_id"], update["players"])
+                elif update["op"] == "end":
+                    self._on_end(update["game_id"])
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await pubsub.unsubscribe(GAMES_CHANNEL)
+            await pubsub.close()
+
+    def _on_start(self, game_id: str, players: dict):
+        # 이 노드에 붙어 있는 uid가 새 게임에 들어가면 그 uid는 이제 새 게임 소속 (옛 게임 메시지는 거른다)
+        uids = [uid for uid in players.values() if uid in self.games]
+        if not uids:
+            return
+        self.players[game_id] = players
+        for uid in uids:
+            self._bind(uid, game_id)
+
+    def _on_end(self, game_id: str):
+        self.players.pop(game_id, None)
+        for uid in [uid for uid, g in self.games.items() if g == game_id]:
+            self._unbind(uid)
+
+    def _bind(self, uid: str, game_id: str):
+        if self.games.get(uid) == game_id:
+            return
+        self._unbind(uid)
+        self.games[uid] = game_id
+        self.local[game_id] = self.local.get(game_id, 0) + 1
+
+    def _unbind(self, uid: str):
+        game_id = self.games.pop(uid, None)
+        if game_id is None:
+            return
+        self.local[game_id] -= 1
+        if self.local[game_id] <= 0:
+            del self.local[game_id]
+            self.players.pop(game_id, None)
+
+    # ---------------- 소켓 연결/해제 (Redis 조회는 여기서만) ----------------
+
+    async def attach(self, uid: str) -> tuple:
+        """
+        uid가 참여 중인 게임을 읽어 캐시에 올리고 (game_id, player_id)를 반환한다. 없으면 None이 섞여 있다.
+        """
+        game_id = await self.r.get(f"user:{uid}:game")
+        if not game_id:
+            return None, None
+        if game_id not in self.players:
+            players = await self.r.hgetall(f"player_id_to_uid:{game_id}")
+            if not players:
+                return game_id, None
+            self.players.setdefault(game_id, players)
+        self._bind(uid, game_id)
+        player_id = next((p for p, u in self.players[game_id].items() if u == uid), None)
+        return game_id, player_id
+
+    def detach(self, uid: str):
+        self._unbind(uid)
+
+    # ---------------- 조회 (메시지마다, Redis 왕복 없음) ----------------
+
+    def uid_for(self, game_id: str, player_id: str):
+        return self.players.get(game_id, {}).get(player_id)
+
+
+members = Members()
+
+
+# ---------------- 워커: 게임 시작/종료 알림 ----------------
+
+async def publish_game_start(r: Redis, game_id: str, uids: list, player_ids: list):
+    players = {p: u for u, p in zip(uids, player_ids)}
+    await r.publish(GAMES_CHANNEL, json.dumps({"op": "start", "game_id": game_id, "players": players}))
+
+
+async def publish_game_end(r: Redis, game_id: str):
+    await r.publish(GAMES_CHANNEL, json.dumps({"op": "end", "game_id": game_id}))
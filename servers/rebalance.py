@@ -0,0 +1,68 @@
+# servers/rebalance.py
+
+"""
+워커 간 게임 재분배 (관리자 명령)
+
+각 워커가 보유한 진행 중 게임 수(worker:{i}:games)를 부하로 보고, 가장 많은 워커에서 가장 적은 워커로
+게임을 하나씩 옮기는 계획을 세운 뒤 원래 워커의 registry 큐에 migrate_out을 보낸다.
+워커를 추가한 뒤 실행하면 새 워커로 게임이 나눠진다.
+
+    python -m servers.rebalance [--threshold 1] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import json
+
+from redis.asyncio import Redis
+
+from .routing import router, registry_queue
+from .transport import send
+from .snapshot import owned_key
+
+
+def plan_moves(owned: list, threshold: int = 1) -> list:
+    """
+    owned: 워커별 보유 game_id 목록
+    Returns: [(game_id, 원래 워커, 새 워커), ...] - 최다/최소 부하 차이가 threshold 이하가 될 때까지
+    (threshold가 0이면 나누어떨어지지 않는 부하에서 한 게임이 두 워커를 오가며 끝나지 않으므로 1 이상이어야 한다)
+    """
+    assert threshold >= 1, f"threshold는 1 이상이어야 합니다: {threshold}"
+    loads = [sorted(games) for games in owned]
+    moves = []
+    while True:
+        source = max(range(len(loads)), key=lambda w: len(loads[w]))
+        target = min(range(len(loads)), key=lambda w: len(loads[w]))
+        if len(loads[source]) - len(loads[target]) <= threshold:
+            return moves
+        game_id = loads[source].pop()
+        loads[target].append(game_id)
+        moves.append((game_id, source, target))
+
+
+async def rebalance(threshold: int = 1, dry_run: bool = False) -> list:
+    r = Redis(decode_responses=True)
+    workers = await router.workers()  # 링에 참여한 워커
+    owned = [list(await r.smembers(owned_key(w))) for w in workers]
+    moves = [(game_id, workers[source], workers[target]) for game_id, source, target in plan_moves(owned, threshold)]
+
+    print(f"[rebalance] 부하: {dict(zip(workers, map(len, owned)))} → 이동 {len(moves)}건")
+    for game_id, source, target in moves:
+        print(f"[rebalance] {game_id:.8} worker {source} → {target}")
+        if not dry_run:
+            await send(r, registry_queue(source), json.dumps({
+                "type": "migrate_out",
+                "body": {"game_id": game_id, "target": target}
+            }))
+    await r.close()
+    return moves
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="워커 간 게임 재분배")
+    parser.add_argument("--threshold", type=int, default=1, help="허용하는 최다/최소 부하 차이")
+    parser.add_argument("--dry-run", action="store_true", help="계획만 출력")
+    args = parser.parse_args()
+    if args.threshold < 1:
+        parser.error("--threshold는 1 이상이어야 합니다")
+    asyncio.run(rebalance(args.threshold, args.dry_run))
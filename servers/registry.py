@@ -1,5 +1,111 @@
-from sortedcontainers import SortedList
+import asyncio
+import json
+from collections import deque
+from time import monotonic
 
 game_registry = {} # dict[game_id] -> GameMananger
-timeouts = SortedList(key=lambda gm: gm.deadline)
-deadline = {}
\ No newline at end of file
+restored = asyncio.Event() # 워커 재시작 시 스냅샷 복구가 끝나면 set → step handler/timeout detector 시작
+
+# 🚚 마이그레이션 (servers/game_registry_manager.py 참고)
+# 메시지 처리는 await 없이 끝나므로 별도 락 없이 game_id 단위로 동결한다 (진행 중인 flush만 inbox.settle로 기다림)
+frozen = {}                # game_id -> (GameManager, [버퍼링된 원본 메시지]) : 이전 중인 게임
+forwarding = {}            # game_id -> (대상 워커, 만료 시각) : 이전 완료 후 늦게 도착한 메시지 전달용
+
+
+class Inbox:
+    """
+    step handler 입력. Redis 큐에서 옮겨 온 메시지와 같은 워커 안에서 생긴 메시지(타임아웃 등)를 game_id별 메일박스에 나눠 담는다.
+    한 게임의 메일박스는 한 번에 한 태스크만 맡으므로(claim ~ release) 게임 안에서는 FIFO, 서로 다른 게임은 동시에 처리된다.
+    """
+    def __init__(self, limit: int = 1000):
+        self.boxes = {}                # game_id → deque[(들어온 시각, 원본, 파싱된 메시지, 큐 항목 id)]
+        self.runnable = deque()        # 메시지가 있고 맡은 태스크가 없는 game_id
+        self.busy = set()              # 태스크가 맡고 있는 game_id
+        self.waiters = {}              # game_id → Event : settle() 대기
+        self.count = 0
+        self.limit = limit             # Redis에서 미리 옮겨 두는 최대 개수
+        self.ready = asyncio.Event()   # 맡을 수 있는 게임이 있음
+        self.space = asyncio.Event()   # limit 미만
+        self.space.set()
+
+    def put(self, raw: str, entry_id: str = None):
+        # entry_id: stream 모드에서 처리 후 ack할 큐 항목 id (같은 워커 안에서 생긴 메시지는 None)
+        self._put(raw, entry_id, front=False)
+        self._update()
+
+    def put_front(self, raws: list):
+        # 원래 순서대로 해당 게임 메일박스 맨 앞에 (마이그레이션 버퍼 복귀)
+        for raw in reversed(raws):
+            self._put(raw, None, front=True)
+        self._update()
+
+    def _put(self, raw: str, entry_id: str, front: bool):
+        msg = json.loads(raw)
+        game_id = msg.get("game_id")
+        box = self.boxes.get(game_id)
+        if box is None:
+            box = self.boxes[game_id] = deque()
+        if not box and game_id not in self.busy:
+            self.runnable.append(game_id)
+        entry = (monotonic(), raw, msg, entry_id)
+        if front:
+            box.appendleft(entry)
+        else:
+            box.append(entry)
+        self.count += 1
+
+    async def claim(self, limit: int) -> list:
+        """
+        맡을 수 있는 게임들에서 최대 limit개를 꺼내고 그 게임들을 맡는다. 처리가 끝나면 release()로 돌려준다.
+        Returns: [(game_id, [(들어온 시각, 원본, 파싱된 메시지, 큐 항목 id), ...]), ...]
+        """
+        while not self.runnable:
+            await self.ready.wait()
+        claimed = []
+        taken = 0
+        while self.runnable and taken < limit:
+            game_id = self.runnable.popleft()
+            box = self.boxes[game_id]
+            entries = [box.popleft() for _ in range(min(len(box), limit - taken))]
+            taken += len(entries)
+            self.busy.add(game_id)
+            claimed.append((game_id, entries))
+        self.count -= taken
+        self._update()
+        return claimed
+
+    def release(self, game_ids: list):
+        for game_id in game_ids:
+            self.busy.discard(game_id)
+            if self.boxes.get(game_id):
+                self.runnable.append(game_id)
+            else:
+                self.boxes.pop(game_id, None)
+            waiter = self.waiters.pop(game_id, None)
+            if waiter:
+                waiter.set()
+        self._update()
+
+    async def settle(self, game_id: str):
+        # game_id를 맡은 태스크가 flush까지 끝낼 때까지 기다린다
+        while game_id in self.busy:
+            await self.waiters.setdefault(game_id, asyncio.Event()).wait()
+
+    async def wait_space(self):
+        await self.space.wait()
+
+    def _update(self):
+        if self.runnable:
+            self.ready.set()
+        else:
+            self.ready.clear()
+        if self.count < self.limit:
+            self.space.set()
+        else:
+            self.space.clear()
+
+    def __len__(self):
+        return self.count
+
+
+inbox = Inbox()
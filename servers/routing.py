@@ -0,0 +1,138 @@
+# servers/routing.py
+
+"""
+game → worker 라우팅
+
+    - 새 게임의 배치: 워커 집합(routing:workers)으로 만든 consistent-hash 링 (가상 노드 VNODES개씩)
+      워커가 늘거나 줄어도 새 게임 중 약 1/N만 다른 워커로 간다.
+    - 진행 중인 게임: Redis 해시 game_routes(game_id → 워커)에 생성 시 고정해 둔다.
+      링이 바뀌어도 이미 배치된 게임은 움직이지 않고, 옮길 때는 마이그레이션으로 이 값만 바꾼다.
+
+프로세스마다 Router 하나(router)가 테이블 전체를 메모리에 들고 routing_updates 채널로 갱신을 받는다.
+따라서 hot path의 worker_for()는 Redis 왕복 없이 dict 조회 한 번이다.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import json
+import os
+
+from redis.asyncio import Redis
+
+ROUTES_KEY = "game_routes"
+WORKERS_KEY = "routing:workers"
+UPDATES_CHANNEL = "routing_updates"
+VNODES = 512  # 워커당 가상 노드 - 분포 편차 ~20% 이내 (bench_routing)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    def __init__(self, workers: list, vnodes: int = VNODES):
+        assert workers, "워커가 하나 이상 필요합니다"
+        points = sorted((_hash(f"worker:{w}#{v}"), w) for w in workers for v in range(vnodes))
+        self.workers = sorted(workers)
+        self.keys = [key for key, _ in points]
+        self.owners = [w for _, w in points]
+
+    def lookup(self, game_id: str) -> int:
+        k = bisect.bisect(self.keys, _hash(game_id))
+        return self.owners[k % len(self.keys)]
+
+
+class Router:
+    def __init__(self):
+        self.r = Redis(decode_responses=True)
+        self.routes = {}  # game_id → worker (game_routes의 로컬 사본)
+        self.ring = HashRing(list(range(int(os.getenv("NUM_WORKERS", 1)))))
+        self._task = None
+
+    async def start(self):
+        # 구독을 먼저 걸고 전체를 읽어야 그 사이 갱신을 놓치지 않는다 (여러 번 호출해도 한 번만 시작)
+        if self._task is not None:
+            return
+        pubsub = self.r.pubsub()
+        await pubsub.subscribe(UPDATES_CHANNEL)
+        self._task = asyncio.create_task(self._listen(pubsub))
+        await self._load_workers()
+        self.routes.update({game_id: int(w) for game_id, w in (await self.r.hgetall(ROUTES_KEY)).items()})
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _load_workers(self):
+        workers = sorted(int(w) for w in await self.r.smembers(WORKERS_KEY))
+        if workers and workers != self.ring.workers:
+            self.ring = HashRing(workers)
+
+    async def _listen(self, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                update = json.loads(message["data"])
+                if update["op"] == "set":
+                    self.routes[update["game_id"]] = update["worker"]
+                elif update["op"] == "del":
+                    self.routes.pop(update["game_id"], None)
+                elif update["op"] == "workers":
+                    await self._load_workers()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await pubsub.unsubscribe(UPDATES_CHANNEL)
+            await pubsub.close()
+
+    # ---------------- 조회 (hot path, Redis 왕복 없음) ----------------
+
+    def worker_for(self, game_id: str) -> int:
+        worker = self.routes.get(game_id)
+        if worker is None:
+            # 갱신이 아직 도착하지 않은 새 게임: 배치 규칙이 결정적이므로 링으로 계산한 값과 같다
+            worker = self.ring.lookup(game_id)
+        return worker
+
+    # ---------------- 갱신 (테이블 기록 + 모든 프로세스에 전파) ----------------
+
+    async def assign(self, game_id: str) -> int:
+        # 게임 생성 시 링으로 배치를 정하고 고정한다
+        await self.start()
+        worker = self.ring.lookup(game_id)
+        await self.set_route(game_id, worker)
+        return worker
+
+    async def set_route(self, game_id: str, worker: int):
+        self.routes[game_id] = worker
+        await self.r.hset(ROUTES_KEY, game_id, worker)
+        await self.r.publish(UPDATES_CHANNEL, json.dumps({"op": "set", "game_id": game_id, "worker": worker}))
+
+    async def clear_route(self, game_id: str):
+        self.routes.pop(game_id, None)
+        await self.r.hdel(ROUTES_KEY, game_id)
+        await self.r.publish(UPDATES_CHANNEL, json.dumps({"op": "del", "game_id": game_id}))
+
+    async def register_worker(self, worker: int):
+        # 워커 프로세스 시작 시 링에 참여 (재시작해도 그대로)
+        if await self.r.sadd(WORKERS_KEY, worker):
+            await self.r.publish(UPDATES_CHANNEL, json.dumps({"op": "workers"}))
+        await self._load_workers()
+
+    async def workers(self) -> list:
+        await self._load_workers()
+        return self.ring.workers
+
+
+router = Router()
+
+
+def step_queue(worker: int) -> str:
+    return f"game_step_handler_queue_{worker}"
+
+
+def registry_queue(worker: int) -> str:
+    return f"game_registry_manager_queue_{worker}"
@@ -0,0 +1,274 @@
+# servers/snapshot.py
+
+"""
+GameManager 바이너리 스냅샷 (크래시 복구용)
+
+게임마다 Redis 키 두 개를 쓴다.
+    game:{game_id}:snapshot:static  게임 생성 시 한 번 - 변하지 않는 설정 (id, 플레이어, 블라인드, 시간, 시드)
+    game:{game_id}:snapshot         액션마다 - 진행 상태 (칩, 순위, 라운드/베팅/덱 상태)
+
+홀카드와 보드는 덱 순서와 커서에서 다시 계산할 수 있으므로 따로 저장하지 않는다.
+(홀카드 = 덱 앞에서부터 2장씩, 보드 = 그 다음부터 커서까지)
+"""
+
+import asyncio
+import gc
+import struct
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from app.services.game_manager import GameManager
+from holdemlogic import RoundManager
+
+VERSION = 1
+
+rb = Redis()  # 바이너리 값이므로 decode_responses=False
+
+_STATIC_HEAD = struct.Struct("<BBqqddddd")   # version, n, sb, bb, base_time, timebank, grace, round_delay, start_time
+_STATE_HEAD = struct.Struct("<BBIIBdB")      # version, flags, action_count, round_count, sb_index, deadline, survived
+_ROUND_HEAD = struct.Struct("<BQB52sdBBBBq")  # m, seed, deck pos, deck order, deadline, stage, i, folded, dead_raise, min_raise_by
+_ACTION = struct.Struct("<BId")               # seat, amount, t
+
+_DONE, _SLEEPING, _HAS_ROUND, _VERBOSE = (1 << k for k in range(4))       # GameManager 플래그
+_FINISHED, _SEEDED = (1 << k for k in range(2))                            # 라운드 플래그
+
+
+@lru_cache(maxsize=None)
+def _ints(count: int) -> struct.Struct:
+    return struct.Struct(f"<{count}q")
+
+
+@lru_cache(maxsize=None)
+def _floats(count: int) -> struct.Struct:
+    return struct.Struct(f"<{count}d")
+
+
+def _pack_strs(strs: list) -> bytes:
+    # 문자열 목록을 NUL 구분 블록 하나로 (복원 시 decode/split 한 번)
+    return "\0".join(strs).encode()
+
+
+def _bits(flags: list) -> int:
+    return sum(1 << k for k, flag in enumerate(flags) if flag)
+
+
+# ================================================================
+# ✅ 인코딩
+# ================================================================
+
+def encode_static(gm: GameManager) -> bytes:
+    parts = [
+        _STATIC_HEAD.pack(VERSION, gm.n, gm.sb, gm.bb, gm.base_time, gm.timebank, gm.grace, gm.round_delay, gm._start_time),
+        struct.pack("<Q", gm.seed),
+        _pack_strs([gm.game_id, gm.game_type] + gm.uids + gm.player_ids),
+    ]
+    return b"".join(parts)
+
+
+def encode_state(gm: GameManager) -> bytes:
+    n = gm.n
+    has_round = getattr(gm, "round", None) is not None
+    flags = _bits([gm.done, gm.is_sleeping, has_round, gm.verbose])
+    parts = [
+        _STATE_HEAD.pack(VERSION, flags, gm.action_count, gm.round_count, gm.sb_index, gm.deadline, _bits(gm.survived)),
+        _ints(n).pack(*gm.chips),
+        bytes(255 if r is None else r for r in gm.round_index),
+    ]
+
+    # 순위 그룹: 게임 인덱스로 저장
+    parts.append(bytes([len(gm.rankings)]))
+    for group in gm.rankings:
+        parts.append(bytes([len(group)] + [gm.player_ids.index(pid) for pid in group]))
+
+    if has_round:
+        rm = gm.round
+        bm = rm.bm
+        m = rm.n
+        parts += [
+            bytes([_bits([bm.finished, rm.seed is not None])]),
+            _ROUND_HEAD.pack(m, rm.seed or 0, rm.deck.pos, bytes(rm.deck.codes()), rm.deadline,
+                             bm.stage, bm.i, _bits(bm.folded), bm.dead_raise, bm.min_raise_by),
+            _ints(m).pack(*rm.initial_chips),
+            _ints(m).pack(*bm.chips),
+            _ints(m).pack(*bm.contributions),
+            bytes(min(c, 255) for c in bm.action_cnt),
+            _floats(m).pack(*rm.timebanks),
+            struct.pack("<H", len(rm.actions)),
+        ]
+        parts += [_ACTION.pack(seat, amt, t) for seat, amt, t in rm.actions]
+    return b"".join(parts)
+
+
+# ================================================================
+# ✅ 디코딩
+# ================================================================
+
+def decode(static: bytes, state: bytes) -> GameManager:
+    version, n, sb, bb, base_time, timebank, grace, round_delay, start_time = _STATIC_HEAD.unpack_from(static, 0)
+    assert version == VERSION, f"지원하지 않는 스냅샷 버전: {version}"
+    pos = _STATIC_HEAD.size
+    (seed,) = struct.unpack_from("<Q", static, pos)
+    strs = static[pos + 8:].decode().split("\0")
+    game_id, game_type, uids, player_ids = strs[0], strs[1], strs[2:2 + n], strs[2 + n:2 + 2 * n]
+
+    version, flags, action_count, round_count, sb_index, deadline, survived = _STATE_HEAD.unpack_from(state, 0)
+    assert version == VERSION, f"지원하지 않는 스냅샷 버전: {version}"
+    pos = _STATE_HEAD.size
+    chips = list(_ints(n).unpack_from(state, pos))
+    pos += 8 * n
+
+    gm = GameManager(game_id=game_id, game_type=game_type, uids=uids, player_ids=player_ids, chips=chips,
+                     sb=sb, bb=bb, base_time=base_time, timebank=timebank, grace=grace,
+                     round_delay=round_delay, seed=seed)
+    gm._start_time = start_time
+    gm.done = bool(flags & _DONE)
+    gm.is_sleeping = bool(flags & _SLEEPING)
+    gm.verbose = bool(flags & _VERBOSE)
+    gm.action_count = action_count
+    gm.round_count = round_count
+    gm.sb_index = sb_index
+    gm.deadline = deadline
+    gm.survived = [bool(survived >> k & 1) for k in range(n)]
+    gm.round_index = [None if r == 255 else r for r in state[pos:pos + n]]
+    pos += n
+    gm.round_index_to_game_index = [-1] * sum(r is not None for r in gm.round_index)
+    for game_index, round_index in enumerate(gm.round_index):
+        if round_index is not None:
+            gm.round_index_to_game_index[round_index] = game_index
+
+    groups = state[pos]
+    pos += 1
+    gm.rankings = []
+    for _ in range(groups):
+        size = state[pos]
+        gm.rankings.append([player_ids[k] for k in state[pos + 1:pos + 1 + size]])
+        pos += 1 + size
+
+    if flags & _HAS_ROUND:
+        gm.round = _decode_round(state, pos, gm)
+    return gm
+
+
+def _decode_round(state: bytes, pos: int, gm: GameManager) -> RoundManager:
+    round_flags = state[pos]
+    pos += 1
+    m, seed, deck_pos, order, deadline, stage, i, folded, dead_raise, min_raise_by = _ROUND_HEAD.unpack_from(state, pos)
+    pos += _ROUND_HEAD.size
+    initial_chips = list(_ints(m).unpack_from(state, pos))
+    pos += 8 * m
+    chips = list(_ints(m).unpack_from(state, pos))
+    pos += 8 * m
+    contributions = list(_ints(m).unpack_from(state, pos))
+    pos += 8 * m
+    action_cnt = list(state[pos:pos + m])
+    pos += m
+    timebanks = list(_floats(m).unpack_from(state, pos))
+    pos += 8 * m
+    (count,) = struct.unpack_from("<H", state, pos)
+    pos += 2
+    actions = [_ACTION.unpack_from(state, pos + k * _ACTION.size) for k in range(count)]
+
+    rm = RoundManager(initial_chips, gm.sb, gm.bb, base_time=gm.base_time, timebank=gm.timebank, grace=gm.grace,
+                      seed=seed if round_flags & _SEEDED else None, deck_order=list(order))
+    # 생성자가 홀카드 2m장을 딜링했으므로 나머지(보드)만 커서까지 다시 뽑는다
+    if rm.deck.pos < deck_pos:
+        rm.board += rm.deck.draw_codes(deck_pos - rm.deck.pos)
+    rm.deadline = deadline
+    rm.timebanks = timebanks
+    rm.actions = actions
+
+    bm = rm.bm
+    bm.chips = chips
+    bm.contributions = contributions
+    bm.folded = [bool(folded >> k & 1) for k in range(m)]
+    bm.action_cnt = action_cnt
+    bm.stage = stage
+    bm.i = i
+    bm.finished = bool(round_flags & _FINISHED)
+    bm.dead_raise = bool(dead_raise)
+    bm.min_raise_by = min_raise_by
+    bm._recount()
+    rm.chips = chips[:]
+    return rm
+
+
+# ================================================================
+# ✅ Redis 저장/조회
+# ================================================================
+
+LOAD_CHUNK = 500  # MGET 한 번에 가져올 게임 수
+
+
+def owned_key(worker: int) -> str:
+    # 워커(샤드)가 보유한 게임 목록 - 재시작 시 복구 대상
+    return f"worker:{worker}:games"
+
+
+async def save_static_snapshot(gm: GameManager, worker: int):
+    async with rb.pipeline(transaction=False) as pipe:
+        pipe.set(f"game:{gm.game_id}:snapshot:static", encode_static(gm))
+        pipe.sadd(owned_key(worker), gm.game_id)
+        await pipe.execute()
+
+
+async def save_snapshot(gm: GameManager):
+    await rb.set(f"game:{gm.game_id}:snapshot", encode_state(gm))
+
+
+def stage_snapshot(pipe, gm: GameManager):
+    # save_snapshot과 같지만 파이프라인에 쌓기만 한다 (step handler 배치 flush)
+    pipe.set(f"game:{gm.game_id}:snapshot", encode_state(gm))
+
+
+async def load_snapshot(game_id: str) -> GameManager:
+    static, state = await rb.mget(f"game:{game_id}:snapshot:static", f"game:{game_id}:snapshot")
+    if static is None or state is None:
+        return None
+    return decode(static, state)
+
+
+async def load_owned_snapshots(worker: int) -> tuple:
+    """
+    워커가 보유한 모든 게임의 스냅샷을 읽어 GameManager로 복원한다.
+    MGET을 LOAD_CHUNK 단위로 나눠 동시에 요청하므로 왕복은 사실상 한 번이다.
+    Returns: (복원된 GameManager 목록, 스냅샷이 없거나 깨진 game_id 목록)
+    """
+    game_ids = sorted(game_id.decode() for game_id in await rb.smembers(owned_key(worker)))
+    chunks = [game_ids[k:k + LOAD_CHUNK] for k in range(0, len(game_ids), LOAD_CHUNK)]
+    blobs = await asyncio.gather(*(
+        rb.mget([key for game_id in chunk for key in (f"game:{game_id}:snapshot:static", f"game:{game_id}:snapshot")])
+        for chunk in chunks
+    ))
+
+    restored, missing = [], []
+    gc.disable()  # 수천 개 객체를 한꺼번에 만들 때 순환 GC가 복원 시간의 대부분을 차지한다
+    try:
+        for chunk, values in zip(chunks, blobs):
+            for k, game_id in enumerate(chunk):
+                static, state = values[2 * k], values[2 * k + 1]
+                try:
+                    assert static is not None and state is not None, "스냅샷 없음"
+                    restored.append(decode(static, state))
+                except Exception:
+                    missing.append(game_id)
+    finally:
+        gc.enable()
+    return restored, missing
+
+
+async def move_owned(game_id: str, source: int, target: int):
+    # 마이그레이션 시 보유 워커 변경 (SMOVE - 원자적)
+    await rb.smove(owned_key(source), owned_key(target), game_id)
+
+
+def stage_disown(pipe, game_id: str, worker: int):
+    # 끝난 게임은 보유 목록에서 뺀다 (복구/재분배 대상 아님)
+    pipe.srem(owned_key(worker), game_id)
+
+
+async def delete_snapshot(game_id: str, worker: int):
+    async with rb.pipeline(transaction=False) as pipe:
+        pipe.delete(f"game:{game_id}:snapshot:static", f"game:{game_id}:snapshot")
+        pipe.srem(owned_key(worker), game_id)
+        await pipe.execute()
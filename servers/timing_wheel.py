@@ -0,0 +1,118 @@
+# servers/timing_wheel.py
+
+"""
+계층형 타이밍 휠 (게임 데드라인용)
+
+    레벨 0: 256칸 x 1 tick      (tick = 1ms → 256ms)
+    레벨 1:  64칸 x 256 tick    (~16초)
+    레벨 2:  64칸 x 16384 tick  (~17분)
+    레벨 3:  64칸 x 1048576 tick (~18시간, 그 이상은 마지막 칸에 두고 다시 내려보낸다)
+
+타이머는 (game_id, action_count)로 식별한다. 같은 게임을 다시 예약하면 armed[game_id]만 새 action_count로 바뀌고
+이전 항목은 칸에 남아 있다가 발화/재배치 시점에 action_count가 맞지 않아 버려진다.
+따라서 예약/취소/재예약 모두 O(1)이고 칸을 뒤지지 않는다.
+"""
+
+import math
+
+TICK = 0.001
+LEVEL_BITS = (8, 6, 6, 6)
+
+
+class TimingWheel:
+    def __init__(self, now: float, tick: float = TICK):
+        self.tick = tick
+        self.current = int(now / tick)  # 마지막으로 처리한 tick
+        self.shifts = []
+        shift = 0
+        for bits in LEVEL_BITS:
+            self.shifts.append(shift)
+            shift += bits
+        self.masks = [(1 << bits) - 1 for bits in LEVEL_BITS]
+        self.levels = [[[] for _ in range(1 << bits)] for bits in LEVEL_BITS]
+        self.sizes = [0] * len(LEVEL_BITS)  # 레벨별 항목 수 (버려질 항목 포함)
+        self.armed = {}                 # game_id → 유효한 action_count
+
+    def __len__(self):
+        return len(self.armed)
+
+    def schedule(self, game_id: str, action_count: int, deadline: float):
+        self.armed[game_id] = action_count
+        self._place((max(self.current + 1, math.ceil(deadline / self.tick)), game_id, action_count))
+
+    def cancel(self, game_id: str):
+        self.armed.pop(game_id, None)
+
+    def _place(self, entry: tuple):
+        when = entry[0]
+        delta = when - self.current
+        level = 0
+        while level < len(self.shifts) - 1 and delta >= 1 << (self.shifts[level] + LEVEL_BITS[level]):
+            level += 1
+        shift = self.shifts[level]
+        if delta >= 1 << (shift + LEVEL_BITS[level]):
+            when = self.current + (self.masks[level] << shift)  # 범위 밖: 마지막 레벨에 두었다가 다시 내려보낸다
+        self.levels[level][(when >> shift) & self.masks[level]].append(entry)
+        self.sizes[level] += 1
+
+    def _cascade(self):
+        # 레벨 0이 한 바퀴 돌 때마다 위 레벨의 현재 칸을 아래로 다시 배치
+        for level in range(1, len(self.shifts)):
+            shift = self.shifts[level]
+            slot = self.levels[level][(self.current >> shift) & self.masks[level]]
+            if slot:
+                entries = slot[:]
+                slot.clear()
+                self.sizes[level] -= len(entries)
+                for entry in entries:
+                    if self.armed.get(entry[1]) == entry[2]:
+                        self._place(entry)
+            if (self.current >> shift) & self.masks[level]:
+                break  # 이 레벨이 한 바퀴를 돈 게 아니면 더 위는 그대로
+
+    def advance(self, now: float) -> list:
+        """
+        now까지 시간을 진행하고 만료된 (game_id, action_count) 목록을 반환한다.
+        """
+        target = int(now / self.tick)
+        expired = []
+        while self.current < target:
+            if self.sizes[0] == 0:
+                # 레벨 0이 비었으면 다음 한 바퀴 경계로 바로 건너뛴다
+                boundary = (self.current | self.masks[0]) + 1
+                if boundary > target:
+                    self.current = target
+                    break
+                self.current = boundary
+                self._cascade()
+            else:
+                self.current += 1
+                if self.current & self.masks[0] == 0:
+                    self._cascade()
+            slot = self.levels[0][self.current & self.masks[0]]
+            if slot:
+                self.sizes[0] -= len(slot)
+                for _, game_id, action_count in slot:
+                    if self.armed.get(game_id) == action_count:
+                        del self.armed[game_id]
+                        expired.append((game_id, action_count))
+                slot.clear()
+        return expired
+
+    def next_wake(self) -> float:
+        """
+        다음에 advance()가 할 일이 생기는 시각 (가장 낮은 비어 있지 않은 레벨의 다음 칸). 타이머가 없으면 None.
+        """
+        if not self.armed:
+            return None
+        for level, shift in enumerate(self.shifts):
+            if self.sizes[level] == 0:
+                continue
+            mask = self.masks[level]
+            block = self.current >> shift
+            wrap = (block | mask) + 1  # 이 레벨이 한 바퀴 도는 지점 - 위 레벨 캐스케이드가 먼저
+            for b in range(block + 1, wrap):
+                if self.levels[level][b & mask]:
+                    return (b << shift) * self.tick
+            return (wrap << shift) * self.tick
+        return None
@@ -0,0 +1,119 @@
+# servers/transport.py
+
+"""
+워커 큐 전송 방식 (QUEUE_MODE)
+
+    list   : Redis 리스트 RPUSH / BLPOP (+ LPOP count). 꺼낸 뒤 워커가 죽으면 메시지를 잃는다. (기본값)
+    stream : Redis Streams + 컨슈머 그룹. XADD / XREADGROUP COUNT로 읽고 처리가 끝나면 XACK.
+             ack 전에 워커가 죽으면 재시작 시 자기 pending 항목을 다시 읽고,
+             CLAIM_IDLE 넘게 ack되지 않은 항목은 XAUTOCLAIM으로 가져온다. 같은 메시지가 두 번 처리될 수 있으므로
+             처리 쪽은 action_count/존재 여부로 중복을 거른다.
+
+큐 이름은 두 방식이 같다 (game_step_handler_queue_i, game_registry_manager_queue_i). 보내는 쪽과 받는 쪽의 QUEUE_MODE가 같아야 한다.
+"""
+
+import os
+from time import monotonic
+
+from redis.exceptions import ResponseError
+
+QUEUE_MODE = os.getenv("QUEUE_MODE", "list")
+GROUP = "workers"
+FIELD = "m"
+STREAM_MAXLEN = int(os.getenv("STREAM_MAXLEN", 100_000))  # 근사 trim - ack 안 된 항목이 이보다 많이 밀리면 잘릴 수 있다
+BLOCK_MS = 1000
+CLAIM_IDLE_MS = 30_000
+CLAIM_INTERVAL = 10.0
+
+assert QUEUE_MODE in ("list", "stream"), f"알 수 없는 QUEUE_MODE={QUEUE_MODE}"
+
+
+def send(redis, queue: str, raw: str):
+    """
+    큐에 메시지 하나를 넣는다. redis가 클라이언트면 await할 코루틴을, 파이프라인이면 쌓기만 한다.
+    """
+    if QUEUE_MODE == "stream":
+        return redis.xadd(queue, {FIELD: raw}, maxlen=STREAM_MAXLEN, approximate=True)
+    return redis.rpush(queue, raw)
+
+
+def stage_ack(pipe, queue: str, entry_ids: list):
+    # 처리가 끝난 항목 ack (list 모드에서는 할 일 없음)
+    entry_ids = [entry_id for entry_id in entry_ids if entry_id is not None]
+    if QUEUE_MODE == "stream" and entry_ids:
+        pipe.xack(queue, GROUP, *entry_ids)
+
+
+class QueueReader:
+    """
+    워커 큐 하나를 읽는다. read()는 [(항목 id, 원본 메시지)]를 돌려주고, 처리가 끝나면 ack()/stage_ack()로 알린다.
+    list 모드의 항목 id는 None이다.
+    """
+    def __init__(self, redis, queue: str, worker: int):
+        self.redis = redis
+        self.queue = queue
+        self.consumer = f"worker-{worker}"  # 재시작해도 같은 이름 → 자기 pending 항목을 다시 읽는다
+        self.pending_from = "0"             # 시작 직후엔 ack 못 한 자기 항목부터 (다 읽으면 None)
+        self.next_claim = 0.0
+
+    async def start(self):
+        if QUEUE_MODE != "stream":
+            return
+        try:
+            # id=0: 스트림에 이미 쌓여 있던 항목도 읽는다 (list → stream 전환 직후 포함)
+            await self.redis.xgroup_create(self.queue, GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self, count: int) -> list:
+        if QUEUE_MODE == "stream":
+            return await self._read_stream(count)
+        _, raw = await self.redis.blpop(self.queue)
+        raws = [raw]
+        if count > 1:
+            raws += await self.redis.lpop(self.queue, count - 1) or []
+        return [(None, raw) for raw in raws]
+
+    async def _read_stream(self, count: int) -> list:
+        if self.pending_from is not None:
+            entries = await self._xreadgroup(self.pending_from, count, block=None)
+            if entries:
+                self.pending_from = entries[-1][0]
+                return await self._live(entries)
+            self.pending_from = None
+        if monotonic() >= self.next_claim:
+            self.next_claim = monotonic() + CLAIM_INTERVAL
+            _, entries, *_ = await self.redis.xautoclaim(self.queue, GROUP, self.consumer, CLAIM_IDLE_MS, count=count)
+            if entries:
+                return await self._live(entries)
+        return await self._live(await self._xreadgroup(">", count, block=BLOCK_MS))
+
+    async def _xreadgroup(self, start: str, count: int, block) -> list:
+        response = await self.redis.xreadgroup(GROUP, self.consumer, {self.queue: start}, count=count, block=block)
+        return response[0][1] if response else []
+
+    async def _live(self, entries: list) -> list:
+        # trim으로 본문이 사라진 항목은 돌려주지 않고 바로 ack
+        dead = [entry_id for entry_id, fields in entries if FIELD not in (fields or {})]
+        if dead:
+            await self.ack(dead)
+        return [(entry_id, fields[FIELD]) for entry_id, fields in entries if FIELD in (fields or {})]
+
+    async def ack(self, entry_ids: list):
+        entry_ids = [entry_id for entry_id in entry_ids if entry_id is not None]
+        if QUEUE_MODE == "stream" and entry_ids:
+            await self.redis.xack(self.queue, GROUP, *entry_ids)
+
+    async def stats(self) -> dict:
+        """
+        큐 길이와 지연. stream: length(XLEN), pending(읽었지만 ack 안 됨), lag(아직 안 읽음, Redis 7+)
+        """
+        if QUEUE_MODE != "stream":
+            return {"length": await self.redis.llen(self.queue)}
+        stats = {"length": await self.redis.xlen(self.queue)}
+        for group in await self.redis.xinfo_groups(self.queue):
+            if group["name"] == GROUP:
+                stats["pending"] = group["pending"]
+                stats["lag"] = group.get("lag")
+        return stats
@@ -0,0 +1,33 @@
+# tests/test_rebalance.py
+
+import pytest
+
+from servers.rebalance import plan_moves
+
+
+def _apply(owned, moves):
+    loads = [set(games) for games in owned]
+    for game_id, source, target in moves:
+        loads[source].remove(game_id)
+        loads[target].add(game_id)
+    return [len(games) for games in loads]
+
+
+def test_uneven_total_stops_within_threshold():
+    owned = [["a", "b", "c"], ["d", "e"]]
+    assert plan_moves(owned, 1) == []
+
+    owned = [["a", "b", "c", "d", "e", "f", "g"], [], ["h"]]
+    sizes = _apply(owned, plan_moves(owned, 1))
+    assert sum(sizes) == 8 and max(sizes) - min(sizes) == 1
+
+
+def test_even_total_balances_exactly():
+    owned = [["a", "b", "c", "d"], []]
+    sizes = _apply(owned, plan_moves(owned, 1))
+    assert sizes == [2, 2]
+
+
+def test_threshold_below_one_rejected():
+    with pytest.raises(AssertionError):
+        plan_moves([["a", "b", "c"], ["d", "e"]], 0)
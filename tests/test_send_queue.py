@@ -0,0 +1,76 @@
+# tests/test_send_queue.py
+
+import asyncio
+
+from app.network.send_queue import SendQueue, ERROR_CLOSE_CODE, REPLACED_CLOSE_CODE
+from app.protocol import wire
+
+
+class _Socket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames = []
+        self.closed = None
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.frames.append(text)
+
+    async def send_bytes(self, data):
+        await asyncio.sleep(self.delay)
+        self.frames.append(data)
+
+    async def close(self, code=None):
+        self.closed = code
+
+
+class _BrokenSocket(_Socket):
+    async def send_text(self, text):
+        raise RuntimeError("broken pipe")
+
+
+def test_drain_sends_last_message_before_close():
+    async def main():
+        ws = _Socket(delay=0.01)
+        conn = SendQueue(ws, "uid00000")
+        conn.push("state")
+        conn.push(wire.encode({"type": "error", "errormsg": "boom"}))  # format=msgpack 연결의 마지막 오류
+        await conn.drain()
+        conn.close()
+        return ws.frames
+    frames = asyncio.run(main())
+    assert frames[0] == "state"
+    assert wire.decode(frames[1]) == {"type": "error", "errormsg": "boom"}
+
+
+def test_overflow_closes_slow_consumer():
+    async def main():
+        ws = _Socket(delay=1.0)
+        conn = SendQueue(ws, "uid00000", limit=2)
+        results = [conn.push(f"m{k}") for k in range(4)]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return results, conn.closed, ws.closed
+    results, closed, code = asyncio.run(main())
+    assert results[-1] is False and closed and code == 1013
+
+
+def test_send_failure_closes_socket():
+    async def main():
+        ws = _BrokenSocket()
+        conn = SendQueue(ws, "uid00000")
+        conn.push("state")
+        await asyncio.sleep(0.01)
+        return conn.push("next"), conn.closed, ws.closed
+    pushed, closed, code = asyncio.run(main())
+    assert pushed is False and closed and code == ERROR_CLOSE_CODE
+
+
+def test_replaced_connection_closes_socket():
+    async def main():
+        ws = _Socket()
+        old = SendQueue(ws, "uid00000")
+        old.close(REPLACED_CLOSE_CODE)  # 같은 uid로 새 연결이 들어왔을 때
+        await asyncio.sleep(0)
+        return ws.closed
+    assert asyncio.run(main()) == REPLACED_CLOSE_CODE
@@ -0,0 +1,16 @@
+# tests/test_simulator.py
+
+import holdemlogic.simulator as simulator
+
+
+def test_truncated_games_are_not_counted_as_wins(monkeypatch):
+    monkeypatch.setattr(simulator, "MAX_ROUNDS", 3)
+    report = simulator.simulate(4, players=2, policies=[simulator.check_call_policy] * 2)
+    assert report.games == 4
+    assert report.truncated == 4
+    assert report.wins == {}
+
+
+def test_finished_games_count_wins():
+    report = simulator.simulate(5, players=3, seed=1)
+    assert report.truncated + sum(report.wins.values()) == report.games == 5
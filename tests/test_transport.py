@@ -0,0 +1,161 @@
+# tests/test_transport.py
+
+"""
+servers/transport.py를 로컬 Redis(localhost:6379)에 붙여 돌린다. 서버가 없으면 건너뛴다.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import redis
+from redis.asyncio import Redis
+
+import servers.transport as transport
+from servers.transport import GROUP, QueueReader, send, stage_ack
+
+
+def _reachable() -> bool:
+    try:
+        return redis.Redis(socket_connect_timeout=0.5).ping()
+    except redis.exceptions.ConnectionError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _reachable(), reason="로컬 Redis 서버 없음")
+
+
+@pytest.fixture
+def stream_mode(monkeypatch):
+    monkeypatch.setattr(transport, "QUEUE_MODE", "stream")
+    monkeypatch.setattr(transport, "BLOCK_MS", 50)
+
+
+@pytest.fixture
+def queue():
+    name = f"test_transport_{uuid.uuid4().hex}"
+    yield name
+    redis.Redis().delete(name)
+
+
+def _run(test, queue):
+    async def main():
+        r = Redis(decode_responses=True)
+        try:
+            await test(r, queue)
+        finally:
+            await r.aclose()
+    asyncio.run(main())
+
+
+def test_group_create_is_idempotent(stream_mode, queue):
+    async def test(r, queue):
+        await QueueReader(r, queue, 0).start()
+        await QueueReader(r, queue, 0).start()  # 재시작: BUSYGROUP은 무시
+        groups = await r.xinfo_groups(queue)
+        assert [g["name"] for g in groups] == [GROUP]
+        assert await r.xlen(queue) == 0  # MKSTREAM으로 빈 스트림이 생김
+    _run(test, queue)
+
+
+def test_group_reads_entries_sent_before_start(stream_mode, queue):
+    async def test(r, queue):
+        await send(r, queue, "early")
+        reader = QueueReader(r, queue, 0)
+        await reader.start()
+        assert [raw for _, raw in await reader.read(10)] == ["early"]
+    _run(test, queue)
+
+
+def test_read_then_ack(stream_mode, queue):
+    async def test(r, queue):
+        reader = QueueReader(r, queue, 0)
+        await reader.start()
+        for k in range(3):
+            await send(r, queue, f"m{k}")
+        entries = await reader.read(10)
+        assert [raw for _, raw in entries] == ["m0", "m1", "m2"]
+        assert (await r.xpending(queue, GROUP))["pending"] == 3
+        stats = await reader.stats()
+        assert stats["length"] == 3 and stats["pending"] == 3
+
+        await reader.ack([entry_id for entry_id, _ in entries])
+        assert (await r.xpending(queue, GROUP))["pending"] == 0
+        assert await reader.read(10) == []
+    _run(test, queue)
+
+
+def test_stage_ack_in_pipeline(stream_mode, queue):
+    async def test(r, queue):
+        reader = QueueReader(r, queue, 0)
+        await reader.start()
+        await send(r, queue, "m")
+        entries = await reader.read(10)
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(f"{queue}:result", "done")  # 처리 결과와 같은 파이프라인에서 ack
+            stage_ack(pipe, queue, [entry_id for entry_id, _ in entries] + [None])
+            await pipe.execute()
+        assert (await r.xpending(queue, GROUP))["pending"] == 0
+        await r.delete(f"{queue}:result")
+    _run(test, queue)
+
+
+def test_crash_before_ack_redelivers_on_restart(stream_mode, queue):
+    async def test(r, queue):
+        reader = QueueReader(r, queue, 0)
+        await reader.start()
+        await send(r, queue, "m0")
+        await send(r, queue, "m1")
+        first = await reader.read(10)  # 처리 도중 죽음 - ack 없음
+        assert (await r.xpending(queue, GROUP))["pending"] == 2
+
+        restarted = QueueReader(r, queue, 0)  # 같은 컨슈머 이름
+        await restarted.start()
+        await send(r, queue, "m2")
+        again = await restarted.read(10)
+        assert again == first  # 자기 pending 항목부터
+        await restarted.ack([entry_id for entry_id, _ in again])
+        assert [raw for _, raw in await restarted.read(10)] == ["m2"]
+    _run(test, queue)
+
+
+def test_autoclaim_takes_over_dead_consumer(stream_mode, queue, monkeypatch):
+    monkeypatch.setattr(transport, "CLAIM_IDLE_MS", 50)
+
+    async def test(r, queue):
+        dead = QueueReader(r, queue, 0)
+        await dead.start()
+        await send(r, queue, "orphan")
+        entries = await dead.read(10)  # worker-0이 읽고 죽음
+
+        await asyncio.sleep(0.1)
+        alive = QueueReader(r, queue, 1)
+        await alive.start()
+        claimed = await alive.read(10)
+        assert claimed == entries
+        pending = await r.xpending_range(queue, GROUP, "-", "+", 10)
+        assert [p["consumer"] for p in pending] == ["worker-1"]
+        await alive.ack([entry_id for entry_id, _ in claimed])
+        assert (await r.xpending(queue, GROUP))["pending"] == 0
+    _run(test, queue)
+
+
+def test_list_mode_unchanged(monkeypatch, queue):
+    monkeypatch.setattr(transport, "QUEUE_MODE", "list")
+
+    async def test(r, queue):
+        reader = QueueReader(r, queue, 0)
+        await reader.start()
+        assert await r.exists(queue) == 0  # 그룹/스트림을 만들지 않음
+        for k in range(3):
+            await send(r, queue, f"m{k}")
+        assert await r.type(queue) == "list"
+        assert await reader.read(2) == [(None, "m0"), (None, "m1")]
+        assert await reader.read(10) == [(None, "m2")]
+
+        await reader.ack([None])
+        async with r.pipeline(transaction=False) as pipe:
+            stage_ack(pipe, queue, [None])
+            assert len(pipe) == 0
+        assert await reader.stats() == {"length": 0}
+    _run(test, queue)
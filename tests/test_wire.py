@@ -0,0 +1,128 @@
+# tests/test_wire.py
+
+"""
+app/protocol/wire.py의 MessagePack 위치 스키마가 pydantic 모델과 왕복하는지 확인한다.
+message_models에서 필드 순서가 바뀌거나 필드가 추가되면 여기서 깨진다.
+"""
+
+import msgpack
+import pytest
+
+from app.protocol import wire
+from app.protocol.message_models import (
+    ErrorMessage, ErrorPayload, PlayerInfo, RoundResultMessage, RoundResultPayload, RoundResultPlayerInfo,
+    StateBroadcastMessage, StateMessage, StatePayload,
+)
+
+
+def _state(player_id: str = "*", hole_cards=("??", "??")) -> StateMessage:
+    return StateMessage(
+        type="state_update",
+        game_id="g1",
+        player_id=player_id,
+        payload=StatePayload(
+            stage="flop",
+            turn="p2",
+            board=["A♠", "K♥", "7♦"],
+            sb=5,
+            bb=10,
+            minraiseby=20,
+            players=[
+                PlayerInfo(pid="p1", position="SB", hole_cards=list(hole_cards), folded=False, chips=990, bet=10,
+                           timebank=12.5, remaining_time=None),
+                PlayerInfo(pid="p2", position="BB", hole_cards=["??", "??"], folded=False, chips=980, bet=20,
+                           timebank=3.25, remaining_time=9.75),
+                PlayerInfo(pid="p3", position="BTN", hole_cards=None, folded=True, chips=0, bet=None),
+            ],
+            action_count=7,
+        ),
+    )
+
+
+def _round_result() -> RoundResultMessage:
+    return RoundResultMessage(
+        type="round_result",
+        game_id="g1",
+        player_id="p1",
+        payload=RoundResultPayload(
+            board=["A♠", "K♥", "7♦", "2♣", "T♠"],
+            players=[
+                RoundResultPlayerInfo(pid="p1", chips=1030, payout=60, bet=30, change=30, hand="Pair",
+                                      hole_cards=["A♥", "9♣"]),
+                RoundResultPlayerInfo(pid="p2", chips=970, payout=0, bet=30, change=-30, hand="???",
+                                      hole_cards=["??", "??"]),
+                RoundResultPlayerInfo(pid="p3", chips=0, payout=None, bet=None, change=None, hand=None,
+                                      hole_cards=None),
+            ],
+        ),
+    )
+
+
+MESSAGES = {
+    "state_broadcast": StateBroadcastMessage(
+        type="state_broadcast", game_id="g1", state=_state(),
+        holes={"p1": ["A♥", "9♣"], "p2": ["Q♦", "Q♣"], "p3": None}),
+    "state_update": _state("p1", hole_cards=("A♥", "9♣")),
+    "round_result": _round_result(),
+    "error": ErrorMessage(type="error", game_id="g1", player_id="p1", payload=ErrorPayload(message="차례가 아닙니다")),
+}
+
+
+@pytest.mark.parametrize("msg_type", MESSAGES)
+def test_round_trip_matches_model(msg_type):
+    original = MESSAGES[msg_type]
+    decoded = wire.decode(wire.encode(original.model_dump()))
+    assert type(original)(**decoded) == original
+
+
+_STATE_ARRAY = [
+    "flop", "p2", ["A♠", "K♥", "7♦"], 5, 10, 20,
+    [["p1", "SB", ["A♥", "9♣"], False, 990, 10, 12.5, None],
+     ["p2", "BB", ["??", "??"], False, 980, 20, 3.25, 9.75],
+     ["p3", "BTN", None, True, 0, None, None, None]],
+    7,
+]
+
+
+def test_state_update_layout():
+    # 배포된 클라이언트가 기대하는 필드 순서 - 모델 필드 순서가 바뀌면 깨진다
+    data = wire.encode(MESSAGES["state_update"].model_dump())
+    assert msgpack.unpackb(data) == [wire.STATE, "g1", "p1", _STATE_ARRAY]
+
+
+def test_state_broadcast_layout():
+    data = wire.encode(MESSAGES["state_broadcast"].model_dump())
+    public = [[*p[:2], ["??", "??"] if p[2] else None, *p[3:]] for p in _STATE_ARRAY[6]]
+    assert msgpack.unpackb(data) == [
+        wire.STATE_BROADCAST, "g1", [wire.STATE, "g1", "*", [*_STATE_ARRAY[:6], public, 7]],
+        {"p1": ["A♥", "9♣"], "p2": ["Q♦", "Q♣"], "p3": None},
+    ]
+
+
+def test_round_result_layout():
+    data = wire.encode(MESSAGES["round_result"].model_dump())
+    assert msgpack.unpackb(data) == [wire.ROUND_RESULT, "g1", "p1", [
+        ["A♠", "K♥", "7♦", "2♣", "T♠"],
+        [["p1", 1030, 60, 30, 30, "Pair", ["A♥", "9♣"]],
+         ["p2", 970, 0, 30, -30, "???", ["??", "??"]],
+         ["p3", 0, None, None, None, None, None]],
+    ]]
+
+
+def test_error_stays_keyed():
+    data = wire.encode(MESSAGES["error"].model_dump())
+    assert msgpack.unpackb(data) == MESSAGES["error"].model_dump()
+
+
+def test_encode_broadcast_matches_encode():
+    msg = MESSAGES["state_broadcast"].model_dump()
+    holes_groups = [{"p1": msg["holes"]["p1"]}, {"p2": msg["holes"]["p2"], "p3": None}]
+    for data, holes in zip(wire.encode_broadcast("g1", msg["state"], holes_groups), holes_groups):
+        assert data == wire.encode({**msg, "holes": holes})
+        assert StateBroadcastMessage(**wire.decode(data)) == StateBroadcastMessage(**{**msg, "holes": holes})
+
+
+def test_loads_accepts_json_and_msgpack():
+    msg = MESSAGES["error"]
+    assert ErrorMessage(**wire.loads(msg.model_dump_json())) == msg
+    assert ErrorMessage(**wire.loads(wire.encode(msg.model_dump()))) == msg
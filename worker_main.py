@@ -8,6 +8,8 @@ from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
 
+load_dotenv()  # servers 모듈이 import 시점에 읽는 설정(QUEUE_MODE, STEP_BATCH 등)보다 먼저
+
 from servers.worker import worker_main  # 실제 워커 메인 루프
 
 class Tee:
@@ -32,15 +34,15 @@ def spawn_worker(index: int, log_dir: Path):
     asyncio.run(worker_main(index))
 
 if __name__ == "__main__":
-    load_dotenv()
     num_workers = int(os.getenv("NUM_WORKERS", 1))
+    start_index = int(os.getenv("WORKER_START_INDEX", 0))  # 운영 중 워커 추가: 기존 인덱스 다음부터 띄운다
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = Path("servers/logs") / timestamp
     log_dir.mkdir(parents=True, exist_ok=True)
 
     processes = []
-    for i in range(num_workers):
+    for i in range(start_index, start_index + num_workers):
         p = Process(target=spawn_worker, args=(i, log_dir))
         p.start()
         processes.append(p)